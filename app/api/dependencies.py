@@ -1,9 +1,10 @@
 """Dependency injection functions for FastAPI routes"""
 
 from typing import Annotated
-from fastapi import Depends, Query
+from fastapi import Depends, HTTPException, Query
 from app.config import settings
 from app.config.settings import Settings
+from app.models.search import EntityKind
 
 
 # Common Query Parameter Dependencies
@@ -27,8 +28,18 @@ class SearchParams:
     def __init__(
         self,
         name: str | None = Query(None, description="Search by name (case-insensitive)"),
+        fuzzy: bool = Query(
+            False, description="Also match names within a small edit distance (typos)"
+        ),
+        q: str | None = Query(
+            None,
+            min_length=1,
+            description="Full-text search over descriptions and abilities, ranked by relevance",
+        ),
     ):
         self.name = name
+        self.fuzzy = fuzzy
+        self.q = q
 
 
 class ChallengeRatingParams:
@@ -47,6 +58,32 @@ class ChallengeRatingParams:
         self.max_cr = max_cr
 
 
+class MonsterMetricParams:
+    """Range filters on derived monster metrics"""
+
+    def __init__(
+        self,
+        min_dpr: float | None = Query(None, ge=0, description="Minimum expected damage per round"),
+        max_dpr: float | None = Query(None, ge=0, description="Maximum expected damage per round"),
+        min_effective_hp: int | None = Query(
+            None, ge=0, description="Minimum effective hit points"
+        ),
+        max_effective_hp: int | None = Query(
+            None, ge=0, description="Maximum effective hit points"
+        ),
+        min_offensive_cr: float | None = Query(None, ge=0, description="Minimum offensive CR"),
+        max_offensive_cr: float | None = Query(None, ge=0, description="Maximum offensive CR"),
+        min_defensive_cr: float | None = Query(None, ge=0, description="Minimum defensive CR"),
+        max_defensive_cr: float | None = Query(None, ge=0, description="Maximum defensive CR"),
+    ):
+        self.ranges = {
+            "expected_dpr": (min_dpr, max_dpr),
+            "effective_hit_points": (min_effective_hp, max_effective_hp),
+            "offensive_cr": (min_offensive_cr, max_offensive_cr),
+            "defensive_cr": (min_defensive_cr, max_defensive_cr),
+        }
+
+
 class CostRangeParams:
     """Cost range filter parameters"""
 
@@ -59,6 +96,32 @@ class CostRangeParams:
         self.max_cost = max_cost
 
 
+class EntityKindsParams:
+    """Comma-separated entity kinds filter (e.g. "monster,item")"""
+
+    def __init__(
+        self,
+        kinds: str | None = Query(
+            None,
+            description="Comma-separated kinds to include: monster, item, character (default: all)",
+        ),
+    ):
+        if kinds is None:
+            self.kinds = set(EntityKind)
+            return
+
+        try:
+            self.kinds = {
+                EntityKind(kind.strip().lower()) for kind in kinds.split(",") if kind.strip()
+            }
+        except ValueError:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Invalid kinds '{kinds}'. Valid kinds: "
+                + ", ".join(kind.value for kind in EntityKind),
+            )
+
+
 # Settings Dependency
 def get_settings() -> Settings:
     """Get application settings"""
@@ -69,5 +132,7 @@ def get_settings() -> Settings:
 CommonPagination = Annotated[PaginationParams, Depends(PaginationParams)]
 CommonSearch = Annotated[SearchParams, Depends(SearchParams)]
 CommonChallengeRating = Annotated[ChallengeRatingParams, Depends(ChallengeRatingParams)]
+CommonMonsterMetrics = Annotated[MonsterMetricParams, Depends(MonsterMetricParams)]
 CommonCostRange = Annotated[CostRangeParams, Depends(CostRangeParams)]
+CommonEntityKinds = Annotated[EntityKindsParams, Depends(EntityKindsParams)]
 CommonSettings = Annotated[Settings, Depends(get_settings)]
@@ -1,7 +1,17 @@
 """API v1 router aggregation"""
 
 from fastapi import APIRouter
-from app.api.v1 import characters, monsters, game_data, items, combat
+from app.api.v1 import (
+    characters,
+    monsters,
+    game_data,
+    items,
+    combat,
+    combat_sessions,
+    search,
+    encounters,
+    jobs,
+)
 
 # Create a main router for v1
 api_router = APIRouter()
@@ -12,3 +22,9 @@ api_router.include_router(monsters.router, prefix="/monsters", tags=["monsters"]
 api_router.include_router(game_data.router, tags=["game-data"])
 api_router.include_router(items.router, prefix="/items", tags=["items"])
 api_router.include_router(combat.router, prefix="/combat", tags=["combat"])
+api_router.include_router(
+    combat_sessions.router, prefix="/combat/sessions", tags=["combat-sessions"]
+)
+api_router.include_router(search.router, tags=["search"])
+api_router.include_router(encounters.router, prefix="/encounters", tags=["encounters"])
+api_router.include_router(jobs.router, prefix="/jobs", tags=["jobs"])
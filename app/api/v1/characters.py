@@ -1,9 +1,13 @@
 from fastapi import APIRouter, Query, HTTPException
 
-from app.models import CharactersResponse, Class, Race, Character
+from app.models import CharactersResponse, Class, Race, Character, EntityKind
 from app.services.data_loader import load_characters
-from app.services.character_service import generate_random_character
+from app.services.generated_store import get_generated_characters
+from app.services.character_service import MAX_RANDOM_CHARACTERS
+from app.services.name_index import build_name_predicate
+from app.services.random_pool import random_characters
 from app.services.query_utils import filter_records, paginate_records
+from app.services.search_index import get_character_search_index, search_records
 from app.api.dependencies import CommonSearch
 
 router = APIRouter()
@@ -26,6 +30,8 @@ def get_characters(
     - class: Character class (e.g., Fighter, Wizard, Cleric)
     - race: Character race (e.g., Human, Elf, Dwarf)
     - name: Search by name (partial match, case-insensitive)
+    - fuzzy: Also match names with typos when searching by name (true/false)
+    - q: Full-text search, results ranked by relevance (BM25)
     
     Pagination:
     - skip: Number of records to skip (default: 0)
@@ -39,11 +45,17 @@ def get_characters(
     if race:
         predicates.append(lambda character: character["race"] == race.value)
     if search.name:
-        name_filter = search.name.lower()
-        predicates.append(lambda character: name_filter in character["name"].lower())
+        predicates.append(
+            build_name_predicate(EntityKind.CHARACTER, search.name, search.fuzzy)
+        )
 
     filtered_characters = filter_records(characters, predicates)
-    paginated_characters, total = paginate_records(filtered_characters, skip, limit)
+    if search.q:
+        paginated_characters, total = search_records(
+            get_character_search_index(), filtered_characters, search.q, skip, limit
+        )
+    else:
+        paginated_characters, total = paginate_records(filtered_characters, skip, limit)
 
     return {
         "characters": paginated_characters,
@@ -53,18 +65,30 @@ def get_characters(
     }
 
 
-@router.get("/random", response_model=Character)
-def get_random_character():
+@router.get("/random", response_model=Character | list[Character])
+def get_random_character(
+    count: int | None = Query(
+        None,
+        ge=1,
+        le=MAX_RANDOM_CHARACTERS,
+        description="Generate this many characters and return them as a list",
+    ),
+):
     """
-    Generate a random D&D character.
+    Generate a random D&D character, or a list of them.
+
+    Optional:
+    - count: Number of characters (max 5,000)
 
     Returns:
     - A randomly generated character with:
       - Random race, class, and alignment
       - Random ability scores (4d6 drop lowest)
       - Generated name and description
+    - With count, a list of that many characters
     """
-    return generate_random_character()
+    characters = random_characters(count or 1)
+    return characters if count is not None else characters[0]
 
 
 @router.get("/{character_id}", response_model=Character)
@@ -72,12 +96,17 @@ def get_character_by_id(character_id: int):
     """
     Get a single character by ID.
 
+    Characters from /characters/random can be fetched for a while after
+    they were generated (GENERATED_STORE_TTL_SECONDS).
+
     Returns:
     - Character details if found
     - 404 error if character not found
     """
     characters = load_characters()
     character = next((c for c in characters if c["id"] == character_id), None)
+    if not character:
+        character = get_generated_characters().get(character_id)
 
     if not character:
         raise HTTPException(
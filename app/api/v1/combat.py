@@ -1,6 +1,8 @@
 """Combat calculator endpoints for attack rolls, damage, and saving throws"""
 
-from fastapi import APIRouter, Body
+from fastapi import APIRouter, Body, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import iterate_in_threadpool
 
 from app.models.combat import (
     AttackRollRequest,
@@ -11,13 +13,37 @@ from app.models.combat import (
     SavingThrowResponse,
     CombatCalculatorRequest,
     CombatCalculatorResponse,
+    CombatBatchRequest,
+    CombatBatchResponse,
+    AreaEffectRequest,
+    AreaEffectResponse,
+    CombatSimulationRequest,
+    CombatSimulationResponse,
+    CombatSimulationStreamRequest,
+    AttackProbabilityResponse,
+    SavingThrowProbabilityResponse,
+    DamageDistributionResponse,
+    CombatProbabilityResponse,
+    DiceCacheStatsResponse,
 )
+from app.services.area_effect_service import resolve_area_effect
 from app.services.combat_service import (
     calculate_attack_roll,
     calculate_damage_roll,
     calculate_saving_throw,
     calculate_full_combat,
+    resolve_combat_batch,
 )
+from app.services.probability_service import (
+    attack_probabilities,
+    saving_throw_probabilities,
+    damage_roll_distribution,
+    combat_distribution,
+    dice_cache_stats,
+)
+from app.services.encounter_simulation_service import find_monsters
+from app.services.simulation_service import simulate_combat, stream_combat_simulation
+from app.utils.formatters import format_sse_event
 
 router = APIRouter()
 
@@ -173,6 +199,290 @@ def calculate_combat(
     return calculate_full_combat(request)
 
 
+@router.post("/batch", response_model=CombatBatchResponse)
+def roll_batch(
+    request: CombatBatchRequest = Body(
+        ...,
+        examples=[
+            {
+                "requests": [
+                    {"type": "attack-roll", "attack_bonus": 5, "armor_class": 15},
+                    {
+                        "type": "damage-roll",
+                        "damage_dice": "2d6+3",
+                        "damage_type": "slashing",
+                    },
+                    {
+                        "type": "saving-throw",
+                        "ability_modifier": 2,
+                        "dc": 15,
+                        "advantage": "advantage",
+                    },
+                    {
+                        "type": "combat",
+                        "attack_bonus": 7,
+                        "armor_class": 18,
+                        "damage_dice": "1d8+5",
+                        "damage_type": "piercing",
+                    },
+                ]
+            }
+        ],
+    ),
+):
+    """
+    Resolve many attack rolls, damage rolls, saves and full combats in one call.
+
+    Each entry takes the same fields as its single-roll endpoint plus a
+    "type": "attack-roll", "damage-roll", "saving-throw", or "combat".
+    All dice for the batch are generated in bulk up front.
+
+    Parameters:
+    - requests: Up to 10,000 tagged entries
+
+    Returns:
+    - One result per entry, in request order, tagged with the same type
+    """
+    return {"results": resolve_combat_batch(request.requests)}
+
+
+@router.post("/area-effect", response_model=AreaEffectResponse)
+def area_effect(
+    request: AreaEffectRequest = Body(
+        ...,
+        examples=[
+            {
+                "dc": 15,
+                "ability": "dexterity",
+                "damage_dice": "8d6",
+                "damage_type": "fire",
+                "targets": [
+                    {"monster_id": 15},
+                    {"monster_id": 15, "name": "Alpha Wolf", "advantage": "advantage"},
+                    {"name": "Fighter", "save_modifier": 4, "resistances": ["fire"]},
+                ],
+            }
+        ],
+    ),
+):
+    """
+    Resolve a spell or breath weapon that many creatures save against.
+
+    The damage is rolled once; every target rolls its own save. A failed
+    save takes the full damage and a success half (or none if
+    half_on_success is false), then immunity, resistance and vulnerability
+    apply. Catalog monsters supply their save bonus and damage defenses.
+
+    Parameters:
+    - dc: Save DC
+    - ability: Ability used for the save
+    - damage_dice, damage_type: The shared damage roll
+    - half_on_success: Half damage on a successful save (default: true)
+    - targets: Up to 1,000 targets, each a monster_id and/or save_modifier,
+      with optional name, advantage, resistances, immunities and
+      vulnerabilities
+
+    Returns:
+    - The damage roll and each target's save and damage, in request order
+    - 404 error if any monster id is not in the catalog
+    """
+    monster_ids = [target.monster_id for target in request.targets if target.monster_id is not None]
+    monsters, missing = find_monsters(monster_ids)
+    if missing:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Monsters with ids {', '.join(map(str, missing))} not found",
+        )
+    return resolve_area_effect(request, monsters)
+
+
+@router.post("/simulate", response_model=CombatSimulationResponse)
+def simulate(
+    request: CombatSimulationRequest = Body(
+        ...,
+        examples=[
+            {
+                "attack_bonus": 5,
+                "armor_class": 15,
+                "damage_dice": "2d6+3",
+                "damage_type": "slashing",
+                "advantage": "normal",
+                "trials": 100000,
+            },
+            {
+                "attack_bonus": 7,
+                "armor_class": 18,
+                "damage_dice": "1d8+5",
+                "damage_type": "piercing",
+                "advantage": "advantage",
+                "trials": 1000000,
+                "seed": 42,
+            },
+        ],
+    ),
+):
+    """
+    Simulate many full combat turns and summarize the damage dealt.
+
+    Uses the same rules as POST /combat/combat (natural 20 crits double the
+    dice, natural 1 misses) but runs every trial as vectorized array math.
+
+    Parameters:
+    - Same fields as POST /combat/combat
+    - trials: Number of turns to simulate (default: 10,000, max: 5,000,000)
+    - seed: Optional random seed for reproducible results
+
+    Returns:
+    - Hit and crit rates, mean/std/percentiles of damage, and a histogram
+    """
+    return simulate_combat(request)
+
+
+@router.post("/simulate/stream", response_class=StreamingResponse)
+async def simulate_stream(
+    http_request: Request,
+    request: CombatSimulationStreamRequest = Body(
+        ...,
+        examples=[
+            {
+                "attack_bonus": 5,
+                "armor_class": 15,
+                "damage_dice": "2d6+3",
+                "damage_type": "slashing",
+                "trials": 1000000,
+                "chunk_trials": 20000,
+                "ci_half_width": 0.05,
+            }
+        ],
+    ),
+):
+    """
+    Stream a combat simulation as Server-Sent Events while it converges.
+
+    Sends an "estimate" event after every chunk of trials with the running
+    hit rate and mean damage, their 95% confidence intervals, and the
+    histogram bins that chunk added. A final "result" event carries the
+    same summary as POST /combat/simulate plus stopped_early. Work stops
+    when the client disconnects.
+
+    Parameters:
+    - Same fields as POST /combat/simulate
+    - chunk_trials: Trials per update (default: 10,000)
+    - ci_half_width: Stop once the mean-damage CI is within +/- this (optional)
+
+    Returns:
+    - text/event-stream of "estimate" events followed by one "result" event
+    """
+
+    async def events():
+        async for event, data in iterate_in_threadpool(stream_combat_simulation(request)):
+            if await http_request.is_disconnected():
+                break
+            yield format_sse_event(event, data)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/probability/attack-roll", response_model=AttackProbabilityResponse)
+def attack_roll_probability(
+    request: AttackRollRequest = Body(
+        ...,
+        examples=[{"attack_bonus": 5, "armor_class": 15, "advantage": "advantage"}],
+    ),
+):
+    """
+    Exact hit, critical hit and miss probabilities for an attack roll.
+
+    Takes the same fields as POST /combat/attack-roll but computes the
+    probabilities instead of rolling.
+    """
+    return attack_probabilities(request)
+
+
+@router.post(
+    "/probability/saving-throw", response_model=SavingThrowProbabilityResponse
+)
+def saving_throw_probability(
+    request: SavingThrowRequest = Body(
+        ...,
+        examples=[
+            {
+                "ability_modifier": 2,
+                "proficiency_bonus": 3,
+                "dc": 15,
+                "advantage": "disadvantage",
+            }
+        ],
+    ),
+):
+    """
+    Exact success probability for a saving throw.
+
+    Takes the same fields as POST /combat/saving-throw.
+    """
+    return saving_throw_probabilities(request)
+
+
+@router.post("/probability/damage-roll", response_model=DamageDistributionResponse)
+def damage_roll_probability(
+    request: DamageRollRequest = Body(
+        ...,
+        examples=[
+            {"damage_dice": "2d6+3", "damage_type": "slashing", "critical_hit": False}
+        ],
+    ),
+):
+    """
+    Exact damage distribution for a damage roll.
+
+    Takes the same fields as POST /combat/damage-roll. The distribution is
+    the discrete convolution of the dice, shifted by the modifier.
+
+    Returns:
+    - Min, max, mean, standard deviation and the full PMF/CDF
+    """
+    return damage_roll_distribution(request)
+
+
+@router.post("/probability/combat", response_model=CombatProbabilityResponse)
+def combat_probability(
+    request: CombatCalculatorRequest = Body(
+        ...,
+        examples=[
+            {
+                "attack_bonus": 5,
+                "armor_class": 15,
+                "damage_dice": "2d6+3",
+                "damage_type": "slashing",
+                "advantage": "normal",
+            }
+        ],
+    ),
+):
+    """
+    Exact attack outcome probabilities and damage-per-turn distribution.
+
+    Takes the same fields as POST /combat/combat. Damage mixes a miss (0),
+    a normal hit and a critical hit (dice doubled) by their probabilities.
+    """
+    return combat_distribution(request)
+
+
+@router.get("/dice-cache", response_model=DiceCacheStatsResponse)
+def dice_cache_statistics():
+    """
+    Hit ratio and occupancy of the dice notation and distribution caches.
+
+    The caches are warmed at startup with every damage expression in the
+    monster and item catalogs.
+    """
+    return dice_cache_stats()
+
+
 @router.get("")
 def combat_calculator_info():
     """
@@ -187,6 +497,16 @@ def combat_calculator_info():
             "POST /combat/damage-roll": "Roll damage dice with optional critical hit",
             "POST /combat/saving-throw": "Roll a saving throw against a DC",
             "POST /combat/combat": "Full combat calculation (attack + damage)",
+            "POST /combat/batch": "Resolve many rolls of any type in one request",
+            "POST /combat/area-effect": "One damage roll saved against by many targets",
+            "POST /combat/simulate": "Monte Carlo damage-per-round statistics",
+            "POST /combat/simulate/stream": "Converging simulation estimates as Server-Sent Events",
+            "POST /combat/probability/attack-roll": "Exact hit/crit/miss probabilities",
+            "POST /combat/probability/saving-throw": "Exact saving throw success probability",
+            "POST /combat/probability/damage-roll": "Exact damage distribution",
+            "POST /combat/probability/combat": "Exact damage-per-turn distribution",
+            "GET /combat/dice-cache": "Dice cache hit ratio and size",
+            "POST /combat/sessions": "Start a stateful session (initiative, HP, conditions)",
         },
         "features": [
             "Advantage/disadvantage support",
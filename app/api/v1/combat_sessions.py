@@ -0,0 +1,366 @@
+"""Stateful combat session endpoints (initiative, hit points, conditions)"""
+
+import asyncio
+import json
+
+from fastapi import APIRouter, Body, HTTPException, Response, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter, ValidationError
+
+from app.config import settings
+from app.models import (
+    CombatantState,
+    CombatSessionCreateRequest,
+    CombatSessionResponse,
+    SessionAttackRequest,
+    SessionAttackResponse,
+    SessionCommand,
+    SessionConditionsRequest,
+    SessionDamageRequest,
+    SessionDamageResponse,
+    SessionHealRequest,
+    SessionSavingThrowRequest,
+    SessionSavingThrowResponse,
+)
+from app.services.combat_session_service import (
+    CombatSession,
+    apply_damage,
+    attack,
+    command_slots,
+    create_session,
+    delete_session,
+    get_session,
+    heal,
+    next_turn,
+    run_command,
+    saving_throw,
+    session_state,
+    update_conditions,
+)
+from app.services.encounter_simulation_service import find_monsters
+from app.services.session_channel import Subscriber, get_session_channels
+
+router = APIRouter()
+
+command_adapter = TypeAdapter(SessionCommand)
+
+# Application close code (4000-4999) sent when a session is missing or expires
+SESSION_NOT_FOUND = 4404
+
+
+def _load_session(session_id: str, *slots: int | None) -> CombatSession:
+    """Fetch a session, raising 404 if it or any referenced slot is missing"""
+    session = get_session(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail=f"Session with id {session_id} not found")
+    for slot in slots:
+        if slot is not None and slot >= len(session):
+            raise HTTPException(
+                status_code=404, detail=f"Combatant slot {slot} not found in session"
+            )
+    return session
+
+
+def _broadcast(session: CombatSession, command: str, result: dict) -> dict:
+    """Send a REST action's result and the new state to the session's WebSocket clients"""
+    channels = get_session_channels()
+    if channels.has_subscribers(session.id):
+        channels.publish(
+            session.id,
+            {"command": command, "result": jsonable_encoder(result)},
+            jsonable_encoder(session_state(session)),
+        )
+    return result
+
+
+@router.post("", response_model=CombatSessionResponse, status_code=201)
+def start_session(
+    request: CombatSessionCreateRequest = Body(
+        ...,
+        examples=[
+            {
+                "combatants": [
+                    {"name": "Fighter", "hit_points": 44, "armor_class": 18, "initiative_bonus": 1},
+                    {"name": "Wizard", "hit_points": 27, "armor_class": 12, "initiative": 17},
+                    {"monster_id": 15},
+                    {"monster_id": 15, "name": "Goblin Boss"},
+                ]
+            }
+        ],
+    ),
+):
+    """
+    Start a combat session and roll initiative.
+
+    Combatants are catalog monsters (stats, damage resistances and
+    immunities copied from the stat block; any field can be overridden) or
+    custom stat lines. Sessions expire after a period without use.
+
+    Parameters:
+    - combatants: monster_id and/or name, hit_points, armor_class, plus
+      optional initiative_bonus, initiative, resistances, immunities and
+      vulnerabilities
+
+    Returns:
+    - The session with combatants in initiative order (slot 0 acts first)
+    - 404 error if any monster id is not in the catalog
+    """
+    monster_ids = [spec.monster_id for spec in request.combatants if spec.monster_id is not None]
+    monsters, missing = find_monsters(monster_ids)
+    if missing:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Monsters with ids {', '.join(map(str, missing))} not found",
+        )
+    return session_state(create_session(request, monsters))
+
+
+@router.get("/{session_id}", response_model=CombatSessionResponse)
+def get_combat_session(session_id: str):
+    """
+    Get a session's round, turn and combatant states.
+
+    Returns:
+    - The session
+    - 404 error if the session does not exist or has expired
+    """
+    return session_state(_load_session(session_id))
+
+
+@router.delete("/{session_id}", status_code=204)
+def end_session(session_id: str):
+    """
+    End a session and free its state.
+
+    Returns:
+    - 204 on success
+    - 404 error if the session does not exist or has expired
+    """
+    if not delete_session(session_id):
+        raise HTTPException(status_code=404, detail=f"Session with id {session_id} not found")
+    return Response(status_code=204)
+
+
+@router.post("/{session_id}/attack", response_model=SessionAttackResponse)
+def session_attack(
+    session_id: str,
+    request: SessionAttackRequest = Body(
+        ...,
+        examples=[
+            {
+                "attacker": 0,
+                "target": 2,
+                "attack_bonus": 7,
+                "damage_dice": "1d8+4",
+                "damage_type": "slashing",
+            }
+        ],
+    ),
+):
+    """
+    Attack a combatant: roll to hit against its AC and apply the damage.
+
+    Damage goes through the target's immunities, resistances and
+    vulnerabilities. Conditions on the target (prone, restrained, stunned,
+    ...) and attacker (poisoned, blinded, ...) grant advantage or
+    disadvantage; attacks are treated as melee.
+
+    Parameters:
+    - attacker: Attacking slot (optional)
+    - target: Target slot
+    - attack_bonus, damage_dice, damage_type, advantage: As for POST /combat/combat
+
+    Returns:
+    - The attack and damage rolls, damage applied, and the target's new state
+    - 404 error if the session or a slot does not exist
+    """
+    session = _load_session(session_id, request.attacker, request.target)
+    return _broadcast(session, "attack", attack(session, request))
+
+
+@router.post("/{session_id}/damage", response_model=SessionDamageResponse)
+def session_damage(
+    session_id: str,
+    request: SessionDamageRequest = Body(
+        ..., examples=[{"target": 2, "amount": 14, "damage_type": "fire"}]
+    ),
+):
+    """
+    Apply damage rolled at the table (e.g. a failed save) to a combatant.
+
+    Parameters:
+    - target: Target slot
+    - amount: Damage before resistances
+    - damage_type: Type of damage
+
+    Returns:
+    - Damage applied after defenses, and the target's new state
+    - 404 error if the session or slot does not exist
+    """
+    session = _load_session(session_id, request.target)
+    return _broadcast(session, "damage", apply_damage(session, request))
+
+
+@router.post("/{session_id}/saving-throw", response_model=SessionSavingThrowResponse)
+def session_saving_throw(
+    session_id: str,
+    request: SessionSavingThrowRequest = Body(
+        ...,
+        examples=[
+            {
+                "target": 0,
+                "ability_modifier": 2,
+                "proficiency_bonus": 3,
+                "dc": 15,
+                "damage": 24,
+                "damage_type": "fire",
+            }
+        ],
+    ),
+):
+    """
+    Roll a combatant's saving throw, optionally against damage.
+
+    A failed save takes the full damage; a success takes half (or none if
+    half_on_success is false). Damage goes through the combatant's defenses.
+
+    Parameters:
+    - target: Slot making the save
+    - ability_modifier, proficiency_bonus, dc, advantage: As for POST /combat/saving-throw
+    - damage, damage_type: Damage riding on the save (optional)
+    - half_on_success: Take half damage on a success (default: true)
+
+    Returns:
+    - The saving throw, damage applied, and the combatant's new state
+    - 404 error if the session or slot does not exist
+    """
+    session = _load_session(session_id, request.target)
+    return _broadcast(session, "saving-throw", saving_throw(session, request))
+
+
+@router.post("/{session_id}/heal", response_model=CombatantState)
+def session_heal(
+    session_id: str,
+    request: SessionHealRequest = Body(..., examples=[{"target": 0, "amount": 8}]),
+):
+    """
+    Restore a combatant's hit points (up to its maximum).
+
+    Returns:
+    - The combatant's new state
+    - 404 error if the session or slot does not exist
+    """
+    session = _load_session(session_id, request.target)
+    return _broadcast(session, "heal", heal(session, request))
+
+
+@router.post("/{session_id}/conditions", response_model=CombatantState)
+def session_conditions(
+    session_id: str,
+    request: SessionConditionsRequest = Body(
+        ..., examples=[{"target": 2, "add": ["prone"], "remove": ["grappled"]}]
+    ),
+):
+    """
+    Add or remove conditions on a combatant.
+
+    Returns:
+    - The combatant's new state
+    - 404 error if the session or slot does not exist
+    """
+    session = _load_session(session_id, request.target)
+    return _broadcast(session, "conditions", update_conditions(session, request))
+
+
+@router.post("/{session_id}/next-turn", response_model=CombatSessionResponse)
+def session_next_turn(session_id: str):
+    """
+    End the current turn; defeated combatants are skipped.
+
+    Returns:
+    - The session, with round and turn advanced
+    - 404 error if the session does not exist or has expired
+    """
+    session = _load_session(session_id)
+    return _broadcast(session, "next-turn", next_turn(session))
+
+
+async def _send_updates(websocket: WebSocket, subscriber: Subscriber) -> None:
+    """Drain a client's outbox; each send waits on the client, never on the session"""
+    try:
+        while True:
+            await websocket.send_json(await subscriber.next_message())
+    except (WebSocketDisconnect, RuntimeError):
+        pass  # Client went away; the receive loop cleans up
+
+
+def _command_error(detail, command: str | None = None) -> dict:
+    return {"command": command, "error": detail}
+
+
+@router.websocket("/{session_id}/ws")
+async def session_socket(websocket: WebSocket, session_id: str):
+    """
+    Live channel for a combat session.
+
+    Send commands as JSON objects tagged with a type: "attack", "damage",
+    "saving-throw", "heal", "conditions" or "next-turn", with the same
+    fields as the matching POST endpoint. Every connected client receives
+    "update" messages with the command results and the latest session state;
+    REST actions on the session are broadcast the same way. Updates that
+    pile up for a slow client are coalesced into one message (state is
+    always the newest; beyond COMBAT_SESSION_WS_MAX_PENDING results, the
+    oldest are dropped and counted in "dropped"). Invalid commands are
+    answered with an error result to the sender only.
+
+    The connection closes with code 4404 if the session does not exist or
+    expires.
+    """
+    await websocket.accept()
+    session = get_session(session_id)
+    if session is None:
+        await websocket.close(code=SESSION_NOT_FOUND, reason="Session not found")
+        return
+
+    channels = get_session_channels()
+    subscriber = channels.subscribe(session_id, settings.combat_session_ws_max_pending)
+    subscriber.push(None, jsonable_encoder(session_state(session)))
+    sender = asyncio.create_task(_send_updates(websocket, subscriber))
+    try:
+        while True:
+            try:
+                message = await websocket.receive_json()
+            except (json.JSONDecodeError, KeyError):  # KeyError: a binary frame has no text
+                subscriber.push(_command_error("Messages must be JSON objects"), None)
+                continue
+            try:
+                command = command_adapter.validate_python(message)
+            except ValidationError as exc:
+                detail = exc.errors(include_url=False, include_context=False)
+                subscriber.push(_command_error(jsonable_encoder(detail)), None)
+                continue
+
+            # Looking the session up again keeps it alive while players are active
+            session = get_session(session_id)
+            if session is None:
+                break
+            if any(slot >= len(session) for slot in command_slots(command)):
+                subscriber.push(
+                    _command_error("Combatant slot not found in session", command.type), None
+                )
+                continue
+
+            # Commands wait on the session's threading lock, so keep them off the loop
+            result, state = await run_in_threadpool(run_command, session, command)
+            channels.publish(
+                session_id,
+                {"command": command.type, "result": jsonable_encoder(result)},
+                jsonable_encoder(state),
+            )
+        await websocket.close(code=SESSION_NOT_FOUND, reason="Session expired")
+    except WebSocketDisconnect:
+        pass
+    finally:
+        channels.unsubscribe(session_id, subscriber)
+        sender.cancel()
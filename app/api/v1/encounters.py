@@ -0,0 +1,113 @@
+"""Encounter building endpoints"""
+
+from fastapi import APIRouter, Body, HTTPException
+
+from app.models import (
+    EncounterBuildRequest,
+    EncounterBuildResponse,
+    EncounterSimulationRequest,
+    EncounterSimulationResponse,
+)
+from app.services.encounter_service import build_encounters
+from app.services.encounter_simulation_service import find_monsters, simulate_encounter
+
+router = APIRouter()
+
+
+@router.post("/build", response_model=EncounterBuildResponse)
+def build_encounter(
+    request: EncounterBuildRequest = Body(
+        ...,
+        examples=[
+            {"party_levels": [3, 3, 4, 4], "difficulty": "hard"},
+            {
+                "party_levels": [5],
+                "party_size": 5,
+                "difficulty": "medium",
+                "monster_type": "Undead",
+                "max_monsters": 6,
+            },
+        ],
+    ),
+):
+    """
+    Build encounters from the monster catalog that hit an XP budget.
+
+    Uses the DMG encounter-building rules: party XP thresholds by level and
+    the group-size multiplier (shifted for parties under 3 or over 5).
+
+    Parameters:
+    - party_levels: Level of each character, or one level plus party_size
+    - party_size: Number of characters (optional)
+    - difficulty: "easy", "medium", "hard", or "deadly"
+    - monster_type, size, min_cr, max_cr: Optional monster filters
+    - max_monsters: Maximum monsters per encounter (default: 8)
+    - suggestions: Number of encounters to suggest (default: 3)
+
+    Returns:
+    - Party thresholds, the target adjusted-XP window, and suggested encounters
+    """
+    return build_encounters(request)
+
+
+@router.post("/simulate", response_model=EncounterSimulationResponse)
+def simulate_encounter_fights(
+    request: EncounterSimulationRequest = Body(
+        ...,
+        examples=[
+            {
+                "party": [
+                    {
+                        "name": "Fighter",
+                        "hit_points": 44,
+                        "armor_class": 18,
+                        "attack_bonus": 7,
+                        "damage_dice": "1d8+4",
+                        "attacks": 2,
+                        "save_bonuses": {"strength": 7, "constitution": 6},
+                    },
+                    {
+                        "name": "Wizard",
+                        "hit_points": 27,
+                        "armor_class": 12,
+                        "attack_bonus": 7,
+                        "damage_dice": "2d10",
+                        "damage_type": "fire",
+                        "save_bonuses": {"intelligence": 7, "wisdom": 5},
+                    },
+                ],
+                "monster_ids": [4, 15, 15],
+                "trials": 10000,
+            }
+        ],
+    ),
+):
+    """
+    Simulate a party fighting catalog monsters to the end, many times over.
+
+    Every fight rolls initiative, then each standing combatant acts in turn
+    order: attackers pick a random standing enemy and roll to hit (natural
+    20 crits, natural 1 misses). Monsters use their best attack action and
+    Multiattack count; damaging actions without an attack bonus are
+    save-for-half area effects that recharge on 5-6. Monster damage
+    resistances, immunities and vulnerabilities apply.
+
+    Parameters:
+    - party: Hit points, AC, attack bonus, damage dice, attacks and save bonuses
+    - monster_ids: Catalog monster ids (repeat for several of one monster)
+    - trials: Fights to simulate (default: 10000)
+    - max_rounds: Round limit per fight (default: 50)
+    - seed: Optional seed for reproducible results
+
+    Returns:
+    - Win probabilities, expected rounds, party HP remaining distribution
+      and per-combatant survival
+    - 404 error if any monster id is not in the catalog
+    """
+    monsters, missing = find_monsters(request.monster_ids)
+    if missing:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Monsters with ids {', '.join(map(str, missing))} not found",
+        )
+    return simulate_encounter(request, monsters)
@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Query, HTTPException
 
-from app.models import ItemsResponse, Item, ItemType, Rarity
+from app.models import ItemsResponse, Item, ItemType, Rarity, EntityKind
 from app.services.data_loader import load_items
+from app.services.name_index import build_name_predicate
 from app.services.query_utils import filter_records, paginate_records
+from app.services.search_index import get_item_search_index, search_records
 from app.api.dependencies import CommonSearch, CommonCostRange
 
 router = APIRouter()
@@ -34,6 +36,8 @@ def get_items(
     - min_cost: Minimum cost in gold pieces
     - max_cost: Maximum cost in gold pieces
     - name: Search by name (partial match, case-insensitive)
+    - fuzzy: Also match names with typos when searching by name (true/false)
+    - q: Full-text search, results ranked by relevance (BM25)
 
     Pagination:
     - skip: Number of records to skip (default: 0)
@@ -57,11 +61,17 @@ def get_items(
     if cost_range.max_cost is not None:
         predicates.append(lambda item: item["cost"] <= cost_range.max_cost)
     if search.name:
-        name_filter = search.name.lower()
-        predicates.append(lambda item: name_filter in item["name"].lower())
+        predicates.append(
+            build_name_predicate(EntityKind.ITEM, search.name, search.fuzzy)
+        )
 
     filtered_items = filter_records(items, predicates)
-    paginated_items, total = paginate_records(filtered_items, skip, limit)
+    if search.q:
+        paginated_items, total = search_records(
+            get_item_search_index(), filtered_items, search.q, skip, limit
+        )
+    else:
+        paginated_items, total = paginate_records(filtered_items, skip, limit)
 
     return {
         "items": paginated_items,
@@ -0,0 +1,111 @@
+"""Background job endpoints for long-running simulations"""
+
+from fastapi import APIRouter, Body, HTTPException
+
+from app.models import JobKind, JobResponse, JobSubmitRequest
+from app.services.encounter_simulation_service import find_monsters
+from app.services.job_service import JobQueueFull, get_job_manager
+
+router = APIRouter()
+
+
+@router.post("", response_model=JobResponse, status_code=202)
+def submit_job(
+    job: JobSubmitRequest = Body(
+        ...,
+        examples=[
+            {
+                "kind": "combat-simulation",
+                "request": {
+                    "attack_bonus": 7,
+                    "armor_class": 16,
+                    "damage_dice": "2d6+4",
+                    "damage_type": "slashing",
+                    "trials": 5000000,
+                },
+            },
+            {
+                "kind": "encounter-simulation",
+                "request": {
+                    "party": [
+                        {
+                            "name": "Fighter",
+                            "hit_points": 44,
+                            "armor_class": 18,
+                            "attack_bonus": 7,
+                            "damage_dice": "1d8+4",
+                            "attacks": 2,
+                        }
+                    ],
+                    "monster_ids": [15, 15],
+                    "trials": 100000,
+                },
+            },
+        ],
+    ),
+):
+    """
+    Queue a simulation to run in the background and return its job id.
+
+    Poll GET /jobs/{job_id} for progress and the result. Finished jobs are
+    kept for JOB_RESULT_TTL_SECONDS.
+
+    Parameters:
+    - kind: "combat-simulation" or "encounter-simulation"
+    - request: Body of POST /combat/simulate or POST /encounters/simulate
+
+    Returns:
+    - The queued job (202)
+    - 404 error if an encounter references monster ids not in the catalog
+    - 503 error if the job queue is full
+    """
+    if job.kind == JobKind.ENCOUNTER_SIMULATION:
+        _, missing = find_monsters(job.request.monster_ids)
+        if missing:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Monsters with ids {', '.join(map(str, missing))} not found",
+            )
+    try:
+        return get_job_manager().submit(job.kind, job.request).to_dict()
+    except JobQueueFull as exc:
+        raise HTTPException(status_code=503, detail=str(exc))
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+def get_job(job_id: str):
+    """
+    Get a job's status, progress and (once succeeded) result.
+
+    Parameters:
+    - job_id: Id returned when the job was submitted
+
+    Returns:
+    - The job
+    - 404 error if the job does not exist or has expired
+    """
+    job = get_job_manager().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job with id {job_id} not found")
+    return job.to_dict()
+
+
+@router.delete("/{job_id}", response_model=JobResponse)
+def cancel_job(job_id: str):
+    """
+    Cancel a job.
+
+    Queued jobs are cancelled immediately; running jobs stop at their next
+    progress update. Finished jobs are returned unchanged.
+
+    Parameters:
+    - job_id: Id returned when the job was submitted
+
+    Returns:
+    - The job after the cancellation request
+    - 404 error if the job does not exist or has expired
+    """
+    job = get_job_manager().cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job with id {job_id} not found")
+    return job.to_dict()
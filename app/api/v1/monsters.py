@@ -1,10 +1,28 @@
 from fastapi import APIRouter, Query, HTTPException
 
-from app.models import MonstersResponse, MonsterType, Size, Monster
+from app.models import (
+    MonstersResponse,
+    MonsterType,
+    Size,
+    Monster,
+    MonsterSortField,
+    EntityKind,
+    SimilarMonstersResponse,
+)
 from app.services.data_loader import load_monsters
-from app.services.monster_service import generate_random_monster
+from app.services.generated_store import get_generated_monsters
+from app.services.monster_metrics import (
+    metric_range_predicates,
+    sort_monsters,
+    with_metrics,
+)
+from app.services.monster_service import MAX_RANDOM_MONSTERS
+from app.services.name_index import build_name_predicate
+from app.services.random_pool import random_monsters
 from app.services.query_utils import filter_records, paginate_records
-from app.api.dependencies import CommonSearch, CommonChallengeRating
+from app.services.similarity_service import find_similar_monsters
+from app.services.search_index import get_monster_search_index, search_records
+from app.api.dependencies import CommonSearch, CommonChallengeRating, CommonMonsterMetrics
 
 router = APIRouter()
 
@@ -13,22 +31,41 @@ router = APIRouter()
 def get_monsters(
     search: CommonSearch,
     cr_params: CommonChallengeRating,
+    metric_params: CommonMonsterMetrics,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(
         10, ge=1, le=100, description="Maximum number of records to return"
     ),
     type: MonsterType | None = Query(None, description="Filter by monster type"),
     size: Size | None = Query(None, description="Filter by monster size"),
+    sort_by: MonsterSortField | None = Query(
+        None, description="Sort by a stat block or metric field (overrides relevance)"
+    ),
+    descending: bool = Query(False, description="Sort in descending order"),
 ):
     """
     Return all D&D monsters with optional filtering and pagination.
 
+    Each monster includes precomputed threat metrics: expected damage per
+    round, attack hit chances against AC 12/15/18, effective hit points,
+    and the DMG offensive, defensive and calculated CR.
+
     Filters:
     - type: Monster type (e.g., Dragon, Beast, Humanoid)
     - size: Monster size (e.g., Tiny, Small, Medium, Large, Huge, Gargantuan)
     - min_cr: Minimum challenge rating
     - max_cr: Maximum challenge rating
     - name: Search by name (partial match, case-insensitive)
+    - fuzzy: Also match names with typos when searching by name (true/false)
+    - q: Full-text search, results ranked by relevance (BM25)
+    - min_dpr/max_dpr, min_effective_hp/max_effective_hp,
+      min_offensive_cr/max_offensive_cr, min_defensive_cr/max_defensive_cr:
+      Metric ranges
+
+    Sorting:
+    - sort_by: name, challenge_rating, armor_class, hit_points or any metric;
+      monsters without the metric (e.g. no attack action) come last
+    - descending: Reverse the order (default: false)
 
     Pagination:
     - skip: Number of records to skip (default: 0)
@@ -50,34 +87,54 @@ def get_monsters(
             lambda monster: monster["challenge_rating"] <= cr_params.max_cr
         )
     if search.name:
-        name_filter = search.name.lower()
-        predicates.append(lambda monster: name_filter in monster["name"].lower())
+        predicates.append(
+            build_name_predicate(EntityKind.MONSTER, search.name, search.fuzzy)
+        )
+    predicates.extend(metric_range_predicates(metric_params.ranges))
 
     filtered_monsters = filter_records(monsters, predicates)
-    paginated_monsters, total = paginate_records(filtered_monsters, skip, limit)
+    if search.q and sort_by is None:
+        paginated_monsters, total = search_records(
+            get_monster_search_index(), filtered_monsters, search.q, skip, limit
+        )
+    else:
+        if search.q:
+            filtered_monsters, _ = search_records(
+                get_monster_search_index(), filtered_monsters, search.q, 0, len(filtered_monsters)
+            )
+        if sort_by:
+            filtered_monsters = sort_monsters(filtered_monsters, sort_by.value, descending)
+        paginated_monsters, total = paginate_records(filtered_monsters, skip, limit)
 
     return {
-        "monsters": paginated_monsters,
+        "monsters": [with_metrics(monster) for monster in paginated_monsters],
         "total": total,
         "skip": skip,
         "limit": limit,
     }
 
 
-@router.get("/random", response_model=Monster)
+@router.get("/random", response_model=Monster | list[Monster])
 def get_random_monster(
     cr_params: CommonChallengeRating,
     type: MonsterType | None = Query(None, description="Filter by monster type"),
     size: Size | None = Query(None, description="Filter by monster size"),
+    count: int | None = Query(
+        None,
+        ge=1,
+        le=MAX_RANDOM_MONSTERS,
+        description="Generate this many monsters and return them as a list",
+    ),
 ):
     """
-    Generate a random D&D monster.
+    Generate a random D&D monster, or a list of them.
 
     Optional Filters:
     - type: Monster type (e.g., Dragon, Beast, Humanoid)
     - size: Monster size (e.g., Tiny, Small, Medium, Large)
     - min_cr: Minimum challenge rating
     - max_cr: Maximum challenge rating
+    - count: Number of monsters (max 500); each is drawn independently
 
     Returns:
     - A randomly generated monster with:
@@ -85,10 +142,16 @@ def get_random_monster(
       - Challenge rating within specified range
       - Appropriate stats, HP, AC, and actions for its CR
       - Random alignment and abilities
+    - With count, a list of that many monsters
     """
-    return generate_random_monster(
-        monster_type=type, size=size, min_cr=cr_params.min_cr, max_cr=cr_params.max_cr
+    monsters = random_monsters(
+        count or 1,
+        monster_type=type,
+        size=size,
+        min_cr=cr_params.min_cr,
+        max_cr=cr_params.max_cr,
     )
+    return monsters if count is not None else monsters[0]
 
 
 @router.get("/{monster_id}", response_model=Monster)
@@ -96,16 +159,67 @@ def get_monster_by_id(monster_id: int):
     """
     Get a single monster by ID.
 
+    Monsters from /monsters/random can be fetched for a while after they
+    were generated (GENERATED_STORE_TTL_SECONDS); they carry no metrics.
+
     Returns:
     - Monster details if found
     - 404 error if monster not found
     """
     monsters = load_monsters()
     monster = next((m for m in monsters if m["id"] == monster_id), None)
+    if monster:
+        return with_metrics(monster)
+
+    generated = get_generated_monsters().get(monster_id)
+    if generated is None:
+        raise HTTPException(
+            status_code=404, detail=f"Monster with id {monster_id} not found"
+        )
+
+    return generated
+
+
+@router.get("/{monster_id}/similar", response_model=SimilarMonstersResponse)
+def get_similar_monsters(
+    monster_id: int,
+    cr_params: CommonChallengeRating,
+    k: int = Query(10, ge=1, le=50, description="Number of similar monsters to return"),
+    type: MonsterType | None = Query(None, description="Filter by monster type"),
+):
+    """
+    Find catalog monsters with stat blocks most like the given monster.
+
+    Similarity compares normalized ability scores, AC, HP, CR, speeds, and
+    damage resistances/immunities. Filters are applied before ranking, so
+    "like the Owlbear but a bit weaker" is a max_cr below the Owlbear's.
+
+    Optional Filters:
+    - type: Monster type (e.g., Dragon, Beast, Humanoid)
+    - min_cr: Minimum challenge rating
+    - max_cr: Maximum challenge rating
+
+    Returns:
+    - Up to k monsters with their distance, closest first
+    - 404 error if monster not found
+    """
+    similar = find_similar_monsters(
+        monster_id,
+        k,
+        monster_type=type.value if type else None,
+        min_cr=cr_params.min_cr,
+        max_cr=cr_params.max_cr,
+    )
 
-    if not monster:
+    if similar is None:
         raise HTTPException(
             status_code=404, detail=f"Monster with id {monster_id} not found"
         )
 
-    return monster
+    return {
+        "monster_id": monster_id,
+        "similar": [
+            {"distance": round(distance, 4), "monster": monster}
+            for monster, distance in similar
+        ],
+    }
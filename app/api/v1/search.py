@@ -0,0 +1,91 @@
+"""Cross-catalog search endpoints"""
+
+from fastapi import APIRouter, Query
+
+from app.config import settings
+from app.models import AutocompleteOrder, AutocompleteResponse, NameSearchResponse
+from app.services.autocomplete import autocomplete
+from app.services.name_index import default_max_distance, find_similar_names
+from app.api.dependencies import CommonEntityKinds
+
+router = APIRouter()
+
+
+@router.get("/search/names", response_model=NameSearchResponse)
+def search_names(
+    kinds: CommonEntityKinds,
+    q: str = Query(..., min_length=1, description="Name to look up (typos allowed)"),
+    max_distance: int | None = Query(
+        None, ge=0, le=3, description="Maximum edit distance (default scales with length)"
+    ),
+    limit: int = Query(10, ge=1, le=100, description="Maximum number of matches to return"),
+):
+    """
+    Look up monsters, items and characters by name, tolerating typos.
+
+    Matches the full name or any longer word in it, so "Beholdr" finds
+    "Beholder" and "dragn" finds every dragon.
+
+    Parameters:
+    - q: Name to look up
+    - max_distance: Maximum edit distance (default: 1 for short queries, 2 otherwise)
+    - kinds: Comma-separated kinds to include (monster, item, character)
+    - limit: Maximum matches to return (default: 10, max: 100)
+
+    Returns:
+    - Matches ordered by edit distance, then name
+    """
+    if max_distance is None:
+        max_distance = default_max_distance(q.lower().strip())
+
+    matches = find_similar_names(q, max_distance, kinds.kinds)[:limit]
+
+    return {
+        "query": q,
+        "max_distance": max_distance,
+        "matches": [
+            {"kind": kind, "id": entity_id, "name": name, "distance": distance}
+            for (kind, entity_id, name), distance in matches
+        ],
+    }
+
+
+@router.get("/autocomplete", response_model=AutocompleteResponse)
+def autocomplete_names(
+    kinds: CommonEntityKinds,
+    prefix: str = Query(..., min_length=1, description="Text typed so far"),
+    order: AutocompleteOrder = Query(
+        AutocompleteOrder.CHALLENGE, description="Ranking: cr (strongest first) or name"
+    ),
+    limit: int = Query(
+        10,
+        ge=1,
+        le=settings.autocomplete_max_results,
+        description="Maximum number of suggestions to return",
+    ),
+):
+    """
+    Complete a typed prefix against monster, item and character names.
+
+    The prefix matches the start of any word, so "adu" and "red d" both
+    complete to "Adult Red Dragon".
+
+    Parameters:
+    - prefix: Text typed so far (case-insensitive)
+    - kinds: Comma-separated kinds to include (monster, item, character)
+    - order: "cr" ranks monsters by challenge rating and items by rarity; "name" is alphabetical
+    - limit: Maximum suggestions to return (default: 10)
+
+    Returns:
+    - Suggestions, best first
+    """
+    suggestions = autocomplete(prefix, kinds.kinds, order, limit)
+
+    return {
+        "prefix": prefix,
+        "order": order,
+        "suggestions": [
+            {"kind": kind, "id": entity_id, "name": name}
+            for kind, entity_id, name in suggestions
+        ],
+    }
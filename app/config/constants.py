@@ -92,3 +92,75 @@ LEGENDARY_ACTION_MIN_CR = 10
 
 # Special abilities threshold
 SPECIAL_ABILITIES_MIN_CR = 2
+
+# XP thresholds per character by level (easy, medium, hard, deadly)
+XP_THRESHOLDS_BY_LEVEL = {
+    1: (25, 50, 75, 100),
+    2: (50, 100, 150, 200),
+    3: (75, 150, 225, 400),
+    4: (125, 250, 375, 500),
+    5: (250, 500, 750, 1100),
+    6: (300, 600, 900, 1400),
+    7: (350, 750, 1100, 1700),
+    8: (450, 900, 1400, 2100),
+    9: (550, 1100, 1600, 2400),
+    10: (600, 1200, 1900, 2800),
+    11: (800, 1600, 2400, 3600),
+    12: (1000, 2000, 3000, 4500),
+    13: (1100, 2200, 3400, 5100),
+    14: (1250, 2500, 3800, 5700),
+    15: (1400, 2800, 4300, 6400),
+    16: (1600, 3200, 4800, 7200),
+    17: (2000, 3900, 5900, 8800),
+    18: (2100, 4200, 6300, 9500),
+    19: (2400, 4900, 7300, 10900),
+    20: (2800, 5700, 8500, 12700),
+}
+
+# Encounter XP multipliers: (minimum number of monsters, multiplier)
+ENCOUNTER_MULTIPLIERS = [(1, 1.0), (2, 1.5), (3, 2.0), (7, 2.5), (11, 3.0), (15, 4.0)]
+
+# Multiplier steps used to shift for small (<3) and large (6+) parties
+ENCOUNTER_MULTIPLIER_STEPS = [0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 4.0, 5.0]
+
+# DMG "Monster Statistics by Challenge Rating":
+# (CR, armor class, max hit points, attack bonus, max damage per round, save DC)
+MONSTER_STATS_BY_CR = [
+    (0, 13, 6, 3, 1, 13),
+    (0.125, 13, 35, 3, 3, 13),
+    (0.25, 13, 49, 3, 5, 13),
+    (0.5, 13, 70, 3, 8, 13),
+    (1, 13, 85, 3, 14, 13),
+    (2, 13, 100, 3, 20, 13),
+    (3, 13, 115, 4, 26, 13),
+    (4, 14, 130, 5, 32, 14),
+    (5, 15, 145, 6, 38, 15),
+    (6, 15, 160, 6, 44, 15),
+    (7, 15, 175, 6, 50, 15),
+    (8, 16, 190, 7, 56, 16),
+    (9, 16, 205, 7, 62, 16),
+    (10, 17, 220, 7, 68, 16),
+    (11, 17, 235, 8, 74, 17),
+    (12, 17, 250, 8, 80, 17),
+    (13, 18, 265, 8, 86, 18),
+    (14, 18, 280, 8, 92, 18),
+    (15, 18, 295, 8, 98, 18),
+    (16, 18, 310, 9, 104, 18),
+    (17, 19, 325, 10, 110, 19),
+    (18, 19, 340, 10, 116, 19),
+    (19, 19, 355, 10, 122, 19),
+    (20, 19, 400, 10, 140, 19),
+    (21, 19, 445, 11, 158, 20),
+    (22, 19, 490, 11, 176, 20),
+    (23, 19, 535, 11, 194, 20),
+    (24, 19, 580, 12, 212, 21),
+    (25, 19, 625, 12, 230, 21),
+    (26, 19, 670, 12, 248, 21),
+    (27, 19, 715, 13, 266, 22),
+    (28, 19, 760, 13, 284, 22),
+    (29, 19, 805, 13, 302, 22),
+    (30, 19, 850, 14, 320, 23),
+]
+
+# DMG effective hit point multipliers: (max CR, resistances, immunities)
+EFFECTIVE_HP_MULTIPLIERS = [(4, 2.0, 2.0), (10, 1.5, 2.0), (16, 1.25, 1.5), (30, 1.0, 1.25)]
@@ -1,6 +1,7 @@
 """Application settings and environment configuration"""
 
 from functools import lru_cache
+from typing import Literal
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
@@ -14,6 +15,39 @@ class Settings(BaseSettings):
     # API Settings
     api_version: str = "v1"
 
+    # Search Settings
+    autocomplete_max_results: int = 25  # Completions precomputed per trie node
+
+    # Dice Settings
+    dice_cache_size: int = 512  # Parsed expressions / distributions kept in memory
+    rng_seed: int | None = None  # Fix for reproducible rolls (per-thread streams derive from it)
+
+    # Simulation Settings
+    simulation_executor: Literal["process", "inline"] = "process"
+    simulation_workers: int = 0  # 0 uses every CPU
+    simulation_parallel_min_trials: int = 500_000  # Smaller runs stay in-process
+
+    # Combat Session Settings
+    combat_session_max_entries: int = 10_000  # Least recently used sessions are evicted first
+    combat_session_ttl_seconds: int = 4 * 3600  # Idle time before a session expires
+    combat_session_ws_max_pending: int = 100  # Results buffered per slow WebSocket client
+
+    # Job Settings
+    job_workers: int = 2  # Threads running queued simulation jobs
+    job_queue_size: int = 100  # Submissions beyond this are rejected with 503
+    job_result_ttl_seconds: int = 3600  # Finished jobs are kept this long
+    job_store_max_entries: int = 1000
+
+    # Random Generation Pool Settings (off by default: Lambda freezes background threads)
+    random_pool_enabled: bool = False  # Serve /random endpoints from pre-generated stock
+    random_pool_size: int = 500  # Objects stocked per parameter combination
+    random_pool_low_water: int = 100  # Refill a stock once it drops below this
+    random_pool_max_keys: int = 32  # Combinations stocked; others are generated on demand
+
+    # Generated Entity Settings
+    generated_store_max_entries: int = 10_000  # Per kind; least recently generated evicted first
+    generated_store_ttl_seconds: int = 3600  # How long /{id} can fetch a generated entity
+
     # AWS Settings (for Lambda deployment)
     aws_region: str = "us-east-1"
 
@@ -1,14 +1,37 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1 import api_router as api_v1_router
 from app.config import settings
 from app.config.settings import get_cors_origins
+from app.services.executor import shutdown_executor
+from app.services.job_service import shutdown_job_manager
+from app.services.monster_metrics import get_monster_metrics
+from app.services.random_pool import get_random_pool, shutdown_random_pool
+from app.services.probability_service import warm_dice_cache
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Parse and convolve catalog damage dice once, before the first request
+    warm_dice_cache()
+    # Derive the monster metrics table once, so listings sort and filter on it
+    get_monster_metrics()
+    # Start stocking random monsters and characters (when RANDOM_POOL_ENABLED)
+    get_random_pool()
+    yield
+    shutdown_random_pool()
+    shutdown_job_manager()
+    shutdown_executor()
+
 
 app = FastAPI(
     title=settings.app_name,
     version=settings.api_version,
     debug=settings.debug,
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -2,8 +2,9 @@
 
 from .common import Alignment, Size, Stats
 from .character import Class, Race, Character
-from .monster import MonsterType, DamageType, Action, Monster
+from .monster import MonsterType, DamageType, Action, MonsterMetrics, MonsterSortField, Monster
 from .item import ItemType, Rarity, Item
+from .search import EntityKind, NameMatch, AutocompleteOrder, AutocompleteSuggestion
 from .combat import (
     AdvantageType,
     SavingThrowAbility,
@@ -15,13 +16,85 @@ from .combat import (
     SavingThrowResponse,
     CombatCalculatorRequest,
     CombatCalculatorResponse,
+    BatchAttackRollRequest,
+    BatchDamageRollRequest,
+    BatchSavingThrowRequest,
+    BatchCombatRequest,
+    BatchAttackRollResponse,
+    BatchDamageRollResponse,
+    BatchSavingThrowResponse,
+    BatchCombatResponse,
+    CombatBatchRequest,
+    CombatBatchResponse,
+    AreaEffectTarget,
+    AreaEffectRequest,
+    AreaEffectTargetResult,
+    AreaEffectResponse,
+    CombatSimulationRequest,
+    CombatSimulationStreamRequest,
+    HistogramBin,
+    CombatSimulationResponse,
+    AttackProbabilityResponse,
+    SavingThrowProbabilityResponse,
+    ProbabilityPoint,
+    DamageDistributionResponse,
+    CombatProbabilityResponse,
+    CacheStats,
+    DiceCacheStatsResponse,
+)
+from .combat_session import (
+    Condition,
+    CombatantSpec,
+    CombatSessionCreateRequest,
+    CombatantState,
+    CombatSessionResponse,
+    SessionAttackRequest,
+    SessionDamageRequest,
+    SessionHealRequest,
+    SessionConditionsRequest,
+    DamageApplied,
+    SessionAttackResponse,
+    SessionDamageResponse,
+    SessionSavingThrowRequest,
+    SessionSavingThrowResponse,
+    SessionAttackCommand,
+    SessionDamageCommand,
+    SessionSavingThrowCommand,
+    SessionHealCommand,
+    SessionConditionsCommand,
+    SessionNextTurnCommand,
+    SessionCommand,
+)
+from .encounter import (
+    EncounterDifficulty,
+    EncounterBuildRequest,
+    EncounterMonster,
+    Encounter,
+    EncounterBuildResponse,
+    PartyMember,
+    EncounterSimulationRequest,
+    CombatantOutcome,
+    HitPointsBin,
+    EncounterSimulationResponse,
+)
+from .job import (
+    JobKind,
+    JobStatus,
+    CombatSimulationJobRequest,
+    EncounterSimulationJobRequest,
+    JobSubmitRequest,
+    JobResponse,
 )
 from .responses import (
     CharactersResponse,
     ClassResponse,
     RaceResponse,
     MonstersResponse,
+    SimilarMonster,
+    SimilarMonstersResponse,
     ItemsResponse,
+    NameSearchResponse,
+    AutocompleteResponse,
 )
 
 __all__ = [
@@ -37,11 +110,18 @@ __all__ = [
     "MonsterType",
     "DamageType",
     "Action",
+    "MonsterMetrics",
+    "MonsterSortField",
     "Monster",
     # Item
     "ItemType",
     "Rarity",
     "Item",
+    # Search
+    "EntityKind",
+    "NameMatch",
+    "AutocompleteOrder",
+    "AutocompleteSuggestion",
     # Combat
     "AdvantageType",
     "SavingThrowAbility",
@@ -53,10 +133,79 @@ __all__ = [
     "SavingThrowResponse",
     "CombatCalculatorRequest",
     "CombatCalculatorResponse",
+    "BatchAttackRollRequest",
+    "BatchDamageRollRequest",
+    "BatchSavingThrowRequest",
+    "BatchCombatRequest",
+    "BatchAttackRollResponse",
+    "BatchDamageRollResponse",
+    "BatchSavingThrowResponse",
+    "BatchCombatResponse",
+    "CombatBatchRequest",
+    "CombatBatchResponse",
+    "AreaEffectTarget",
+    "AreaEffectRequest",
+    "AreaEffectTargetResult",
+    "AreaEffectResponse",
+    "CombatSimulationRequest",
+    "CombatSimulationStreamRequest",
+    "HistogramBin",
+    "CombatSimulationResponse",
+    "AttackProbabilityResponse",
+    "SavingThrowProbabilityResponse",
+    "ProbabilityPoint",
+    "DamageDistributionResponse",
+    "CombatProbabilityResponse",
+    "CacheStats",
+    "DiceCacheStatsResponse",
+    # Combat sessions
+    "Condition",
+    "CombatantSpec",
+    "CombatSessionCreateRequest",
+    "CombatantState",
+    "CombatSessionResponse",
+    "SessionAttackRequest",
+    "SessionDamageRequest",
+    "SessionHealRequest",
+    "SessionConditionsRequest",
+    "DamageApplied",
+    "SessionAttackResponse",
+    "SessionDamageResponse",
+    "SessionSavingThrowRequest",
+    "SessionSavingThrowResponse",
+    "SessionAttackCommand",
+    "SessionDamageCommand",
+    "SessionSavingThrowCommand",
+    "SessionHealCommand",
+    "SessionConditionsCommand",
+    "SessionNextTurnCommand",
+    "SessionCommand",
+    # Encounter
+    "EncounterDifficulty",
+    "EncounterBuildRequest",
+    "EncounterMonster",
+    "Encounter",
+    "EncounterBuildResponse",
+    "PartyMember",
+    "EncounterSimulationRequest",
+    "CombatantOutcome",
+    "HitPointsBin",
+    "EncounterSimulationResponse",
+    # Job
+    "JobKind",
+    "JobStatus",
+    "CombatSimulationJobRequest",
+    "EncounterSimulationJobRequest",
+    "JobSubmitRequest",
+    "JobResponse",
     # Responses
     "CharactersResponse",
     "ClassResponse",
     "RaceResponse",
     "MonstersResponse",
+    "SimilarMonster",
+    "SimilarMonstersResponse",
     "ItemsResponse",
+    "NameSearchResponse",
+    "AutocompleteResponse",
 ]
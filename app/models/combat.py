@@ -1,7 +1,22 @@
 """Combat-related models for attack rolls, damage, and saving throws"""
 
 from enum import Enum
-from pydantic import BaseModel, Field
+from typing import Annotated, Literal
+from pydantic import AfterValidator, BaseModel, Field, model_validator
+
+from app.utils.dice_expression import compile_dice
+
+
+def _check_dice_notation(notation: str) -> str:
+    compile_dice(notation)  # Raises ValueError; the compiled result is cached for reuse
+    return notation
+
+
+DiceNotation = Annotated[str, AfterValidator(_check_dice_notation)]
+
+# Bounds for bonuses and armor classes: far past any stat block, and small
+# enough that adding them to int64 roll arrays cannot overflow
+MAX_BONUS = 100
 
 
 class AdvantageType(str, Enum):
@@ -46,9 +61,11 @@ class AttackRollRequest(BaseModel):
 
     attack_bonus: int = Field(
         ...,
+        ge=-MAX_BONUS,
+        le=MAX_BONUS,
         description="Total attack bonus (ability modifier + proficiency + magic items)",
     )
-    armor_class: int = Field(..., ge=1, description="Target's armor class")
+    armor_class: int = Field(..., ge=1, le=MAX_BONUS, description="Target's armor class")
     advantage: AdvantageType = Field(
         default=AdvantageType.NORMAL, description="Advantage, disadvantage, or normal"
     )
@@ -79,8 +96,8 @@ class AttackRollResponse(BaseModel):
 class DamageRollRequest(BaseModel):
     """Request model for damage roll calculation"""
 
-    damage_dice: str = Field(
-        ..., description="Damage dice notation (e.g., '2d6+3', '1d8+5')"
+    damage_dice: DiceNotation = Field(
+        ..., description="Damage dice expression (e.g., '2d6+3', '1d8+1d6+5', '4d6kh3')"
     )
     damage_type: DamageType = Field(..., description="Type of damage")
     critical_hit: bool = Field(
@@ -102,9 +119,11 @@ class DamageRollResponse(BaseModel):
 class SavingThrowRequest(BaseModel):
     """Request model for saving throw calculation"""
 
-    ability_modifier: int = Field(..., description="Ability modifier for the save")
+    ability_modifier: int = Field(
+        ..., ge=-MAX_BONUS, le=MAX_BONUS, description="Ability modifier for the save"
+    )
     proficiency_bonus: int = Field(
-        default=0, ge=0, description="Proficiency bonus if proficient in this save"
+        default=0, ge=0, le=MAX_BONUS, description="Proficiency bonus if proficient in this save"
     )
     dc: int = Field(..., ge=1, description="Difficulty class to beat")
     advantage: AdvantageType = Field(
@@ -134,9 +153,11 @@ class SavingThrowResponse(BaseModel):
 class CombatCalculatorRequest(BaseModel):
     """Request model for full combat calculation (attack + damage)"""
 
-    attack_bonus: int = Field(..., description="Total attack bonus")
-    armor_class: int = Field(..., ge=1, description="Target's armor class")
-    damage_dice: str = Field(..., description="Damage dice notation (e.g., '2d6+3')")
+    attack_bonus: int = Field(..., ge=-MAX_BONUS, le=MAX_BONUS, description="Total attack bonus")
+    armor_class: int = Field(..., ge=1, le=MAX_BONUS, description="Target's armor class")
+    damage_dice: DiceNotation = Field(
+        ..., description="Damage dice expression (e.g., '2d6+3', '2d6r2+1d4')"
+    )
     damage_type: DamageType = Field(..., description="Type of damage")
     advantage: AdvantageType = Field(
         default=AdvantageType.NORMAL, description="Advantage, disadvantage, or normal"
@@ -150,3 +171,266 @@ class CombatCalculatorResponse(BaseModel):
     damage: DamageRollResponse | None = Field(
         default=None, description="Damage roll details (only if hit)"
     )
+
+
+# Batch entries reuse the single-roll models, tagged with the endpoint they mirror
+
+
+class BatchAttackRollRequest(AttackRollRequest):
+    """Attack roll entry in a combat batch"""
+
+    type: Literal["attack-roll"]
+
+
+class BatchDamageRollRequest(DamageRollRequest):
+    """Damage roll entry in a combat batch"""
+
+    type: Literal["damage-roll"]
+
+
+class BatchSavingThrowRequest(SavingThrowRequest):
+    """Saving throw entry in a combat batch"""
+
+    type: Literal["saving-throw"]
+
+
+class BatchCombatRequest(CombatCalculatorRequest):
+    """Full combat (attack + damage) entry in a combat batch"""
+
+    type: Literal["combat"]
+
+
+class BatchAttackRollResponse(AttackRollResponse):
+    """Attack roll result in a combat batch"""
+
+    type: Literal["attack-roll"] = "attack-roll"
+
+
+class BatchDamageRollResponse(DamageRollResponse):
+    """Damage roll result in a combat batch"""
+
+    type: Literal["damage-roll"] = "damage-roll"
+
+
+class BatchSavingThrowResponse(SavingThrowResponse):
+    """Saving throw result in a combat batch"""
+
+    type: Literal["saving-throw"] = "saving-throw"
+
+
+class BatchCombatResponse(CombatCalculatorResponse):
+    """Full combat result in a combat batch"""
+
+    type: Literal["combat"] = "combat"
+
+
+CombatBatchEntry = Annotated[
+    BatchAttackRollRequest
+    | BatchDamageRollRequest
+    | BatchSavingThrowRequest
+    | BatchCombatRequest,
+    Field(discriminator="type"),
+]
+
+CombatBatchResult = Annotated[
+    BatchAttackRollResponse
+    | BatchDamageRollResponse
+    | BatchSavingThrowResponse
+    | BatchCombatResponse,
+    Field(discriminator="type"),
+]
+
+
+class CombatBatchRequest(BaseModel):
+    """Request model for resolving many rolls in one call"""
+
+    requests: list[CombatBatchEntry] = Field(
+        ...,
+        min_length=1,
+        max_length=10000,
+        description="Rolls to resolve, each tagged with its type",
+    )
+
+
+class CombatBatchResponse(BaseModel):
+    """Response model for a combat batch (results in request order)"""
+
+    results: list[CombatBatchResult] = Field(
+        ..., description="One result per request entry, in order"
+    )
+
+
+class AreaEffectTarget(BaseModel):
+    """A creature caught in an area effect"""
+
+    name: str | None = Field(default=None, description="Display name (default: monster name)")
+    monster_id: int | None = Field(
+        default=None, description="Catalog monster; supplies the save bonus and defenses"
+    )
+    save_modifier: int | None = Field(
+        default=None,
+        ge=-30,
+        le=30,
+        description="Total save bonus (default: from the monster's stat block)",
+    )
+    advantage: AdvantageType = Field(
+        default=AdvantageType.NORMAL, description="Advantage, disadvantage, or normal"
+    )
+    resistances: list[DamageType] = Field(default_factory=list, description="Half damage")
+    immunities: list[DamageType] = Field(default_factory=list, description="No damage")
+    vulnerabilities: list[DamageType] = Field(default_factory=list, description="Double damage")
+
+    @model_validator(mode="after")
+    def check_save_source(self) -> "AreaEffectTarget":
+        if self.monster_id is None and self.save_modifier is None:
+            raise ValueError("Give a monster_id or a save_modifier")
+        return self
+
+
+class AreaEffectRequest(BaseModel):
+    """Request model for one damage roll saved against by many targets"""
+
+    dc: int = Field(..., ge=1, description="Save DC")
+    ability: SavingThrowAbility = Field(..., description="Ability used for the save")
+    damage_dice: DiceNotation = Field(..., description="Damage dice, rolled once for everyone")
+    damage_type: DamageType = Field(..., description="Type of damage")
+    half_on_success: bool = Field(default=True, description="Half damage on a successful save")
+    targets: list[AreaEffectTarget] = Field(..., min_length=1, max_length=1000)
+
+
+class AreaEffectTargetResult(BaseModel):
+    """One target's save and the damage it takes"""
+
+    name: str = Field(..., description="Target name")
+    monster_id: int | None = Field(default=None, description="Catalog monster id")
+    roll: int = Field(..., description="Kept d20 roll")
+    second_roll: int | None = Field(default=None, description="Other d20 with (dis)advantage")
+    save_modifier: int = Field(..., description="Save bonus applied")
+    total: int = Field(..., description="Saving throw total")
+    success: bool = Field(..., description="Whether the save succeeded")
+    damage: int = Field(..., description="Damage taken after the save and defenses")
+    defenses: list[str] = Field(
+        default_factory=list, description="Defenses that applied: immune, resistant, vulnerable"
+    )
+
+
+class AreaEffectResponse(BaseModel):
+    """Response model for an area effect"""
+
+    damage_roll: DamageRollResponse = Field(..., description="The shared damage roll")
+    successes: int = Field(..., description="Targets that saved")
+    total_damage: int = Field(..., description="Damage dealt across all targets")
+    results: list[AreaEffectTargetResult] = Field(..., description="Per target, in order")
+
+
+class CombatSimulationRequest(CombatCalculatorRequest):
+    """Request model for Monte Carlo simulation of a full combat turn"""
+
+    trials: int = Field(
+        default=10000, ge=1, le=5_000_000, description="Number of turns to simulate"
+    )
+    seed: int | None = Field(
+        default=None, ge=0, description="Random seed for reproducible results"
+    )
+
+
+class CombatSimulationStreamRequest(CombatSimulationRequest):
+    """Request model for a simulation that streams converging estimates"""
+
+    chunk_trials: int = Field(
+        default=10000, ge=1000, le=131072, description="Trials per streamed update"
+    )
+    ci_half_width: float | None = Field(
+        default=None,
+        gt=0,
+        description="Stop once the 95% CI of mean damage is within +/- this",
+    )
+
+
+class HistogramBin(BaseModel):
+    """Number of simulated turns that dealt a given amount of damage"""
+
+    damage: int = Field(..., description="Damage dealt (0 for a miss)")
+    count: int = Field(..., description="Number of trials with this damage")
+
+
+class CombatSimulationResponse(BaseModel):
+    """Response model for Monte Carlo combat simulation"""
+
+    trials: int = Field(..., description="Number of turns simulated")
+    hit_rate: float = Field(..., description="Fraction of attacks that hit")
+    crit_rate: float = Field(..., description="Fraction of attacks that crit")
+    mean_damage: float = Field(..., description="Mean damage per turn (misses count as 0)")
+    std_damage: float = Field(..., description="Standard deviation of damage per turn")
+    min_damage: int = Field(..., description="Lowest damage observed")
+    max_damage: int = Field(..., description="Highest damage observed")
+    percentiles: dict[str, int] = Field(
+        ..., description="Damage percentiles (p5, p25, p50, p75, p95)"
+    )
+    histogram: list[HistogramBin] = Field(
+        ..., description="Damage distribution (bins with at least one trial)"
+    )
+
+
+class AttackProbabilityResponse(BaseModel):
+    """Exact outcome probabilities for an attack roll"""
+
+    hit_probability: float = Field(..., description="Probability the attack hits (incl. crits)")
+    critical_hit_probability: float = Field(..., description="Probability of a natural 20")
+    critical_miss_probability: float = Field(..., description="Probability of a natural 1")
+    miss_probability: float = Field(..., description="Probability the attack misses")
+
+
+class SavingThrowProbabilityResponse(BaseModel):
+    """Exact outcome probabilities for a saving throw"""
+
+    success_probability: float = Field(..., description="Probability the save succeeds")
+    failure_probability: float = Field(..., description="Probability the save fails")
+    natural_20_probability: float = Field(..., description="Probability of a natural 20")
+    natural_1_probability: float = Field(..., description="Probability of a natural 1")
+
+
+class ProbabilityPoint(BaseModel):
+    """Probability mass at one damage value"""
+
+    value: int = Field(..., description="Damage value")
+    probability: float = Field(..., description="Probability of exactly this value")
+    cumulative: float = Field(..., description="Probability of this value or less")
+
+
+class DamageDistributionResponse(BaseModel):
+    """Exact damage distribution"""
+
+    min_damage: int = Field(..., description="Lowest possible damage")
+    max_damage: int = Field(..., description="Highest possible damage")
+    mean_damage: float = Field(..., description="Expected damage")
+    std_damage: float = Field(..., description="Standard deviation of damage")
+    pmf: list[ProbabilityPoint] = Field(
+        ..., description="Probability mass function over every possible value"
+    )
+
+
+class CombatProbabilityResponse(BaseModel):
+    """Exact attack outcome and damage distribution for a full combat turn"""
+
+    attack: AttackProbabilityResponse = Field(..., description="Attack outcome probabilities")
+    damage: DamageDistributionResponse = Field(
+        ..., description="Damage per turn (misses count as 0)"
+    )
+
+
+class CacheStats(BaseModel):
+    """Hit/miss counters for one in-memory cache"""
+
+    hits: int = Field(..., description="Lookups served from the cache")
+    misses: int = Field(..., description="Lookups that had to compute the value")
+    size: int = Field(..., description="Entries currently cached")
+    max_size: int | None = Field(..., description="Entry limit before LRU eviction")
+    hit_ratio: float = Field(..., description="hits / (hits + misses), 0 when unused")
+
+
+class DiceCacheStatsResponse(BaseModel):
+    """Statistics for the dice expression and distribution caches"""
+
+    parsed: CacheStats = Field(..., description="Compiled dice expression cache")
+    distributions: CacheStats = Field(..., description="Damage distribution cache")
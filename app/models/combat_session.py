@@ -0,0 +1,248 @@
+"""Models for stateful combat sessions (live initiative, hit points, conditions)"""
+
+from enum import Enum
+from typing import Annotated, Literal
+from pydantic import BaseModel, Field, model_validator
+
+from .combat import (
+    AdvantageType,
+    CombatCalculatorResponse,
+    DamageType,
+    DiceNotation,
+    SavingThrowRequest,
+    SavingThrowResponse,
+)
+
+# Sessions store initiative and AC as 16-bit and hit points as 32-bit columns
+MAX_INT16 = 32_767
+MAX_INT32 = 2_147_483_647
+
+
+class Condition(str, Enum):
+    """D&D 5e conditions"""
+
+    BLINDED = "blinded"
+    CHARMED = "charmed"
+    DEAFENED = "deafened"
+    FRIGHTENED = "frightened"
+    GRAPPLED = "grappled"
+    INCAPACITATED = "incapacitated"
+    INVISIBLE = "invisible"
+    PARALYZED = "paralyzed"
+    PETRIFIED = "petrified"
+    POISONED = "poisoned"
+    PRONE = "prone"
+    RESTRAINED = "restrained"
+    STUNNED = "stunned"
+    UNCONSCIOUS = "unconscious"
+
+
+class CombatantSpec(BaseModel):
+    """A combatant joining a session: a catalog monster, a custom stat line, or both"""
+
+    monster_id: int | None = Field(
+        default=None, description="Catalog monster to copy stats and defenses from"
+    )
+    name: str | None = Field(default=None, description="Display name (default: monster name)")
+    hit_points: int | None = Field(
+        default=None, ge=1, le=MAX_INT32, description="Maximum hit points"
+    )
+    armor_class: int | None = Field(default=None, ge=1, le=MAX_INT16, description="Armor class")
+    initiative_bonus: int | None = Field(
+        default=None,
+        ge=-100,
+        le=100,
+        description="Initiative bonus (default: monster Dex modifier, else 0)",
+    )
+    initiative: int | None = Field(
+        default=None,
+        ge=-MAX_INT16,
+        le=MAX_INT16,
+        description="Initiative already rolled at the table (skips the roll)",
+    )
+    resistances: list[DamageType] = Field(default_factory=list, description="Half damage")
+    immunities: list[DamageType] = Field(default_factory=list, description="No damage")
+    vulnerabilities: list[DamageType] = Field(default_factory=list, description="Double damage")
+
+    @model_validator(mode="after")
+    def check_stats(self) -> "CombatantSpec":
+        if self.monster_id is None and (
+            self.name is None or self.hit_points is None or self.armor_class is None
+        ):
+            raise ValueError("Give a monster_id, or a name, hit_points and armor_class")
+        return self
+
+
+class CombatSessionCreateRequest(BaseModel):
+    """Request model for starting a combat session"""
+
+    combatants: list[CombatantSpec] = Field(..., min_length=1, max_length=64)
+
+
+class CombatantState(BaseModel):
+    """Current state of one combatant, addressed by its slot"""
+
+    slot: int = Field(..., description="Position in initiative order; used to address it")
+    name: str = Field(..., description="Display name")
+    monster_id: int | None = Field(default=None, description="Catalog monster id")
+    initiative: int = Field(..., description="Initiative total")
+    hit_points: int = Field(..., description="Current hit points")
+    max_hit_points: int = Field(..., description="Maximum hit points")
+    armor_class: int = Field(..., description="Armor class")
+    conditions: list[Condition] = Field(..., description="Active conditions")
+    resistances: list[DamageType] = Field(..., description="Damage types halved")
+    immunities: list[DamageType] = Field(..., description="Damage types ignored")
+    vulnerabilities: list[DamageType] = Field(..., description="Damage types doubled")
+    defeated: bool = Field(..., description="Whether hit points are at 0")
+
+
+class CombatSessionResponse(BaseModel):
+    """Current state of a combat session"""
+
+    id: str = Field(..., description="Session id")
+    round: int = Field(..., description="Current round (starts at 1)")
+    turn: int = Field(..., description="Slot of the combatant whose turn it is")
+    combatants: list[CombatantState] = Field(..., description="Combatants in initiative order")
+
+
+class SessionAttackRequest(BaseModel):
+    """Request model for an attack against a session combatant"""
+
+    attacker: int | None = Field(
+        default=None, ge=0, description="Attacking slot; its conditions affect the roll"
+    )
+    target: int = Field(..., ge=0, description="Target slot; its AC and defenses apply")
+    attack_bonus: int = Field(..., description="Total attack bonus")
+    damage_dice: DiceNotation = Field(..., description="Damage dice expression")
+    damage_type: DamageType = Field(..., description="Type of damage")
+    advantage: AdvantageType = Field(
+        default=AdvantageType.NORMAL, description="Advantage from other sources"
+    )
+
+
+class SessionDamageRequest(BaseModel):
+    """Request model for applying already-rolled damage"""
+
+    target: int = Field(..., ge=0, description="Target slot")
+    amount: int = Field(..., ge=0, le=MAX_INT32, description="Damage before resistances")
+    damage_type: DamageType = Field(..., description="Type of damage")
+
+
+class SessionSavingThrowRequest(SavingThrowRequest):
+    """Request model for a combatant's saving throw, optionally against damage"""
+
+    target: int = Field(..., ge=0, description="Slot making the save")
+    damage: int | None = Field(
+        default=None,
+        ge=0,
+        le=MAX_INT32,
+        description="Damage on a failed save (e.g. a rolled breath weapon)",
+    )
+    damage_type: DamageType | None = Field(default=None, description="Type of that damage")
+    half_on_success: bool = Field(default=True, description="Take half damage on a success")
+
+    @model_validator(mode="after")
+    def check_damage_type(self) -> "SessionSavingThrowRequest":
+        if self.damage is not None and self.damage_type is None:
+            raise ValueError("damage_type is required with damage")
+        return self
+
+
+class SessionHealRequest(BaseModel):
+    """Request model for restoring hit points"""
+
+    target: int = Field(..., ge=0, description="Target slot")
+    amount: int = Field(
+        ..., ge=0, le=MAX_INT32, description="Hit points to restore (capped at maximum)"
+    )
+
+
+class SessionConditionsRequest(BaseModel):
+    """Request model for adding or removing conditions"""
+
+    target: int = Field(..., ge=0, description="Target slot")
+    add: list[Condition] = Field(default_factory=list, description="Conditions to apply")
+    remove: list[Condition] = Field(default_factory=list, description="Conditions to end")
+
+
+class DamageApplied(BaseModel):
+    """Damage after the target's defenses"""
+
+    rolled: int = Field(..., description="Damage before defenses")
+    applied: int = Field(..., description="Hit points lost")
+    defenses: list[str] = Field(
+        default_factory=list, description="Defenses that applied: immune, resistant, vulnerable"
+    )
+
+
+class SessionAttackResponse(BaseModel):
+    """Result of an attack in a session"""
+
+    result: CombatCalculatorResponse = Field(..., description="Attack and damage rolls")
+    damage: DamageApplied | None = Field(default=None, description="Damage taken (if hit)")
+    target: CombatantState = Field(..., description="Target after the attack")
+
+
+class SessionDamageResponse(BaseModel):
+    """Result of applying damage in a session"""
+
+    damage: DamageApplied = Field(..., description="Damage taken")
+    target: CombatantState = Field(..., description="Target after the damage")
+
+
+class SessionSavingThrowResponse(BaseModel):
+    """Result of a saving throw in a session"""
+
+    result: SavingThrowResponse = Field(..., description="Saving throw roll")
+    damage: DamageApplied | None = Field(default=None, description="Damage taken (if any)")
+    target: CombatantState = Field(..., description="Combatant after the save")
+
+
+# WebSocket commands reuse the request models, tagged with the endpoint they mirror
+
+
+class SessionAttackCommand(SessionAttackRequest):
+    """Attack command on a session WebSocket"""
+
+    type: Literal["attack"]
+
+
+class SessionDamageCommand(SessionDamageRequest):
+    """Damage command on a session WebSocket"""
+
+    type: Literal["damage"]
+
+
+class SessionSavingThrowCommand(SessionSavingThrowRequest):
+    """Saving throw command on a session WebSocket"""
+
+    type: Literal["saving-throw"]
+
+
+class SessionHealCommand(SessionHealRequest):
+    """Heal command on a session WebSocket"""
+
+    type: Literal["heal"]
+
+
+class SessionConditionsCommand(SessionConditionsRequest):
+    """Conditions command on a session WebSocket"""
+
+    type: Literal["conditions"]
+
+
+class SessionNextTurnCommand(BaseModel):
+    """Next-turn command on a session WebSocket"""
+
+    type: Literal["next-turn"]
+
+
+SessionCommand = Annotated[
+    SessionAttackCommand
+    | SessionDamageCommand
+    | SessionSavingThrowCommand
+    | SessionHealCommand
+    | SessionConditionsCommand
+    | SessionNextTurnCommand,
+    Field(discriminator="type"),
+]
@@ -0,0 +1,170 @@
+"""Encounter-building models"""
+
+from enum import Enum
+from typing import Annotated, Literal
+from pydantic import BaseModel, Field, model_validator
+
+from .combat import DamageType, DiceNotation, SavingThrowAbility
+from .common import Size
+from .monster import MonsterType
+
+PartyLevel = Annotated[int, Field(ge=1, le=20)]
+
+
+class EncounterDifficulty(str, Enum):
+    """Encounter difficulty from the DMG encounter-building rules"""
+
+    EASY = "easy"
+    MEDIUM = "medium"
+    HARD = "hard"
+    DEADLY = "deadly"
+
+
+class EncounterBuildRequest(BaseModel):
+    """Request model for building an encounter against an XP budget"""
+
+    party_levels: list[PartyLevel] = Field(
+        ...,
+        min_length=1,
+        max_length=10,
+        description="Level of each character, or a single level shared by party_size characters",
+    )
+    party_size: int | None = Field(
+        default=None,
+        ge=1,
+        le=10,
+        description="Number of characters (defaults to the number of party_levels)",
+    )
+    difficulty: EncounterDifficulty = Field(
+        default=EncounterDifficulty.MEDIUM, description="Target difficulty"
+    )
+    monster_type: MonsterType | None = Field(
+        default=None, description="Only use monsters of this type"
+    )
+    size: Size | None = Field(default=None, description="Only use monsters of this size")
+    min_cr: float | None = Field(default=None, ge=0, description="Minimum challenge rating")
+    max_cr: float | None = Field(default=None, ge=0, description="Maximum challenge rating")
+    max_monsters: int = Field(
+        default=8, ge=1, le=20, description="Maximum number of monsters per encounter"
+    )
+    suggestions: int = Field(
+        default=3, ge=1, le=10, description="Number of encounters to suggest"
+    )
+
+    @model_validator(mode="after")
+    def check_party_size(self):
+        if (
+            self.party_size is not None
+            and len(self.party_levels) > 1
+            and len(self.party_levels) != self.party_size
+        ):
+            raise ValueError(
+                "party_size must match the number of party_levels (or give a single level)"
+            )
+        return self
+
+
+class EncounterMonster(BaseModel):
+    """A group of identical monsters in an encounter"""
+
+    id: int = Field(..., description="Catalog monster id")
+    name: str = Field(..., description="Monster name")
+    challenge_rating: float = Field(..., description="Monster challenge rating")
+    experience_points: int = Field(..., description="XP for one monster")
+    count: int = Field(..., description="Number of this monster in the encounter")
+
+
+class Encounter(BaseModel):
+    """A suggested encounter and its XP accounting"""
+
+    monsters: list[EncounterMonster] = Field(..., description="Monster groups")
+    monster_count: int = Field(..., description="Total number of monsters")
+    total_xp: int = Field(..., description="Sum of monster XP (awarded to the party)")
+    multiplier: float = Field(..., description="Group-size multiplier applied")
+    adjusted_xp: int = Field(..., description="XP used to rate difficulty")
+    difficulty: EncounterDifficulty = Field(..., description="Resulting difficulty")
+
+
+class EncounterBuildResponse(BaseModel):
+    """Response model for encounter building"""
+
+    party_size: int = Field(..., description="Number of characters")
+    thresholds: dict[EncounterDifficulty, int] = Field(
+        ..., description="Party XP threshold for each difficulty"
+    )
+    target_min_xp: int = Field(..., description="Lowest adjusted XP for the difficulty")
+    target_max_xp: int = Field(..., description="Highest adjusted XP for the difficulty")
+    candidates: int = Field(..., description="Catalog monsters that passed the filters")
+    encounters: list[Encounter] = Field(..., description="Suggested encounters")
+
+
+class PartyMember(BaseModel):
+    """A party combatant for encounter simulation"""
+
+    name: str = Field(default="Adventurer", description="Display name")
+    hit_points: int = Field(..., ge=1, description="Starting (and maximum) hit points")
+    armor_class: int = Field(..., ge=1, description="Armor class")
+    attack_bonus: int = Field(..., description="Attack bonus for weapon attacks")
+    damage_dice: DiceNotation = Field(..., description="Damage per hit (e.g., '1d8+3')")
+    damage_type: DamageType = Field(
+        default=DamageType.SLASHING, description="Damage type (checked against monster defenses)"
+    )
+    attacks: int = Field(default=1, ge=1, le=4, description="Attacks per turn")
+    initiative_bonus: int = Field(default=0, description="Bonus to initiative rolls")
+    save_bonuses: dict[SavingThrowAbility, int] = Field(
+        default_factory=dict, description="Saving throw bonus by ability (missing = 0)"
+    )
+
+
+class EncounterSimulationRequest(BaseModel):
+    """Request model for simulating a party against catalog monsters"""
+
+    party: list[PartyMember] = Field(..., min_length=1, max_length=10)
+    monster_ids: list[int] = Field(
+        ...,
+        min_length=1,
+        max_length=20,
+        description="Catalog monster ids (repeat an id for several of that monster)",
+    )
+    trials: int = Field(default=10_000, ge=1, le=100_000, description="Fights to simulate")
+    max_rounds: int = Field(
+        default=50, ge=1, le=200, description="Rounds before a fight counts as unresolved"
+    )
+    seed: int | None = Field(default=None, description="Seed for reproducible results")
+
+
+class CombatantOutcome(BaseModel):
+    """How one combatant fared across all simulated fights"""
+
+    name: str = Field(..., description="Combatant name")
+    side: Literal["party", "monsters"] = Field(..., description="Which side it fought on")
+    max_hit_points: int = Field(..., description="Starting hit points")
+    survival_probability: float = Field(..., description="Share of fights it ended standing")
+    mean_hit_points: float = Field(..., description="Average hit points at the end")
+
+
+class HitPointsBin(BaseModel):
+    """Share of fights ending with party hit points in a range"""
+
+    min_hit_points: int = Field(..., description="Lower bound (inclusive)")
+    max_hit_points: int = Field(..., description="Upper bound (inclusive)")
+    probability: float = Field(..., description="Share of fights in this range")
+
+
+class EncounterSimulationResponse(BaseModel):
+    """Response model for encounter simulation"""
+
+    trials: int = Field(..., description="Fights simulated")
+    party_win_probability: float = Field(..., description="Share of fights the party won")
+    monster_win_probability: float = Field(..., description="Share of fights the monsters won")
+    unresolved_probability: float = Field(
+        ..., description="Share of fights still going after max_rounds"
+    )
+    expected_rounds: float = Field(..., description="Mean rounds per fight")
+    party_hit_points: dict[str, int] = Field(
+        ..., description="Percentiles of total party hit points remaining (p5 to p95)"
+    )
+    party_hit_points_distribution: list[HitPointsBin] = Field(
+        ..., description="Distribution of total party hit points remaining"
+    )
+    combatants: list[CombatantOutcome] = Field(..., description="Per-combatant results")
@@ -0,0 +1,62 @@
+"""Background job models for long-running simulations"""
+
+from datetime import datetime
+from enum import Enum
+from typing import Annotated, Any, Literal
+from pydantic import BaseModel, Field
+
+from .combat import CombatSimulationRequest
+from .encounter import EncounterSimulationRequest
+
+
+class JobKind(str, Enum):
+    """Work a job can run"""
+
+    COMBAT_SIMULATION = "combat-simulation"
+    ENCOUNTER_SIMULATION = "encounter-simulation"
+
+
+class JobStatus(str, Enum):
+    """Lifecycle state of a job"""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class CombatSimulationJobRequest(BaseModel):
+    """Submit a combat simulation (same fields as POST /combat/simulate)"""
+
+    kind: Literal[JobKind.COMBAT_SIMULATION]
+    request: CombatSimulationRequest
+
+
+class EncounterSimulationJobRequest(BaseModel):
+    """Submit an encounter simulation (same fields as POST /encounters/simulate)"""
+
+    kind: Literal[JobKind.ENCOUNTER_SIMULATION]
+    request: EncounterSimulationRequest
+
+
+JobSubmitRequest = Annotated[
+    CombatSimulationJobRequest | EncounterSimulationJobRequest,
+    Field(discriminator="kind"),
+]
+
+
+class JobResponse(BaseModel):
+    """Current state of a job, with its result once it has succeeded"""
+
+    id: str = Field(..., description="Job id to poll")
+    kind: JobKind = Field(..., description="Work the job runs")
+    status: JobStatus = Field(..., description="Lifecycle state")
+    progress: float = Field(..., ge=0, le=1, description="Fraction of the work done")
+    submitted_at: datetime = Field(..., description="When the job was queued")
+    started_at: datetime | None = Field(default=None, description="When a worker picked it up")
+    finished_at: datetime | None = Field(default=None, description="When it stopped")
+    result: dict[str, Any] | None = Field(
+        default=None, description="Simulation response once succeeded"
+    )
+    error: str | None = Field(default=None, description="Failure reason")
@@ -1,7 +1,7 @@
 """Monster-related models and enums"""
 
 from enum import Enum
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from .common import Alignment, Size, Stats
 
@@ -53,6 +53,42 @@ class Action(BaseModel):
     damage_type: DamageType | None = None
 
 
+class MonsterMetrics(BaseModel):
+    """Threat metrics derived from a stat block (DMG CR guidelines)"""
+
+    expected_dpr: float = Field(
+        ..., description="Average damage per round over three rounds if every attack hits"
+    )
+    attack_bonus: int | None = Field(default=None, description="Bonus of the best attack action")
+    save_dc: int | None = Field(default=None, description="DC of the area damage action")
+    hit_chance_ac12: float | None = Field(default=None, description="Attack hit chance vs AC 12")
+    hit_chance_ac15: float | None = Field(default=None, description="Attack hit chance vs AC 15")
+    hit_chance_ac18: float | None = Field(default=None, description="Attack hit chance vs AC 18")
+    effective_hit_points: int = Field(
+        ..., description="Hit points scaled for resistances and immunities"
+    )
+    offensive_cr: float = Field(..., description="CR from damage per round and attack bonus/DC")
+    defensive_cr: float = Field(..., description="CR from effective hit points and AC")
+    calculated_cr: float = Field(..., description="Average of offensive and defensive CR")
+
+
+class MonsterSortField(str, Enum):
+    """Fields monster listings can be sorted by"""
+
+    NAME = "name"
+    CHALLENGE_RATING = "challenge_rating"
+    ARMOR_CLASS = "armor_class"
+    HIT_POINTS = "hit_points"
+    EXPECTED_DPR = "expected_dpr"
+    HIT_CHANCE_AC12 = "hit_chance_ac12"
+    HIT_CHANCE_AC15 = "hit_chance_ac15"
+    HIT_CHANCE_AC18 = "hit_chance_ac18"
+    EFFECTIVE_HIT_POINTS = "effective_hit_points"
+    OFFENSIVE_CR = "offensive_cr"
+    DEFENSIVE_CR = "defensive_cr"
+    CALCULATED_CR = "calculated_cr"
+
+
 class Monster(BaseModel):
     """D&D 5e Monster stat block"""
 
@@ -93,3 +129,6 @@ class Monster(BaseModel):
     actions: list[Action]
     legendary_actions: list[Action] | None = None
     reactions: list[Action] | None = None
+
+    # Derived threat metrics (catalog monsters only)
+    metrics: MonsterMetrics | None = None
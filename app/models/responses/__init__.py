@@ -1,13 +1,18 @@
 """Response models package - exports all response models"""
 
 from .character_responses import CharactersResponse, ClassResponse, RaceResponse
-from .monster_responses import MonstersResponse
+from .monster_responses import MonstersResponse, SimilarMonster, SimilarMonstersResponse
 from .item_responses import ItemsResponse
+from .search_responses import AutocompleteResponse, NameSearchResponse
 
 __all__ = [
     "CharactersResponse",
     "ClassResponse",
     "RaceResponse",
     "MonstersResponse",
+    "SimilarMonster",
+    "SimilarMonstersResponse",
     "ItemsResponse",
+    "NameSearchResponse",
+    "AutocompleteResponse",
 ]
@@ -11,3 +11,17 @@ class MonstersResponse(BaseModel):
     total: int
     skip: int
     limit: int
+
+
+class SimilarMonster(BaseModel):
+    """A monster ranked by similarity to a reference monster"""
+
+    distance: float
+    monster: Monster
+
+
+class SimilarMonstersResponse(BaseModel):
+    """Response model for similar-monster search"""
+
+    monster_id: int
+    similar: list[SimilarMonster]
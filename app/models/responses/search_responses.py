@@ -0,0 +1,20 @@
+"""Search response models"""
+
+from pydantic import BaseModel
+from app.models.search import AutocompleteOrder, AutocompleteSuggestion, NameMatch
+
+
+class NameSearchResponse(BaseModel):
+    """Response model for fuzzy name lookup"""
+
+    query: str
+    max_distance: int
+    matches: list[NameMatch]
+
+
+class AutocompleteResponse(BaseModel):
+    """Response model for prefix autocomplete"""
+
+    prefix: str
+    order: AutocompleteOrder
+    suggestions: list[AutocompleteSuggestion]
@@ -0,0 +1,36 @@
+"""Search-related models shared by name lookup and autocomplete"""
+
+from enum import Enum
+from pydantic import BaseModel, Field
+
+
+class EntityKind(str, Enum):
+    """Kinds of catalog entities that can be searched by name"""
+
+    MONSTER = "monster"
+    ITEM = "item"
+    CHARACTER = "character"
+
+
+class NameMatch(BaseModel):
+    """A catalog entity whose name is close to the search term"""
+
+    kind: EntityKind = Field(..., description="Kind of entity matched")
+    id: int = Field(..., description="Entity id")
+    name: str = Field(..., description="Entity name")
+    distance: int = Field(..., description="Edit distance between the query and the name")
+
+
+class AutocompleteOrder(str, Enum):
+    """Ranking applied to autocomplete suggestions"""
+
+    CHALLENGE = "cr"  # Strongest first: monster CR, item rarity
+    NAME = "name"  # Alphabetical
+
+
+class AutocompleteSuggestion(BaseModel):
+    """A catalog entity whose name completes the typed prefix"""
+
+    kind: EntityKind = Field(..., description="Kind of entity suggested")
+    id: int = Field(..., description="Entity id")
+    name: str = Field(..., description="Entity name")
@@ -0,0 +1,121 @@
+"""Area-of-effect saving throws resolved for every target at once"""
+
+import numpy as np
+
+from app.models import AreaEffectRequest
+from app.models.combat import AdvantageType, DamageType
+from app.services.combat_kernel import damage_roll
+from app.services.query_utils import Record
+from app.utils import calculate_modifier, rng
+
+
+def monster_save_modifier(monster: Record, ability: str) -> int:
+    """Save bonus from the stat block, falling back to the ability modifier"""
+    saving_throws = monster.get("saving_throws") or {}
+    if ability in saving_throws:
+        return saving_throws[ability]
+    return calculate_modifier(monster["stats"][ability])
+
+
+def _has_type(types, damage_type: DamageType) -> bool:
+    return any(t.lower() == damage_type.value for t in types or ())
+
+
+def resolve_area_effect(request: AreaEffectRequest, monsters: list[Record]) -> dict:
+    """
+    Roll the damage once, then every target's save as array operations.
+
+    A failed save takes the full damage and a success half (or none when
+    half_on_success is off). Defenses then apply in PHB order: immunity,
+    resistance, vulnerability. Catalog monsters contribute their save bonus
+    and damage resistances, immunities and vulnerabilities; explicit
+    fields on a target add to (or, for save_modifier, override) them.
+
+    Args:
+        request: DC, ability, damage and targets
+        monsters: Catalog records for the targets with a monster_id, in order
+
+    Returns:
+        Dictionary matching AreaEffectResponse
+    """
+    targets = request.targets
+    size = len(targets)
+    ability = request.ability.value
+    damage_type = request.damage_type
+    catalog = iter(monsters)
+
+    names = []
+    modifiers = np.empty(size, dtype=np.int64)
+    advantage = np.empty(size, dtype=np.int8)  # -1 disadvantage, 0 normal, 1 advantage
+    immune = np.zeros(size, dtype=bool)
+    resistant = np.zeros(size, dtype=bool)
+    vulnerable = np.zeros(size, dtype=bool)
+    for i, target in enumerate(targets):
+        monster = next(catalog) if target.monster_id is not None else None
+        names.append(target.name or (monster["name"] if monster else f"Target {i + 1}"))
+        modifiers[i] = (
+            target.save_modifier
+            if target.save_modifier is not None
+            else monster_save_modifier(monster, ability)
+        )
+        advantage[i] = {
+            AdvantageType.ADVANTAGE: 1,
+            AdvantageType.DISADVANTAGE: -1,
+        }.get(target.advantage, 0)
+        immune[i] = damage_type in target.immunities or (
+            monster is not None and _has_type(monster.get("damage_immunities"), damage_type)
+        )
+        resistant[i] = damage_type in target.resistances or (
+            monster is not None and _has_type(monster.get("damage_resistances"), damage_type)
+        )
+        vulnerable[i] = damage_type in target.vulnerabilities or (
+            monster is not None and _has_type(monster.get("damage_vulnerabilities"), damage_type)
+        )
+
+    damage = damage_roll(request.damage_dice)
+    full = max(0, damage.total)
+
+    d20s = rng.generator().integers(1, 21, size=(size, 2))
+    high, low = d20s.max(axis=1), d20s.min(axis=1)
+    kept = np.select([advantage > 0, advantage < 0], [high, low], d20s[:, 0])
+    other = np.select([advantage > 0, advantage < 0], [low, high], 0)
+    totals = kept + modifiers
+    success = totals >= request.dc
+
+    taken = np.where(success, full // 2 if request.half_on_success else 0, full)
+    taken = np.where(resistant, taken // 2, taken)
+    taken = np.where(vulnerable, taken * 2, taken)
+    taken = np.where(immune, 0, taken)
+
+    results = []
+    for i, target in enumerate(targets):
+        if immune[i]:
+            defenses = ["immune"]
+        else:
+            defenses = ["resistant"] * bool(resistant[i]) + ["vulnerable"] * bool(vulnerable[i])
+        results.append(
+            {
+                "name": names[i],
+                "monster_id": target.monster_id,
+                "roll": int(kept[i]),
+                "second_roll": int(other[i]) if advantage[i] else None,
+                "save_modifier": int(modifiers[i]),
+                "total": int(totals[i]),
+                "success": bool(success[i]),
+                "damage": int(taken[i]),
+                "defenses": defenses,
+            }
+        )
+
+    return {
+        "damage_roll": {
+            "rolls": damage.rolls,
+            "modifier": damage.modifier,
+            "total": damage.total,
+            "damage_type": damage_type,
+            "critical_hit": False,
+        },
+        "successes": int(success.sum()),
+        "total_damage": int(taken.sum()),
+        "results": results,
+    }
@@ -0,0 +1,176 @@
+"""Prefix autocomplete backed by compressed tries over catalog names"""
+
+import heapq
+from functools import lru_cache
+from itertools import islice
+
+from app.config import settings
+from app.models import AutocompleteOrder, EntityKind, Rarity
+from app.services.data_loader import load_characters, load_items, load_monsters
+from app.services.query_utils import Record
+
+RARITY_RANK = {rarity.value: rank for rank, rarity in enumerate(Rarity)}
+
+# (sort_key, kind, id, name) - sort_key orders suggestions best first
+Suggestion = tuple[tuple, EntityKind, int, str]
+
+
+class _Node:
+    """Radix trie node: edges are keyed by first character and carry a label"""
+
+    __slots__ = ("edges", "suggestions", "top")
+
+    def __init__(self):
+        self.edges: dict[str, tuple[str, "_Node"]] = {}
+        self.suggestions: list[Suggestion] = []
+        self.top: tuple[Suggestion, ...] = ()
+
+
+class RadixTrie:
+    """
+    Compressed trie that answers prefix queries in O(len(prefix)).
+
+    Every node keeps its subtree's best completions precomputed, so a lookup
+    is a walk down the edges followed by a slice, independent of how many
+    names share the prefix.
+    """
+
+    def __init__(self, max_results: int):
+        self.root = _Node()
+        self.max_results = max_results
+
+    def insert(self, key: str, suggestion: Suggestion) -> None:
+        """Insert a key, attaching the suggestion it completes to"""
+        node = self.root
+        while key:
+            edge = node.edges.get(key[0])
+            if edge is None:
+                child = _Node()
+                node.edges[key[0]] = (key, child)
+                node = child
+                break
+
+            label, child = edge
+            common = 0
+            while common < min(len(label), len(key)) and label[common] == key[common]:
+                common += 1
+
+            if common < len(label):
+                # Split the edge so the shared part becomes its own node
+                middle = _Node()
+                middle.edges[label[common]] = (label[common:], child)
+                node.edges[key[0]] = (label[:common], middle)
+                child = middle
+
+            node = child
+            key = key[common:]
+        node.suggestions.append(suggestion)
+
+    def finalize(self) -> None:
+        """Precompute each node's best completions (call once after inserting)"""
+        self._collect(self.root)
+
+    def _collect(self, node: _Node) -> tuple[Suggestion, ...]:
+        candidates = [node.suggestions] + [
+            self._collect(child) for _, child in node.edges.values()
+        ]
+        top = []
+        seen = set()
+        for suggestion in heapq.merge(*(sorted(c) for c in candidates)):
+            identity = suggestion[1:3]
+            if identity in seen:
+                continue
+            seen.add(identity)
+            top.append(suggestion)
+            if len(top) == self.max_results:
+                break
+        node.top = tuple(top)
+        return node.top
+
+    def complete(self, prefix: str) -> tuple[Suggestion, ...]:
+        """Return the precomputed best completions for a prefix"""
+        node = self.root
+        while prefix:
+            edge = node.edges.get(prefix[0])
+            if edge is None:
+                return ()
+            label, child = edge
+            if prefix.startswith(label):
+                prefix = prefix[len(label) :]
+            elif label.startswith(prefix):
+                prefix = ""
+            else:
+                return ()
+            node = child
+        return node.top
+
+
+def _name_keys(name: str) -> list[str]:
+    """Index the name from the start of every word ("Adult Red Dragon" -> "red dragon", ...)"""
+    words = name.lower().split()
+    return [" ".join(words[i:]) for i in range(len(words))]
+
+
+def _rank_value(kind: EntityKind, record: Record) -> float:
+    """Power ranking used for the CR order"""
+    if kind == EntityKind.MONSTER:
+        return record["challenge_rating"]
+    if kind == EntityKind.ITEM:
+        return RARITY_RANK.get(record["rarity"], 0)
+    return 0
+
+
+def _sort_key(order: AutocompleteOrder, kind: EntityKind, record: Record) -> tuple:
+    name_key = (record["name"].lower(), record["id"])
+    if order == AutocompleteOrder.CHALLENGE:
+        return (-_rank_value(kind, record), *name_key)
+    return name_key
+
+
+def _load_records(kind: EntityKind) -> list[Record]:
+    loaders = {
+        EntityKind.MONSTER: load_monsters,
+        EntityKind.ITEM: load_items,
+        EntityKind.CHARACTER: load_characters,
+    }
+    return loaders[kind]()
+
+
+@lru_cache(maxsize=None)
+def get_autocomplete_trie(kind: EntityKind, order: AutocompleteOrder) -> RadixTrie:
+    """Build and cache the trie for one entity kind ranked by one order"""
+    trie = RadixTrie(settings.autocomplete_max_results)
+    for record in _load_records(kind):
+        suggestion = (_sort_key(order, kind, record), kind, record["id"], record["name"])
+        for key in _name_keys(record["name"]):
+            trie.insert(key, suggestion)
+    trie.finalize()
+    return trie
+
+
+def autocomplete(
+    prefix: str,
+    kinds: set[EntityKind],
+    order: AutocompleteOrder = AutocompleteOrder.CHALLENGE,
+    limit: int = 10,
+) -> list[tuple[EntityKind, int, str]]:
+    """
+    Complete a typed prefix against catalog names.
+
+    Args:
+        prefix: Text typed so far (case-insensitive, matches the start of any word)
+        kinds: Entity kinds to include
+        order: Ranking for the suggestions
+        limit: Maximum number of suggestions
+
+    Returns:
+        List of (kind, id, name) tuples, best first
+    """
+    prefix = " ".join(prefix.lower().split())
+    per_kind = [
+        get_autocomplete_trie(kind, order).complete(prefix)
+        for kind in EntityKind
+        if kind in kinds
+    ]
+    merged = heapq.merge(*per_kind)
+    return [suggestion[1:] for suggestion in islice(merged, limit)]
@@ -1,81 +1,106 @@
 """Character service for business logic and character generation"""
 
-import random
+import numpy as np
+
 from app.models import Character, Class, Race, Alignment, Stats
 from app.services.data_loader import load_character_names, load_character_traits
-from app.utils import roll_ability_score
-
-
-def generate_random_stats() -> Stats:
-    """Generate random ability scores using 4d6 drop lowest"""
-    return Stats(
-        strength=roll_ability_score(),
-        dexterity=roll_ability_score(),
-        constitution=roll_ability_score(),
-        intelligence=roll_ability_score(),
-        wisdom=roll_ability_score(),
-        charisma=roll_ability_score(),
-    )
+from app.services.generated_store import allocate_ids
+from app.utils import rng
 
+STAT_FIELDS = ("strength", "dexterity", "constitution", "intelligence", "wisdom", "charisma")
 
-def generate_random_name(race: Race, class_: Class) -> str:
-    """Generate a random character name based on race"""
-    names_data = load_character_names()
-    return random.choice(names_data.get(race.value, ["Adventurer"]))
+# Most characters one /characters/random call may generate
+MAX_RANDOM_CHARACTERS = 5000
+
+
+def roll_ability_scores(count: int) -> np.ndarray:
+    """(count, 6) ability scores: 4d6 drop lowest over one (count, 6, 4) draw"""
+    rolls = rng.generator().integers(1, 7, size=(count, len(STAT_FIELDS), 4))
+    return rolls.sum(axis=2) - rolls.min(axis=2)
 
 
-def generate_random_description(
-    name: str, race: Race, class_: Class, alignment: Alignment
-) -> str:
-    """Generate a character description using race, class, and alignment"""
+def _pick_from(lists: list[list[str]], draws: np.ndarray) -> list[str]:
+    """One element of each list, indexed by a uniform [0, 1) draw"""
+    return [options[int(draw * len(options))] for options, draw in zip(lists, draws)]
+
+
+def generate_random_names(races: list[Race]) -> list[str]:
+    """Generate a random character name for each race"""
+    names_data = load_character_names()
+    draws = rng.generator().random(len(races))
+    return _pick_from([names_data.get(r.value, ["Adventurer"]) for r in races], draws)
+
 
+def generate_random_descriptions(
+    names: list[str], races: list[Race], classes: list[Class], alignments: list[Alignment]
+) -> list[str]:
+    """Generate a description for each character from its race, class, and alignment"""
     traits_data = load_character_traits()
+    draws = rng.generator().random((4, len(names)))
 
-    # Build the description using data from JSON
-    trait = random.choice(
-        traits_data["class_traits"].get(class_.value, ["adventurous"])
+    # Pick every part for the whole batch using data from JSON
+    traits = _pick_from(
+        [traits_data["class_traits"].get(c.value, ["adventurous"]) for c in classes], draws[0]
     )
-    motivation = random.choice(
-        traits_data["alignment_motivations"].get(
-            alignment.value, ["seeks their destiny"]
-        )
+    motivations = _pick_from(
+        [
+            traits_data["alignment_motivations"].get(a.value, ["seeks their destiny"])
+            for a in alignments
+        ],
+        draws[1],
     )
-    background = random.choice(
-        traits_data["race_backgrounds"].get(race.value, ["from distant lands"])
+    backgrounds = _pick_from(
+        [traits_data["race_backgrounds"].get(r.value, ["from distant lands"]) for r in races],
+        draws[2],
     )
+    templates = _pick_from([traits_data["description_templates"]] * len(names), draws[3])
 
-    # Format the template
-    template = random.choice(traits_data["description_templates"])
-    return template.format(
-        name=name,
-        trait=trait,
-        race=race.value,
-        class_=class_.value,
-        background=background,
-        motivation=motivation,
-    )
+    # Format the templates
+    return [
+        template.format(
+            name=name,
+            trait=trait,
+            race=race.value,
+            class_=class_.value,
+            background=background,
+            motivation=motivation,
+        )
+        for name, race, class_, template, trait, background, motivation in zip(
+            names, races, classes, templates, traits, backgrounds, motivations
+        )
+    ]
 
 
 def generate_random_character() -> Character:
     """Generate a completely random D&D character"""
+    return generate_random_characters(1)[0]
 
-    # Random selections
-    race = random.choice(list(Race))
-    class_ = random.choice(list(Class))
-    alignment = random.choice(list(Alignment))
-    stats = generate_random_stats()
-    name = generate_random_name(race, class_)
-    description = generate_random_description(name, race, class_, alignment)
-
-    # Generate a random ID (in production, this would come from database)
-    character_id = random.randint(1000, 9999)
-
-    return Character(
-        id=character_id,
-        name=name,
-        race=race,
-        alignment=alignment,
-        description=description,
-        stats=stats,
-        **{"class": class_},  # Use dict unpacking to handle the alias
-    )
+
+def generate_random_characters(count: int) -> list[Character]:
+    """
+    Generate many random characters at once.
+
+    Ability scores, races, classes, alignments, ids and every name and
+    description choice are drawn as arrays for the whole batch; the loops
+    only format strings and build the models.
+    """
+    races = rng.choices(list(Race), count)
+    classes = rng.choices(list(Class), count)
+    alignments = rng.choices(list(Alignment), count)
+    scores = roll_ability_scores(count).tolist()
+    character_ids = allocate_ids(count)
+    names = generate_random_names(races)
+    descriptions = generate_random_descriptions(names, races, classes, alignments)
+
+    return [
+        Character(
+            id=character_ids[i],
+            name=names[i],
+            race=races[i],
+            alignment=alignments[i],
+            description=descriptions[i],
+            stats=Stats(**dict(zip(STAT_FIELDS, scores[i]))),
+            **{"class": classes[i]},  # Use dict unpacking to handle the alias
+        )
+        for i in range(count)
+    ]
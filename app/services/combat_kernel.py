@@ -0,0 +1,190 @@
+"""
+Core attack, damage and saving throw rules on plain records
+
+Everything here takes and returns primitives and slotted dataclasses, so
+hot paths (batches, sessions, simulations) resolve rolls without building
+or validating pydantic models. combat_service converts at the HTTP edge.
+"""
+
+from dataclasses import dataclass
+
+from app.models.combat import AdvantageType
+from app.utils import rng
+from app.utils.dice_expression import compile_dice
+
+
+@dataclass(slots=True)
+class AttackOutcome:
+    """A resolved attack roll (fields match AttackRollResponse)"""
+
+    roll: int
+    second_roll: int | None
+    attack_bonus: int
+    total: int
+    armor_class: int
+    hit: bool
+    critical_hit: bool
+    critical_miss: bool
+    advantage: AdvantageType
+
+
+@dataclass(slots=True)
+class DamageOutcome:
+    """A resolved damage roll (fields match DamageRollResponse less damage_type)"""
+
+    rolls: list[int]
+    modifier: int
+    total: int
+    critical_hit: bool
+
+
+@dataclass(slots=True)
+class SaveOutcome:
+    """A resolved saving throw (fields match SavingThrowResponse)"""
+
+    roll: int
+    second_roll: int | None
+    ability_modifier: int
+    proficiency_bonus: int
+    total: int
+    dc: int
+    success: bool
+    natural_20: bool
+    natural_1: bool
+    advantage: AdvantageType
+
+
+def select_d20(
+    advantage: AdvantageType, roll1: int, roll2: int | None
+) -> tuple[int, int | None]:
+    """
+    Pick the kept d20 from already-rolled dice.
+
+    Returns:
+        Tuple of (primary_roll, second_roll) as for roll_d20_with_advantage
+    """
+    if advantage == AdvantageType.NORMAL:
+        return roll1, None
+    if advantage == AdvantageType.ADVANTAGE:
+        return max(roll1, roll2), min(roll1, roll2)
+    else:  # DISADVANTAGE
+        return min(roll1, roll2), max(roll1, roll2)
+
+
+def roll_d20_with_advantage(advantage: AdvantageType) -> tuple[int, int | None]:
+    """
+    Roll a d20 with advantage, disadvantage, or normal.
+
+    Args:
+        advantage: Type of advantage on the roll
+
+    Returns:
+        Tuple of (primary_roll, second_roll)
+        - For normal: (roll, None)
+        - For advantage/disadvantage: (selected_roll, other_roll)
+    """
+    roll1 = rng.randint(1, 20)
+
+    if advantage == AdvantageType.NORMAL:
+        return roll1, None
+
+    roll2 = rng.randint(1, 20)
+    return select_d20(advantage, roll1, roll2)
+
+
+def resolve_attack(
+    attack_bonus: int,
+    armor_class: int,
+    advantage: AdvantageType,
+    roll: int,
+    second_roll: int | None,
+) -> AttackOutcome:
+    """Determine hit and critical status for an already-rolled attack"""
+    total = roll + attack_bonus
+
+    # Natural 20 is always a crit, natural 1 is always a miss
+    critical_hit = roll == 20
+    critical_miss = roll == 1
+    hit = critical_hit or (not critical_miss and total >= armor_class)
+
+    return AttackOutcome(
+        roll=roll,
+        second_roll=second_roll,
+        attack_bonus=attack_bonus,
+        total=total,
+        armor_class=armor_class,
+        hit=hit,
+        critical_hit=critical_hit,
+        critical_miss=critical_miss,
+        advantage=advantage,
+    )
+
+
+def attack_roll(
+    attack_bonus: int, armor_class: int, advantage: AdvantageType = AdvantageType.NORMAL
+) -> AttackOutcome:
+    """Roll an attack against an armor class"""
+    roll, second_roll = roll_d20_with_advantage(advantage)
+    return resolve_attack(attack_bonus, armor_class, advantage, roll, second_roll)
+
+
+def damage_roll(notation: str, critical_hit: bool = False) -> DamageOutcome:
+    """Roll damage dice; a critical hit doubles the dice, not the modifier"""
+    expression = compile_dice(notation)
+    if critical_hit:
+        expression = expression.doubled
+    rolls = expression.roll().rolls
+    return resolve_damage(rolls, expression.constant, critical_hit)
+
+
+def resolve_damage(rolls: list[int], modifier: int, critical_hit: bool) -> DamageOutcome:
+    """Total already-rolled damage dice"""
+    return DamageOutcome(rolls, modifier, sum(rolls) + modifier, critical_hit)
+
+
+def resolve_save(
+    ability_modifier: int,
+    proficiency_bonus: int,
+    dc: int,
+    advantage: AdvantageType,
+    roll: int,
+    second_roll: int | None,
+) -> SaveOutcome:
+    """Determine success for an already-rolled saving throw"""
+    total = roll + ability_modifier + proficiency_bonus
+    return SaveOutcome(
+        roll=roll,
+        second_roll=second_roll,
+        ability_modifier=ability_modifier,
+        proficiency_bonus=proficiency_bonus,
+        total=total,
+        dc=dc,
+        success=total >= dc,
+        natural_20=roll == 20,
+        natural_1=roll == 1,
+        advantage=advantage,
+    )
+
+
+def saving_throw(
+    ability_modifier: int,
+    proficiency_bonus: int,
+    dc: int,
+    advantage: AdvantageType = AdvantageType.NORMAL,
+) -> SaveOutcome:
+    """Roll a saving throw against a DC"""
+    roll, second_roll = roll_d20_with_advantage(advantage)
+    return resolve_save(ability_modifier, proficiency_bonus, dc, advantage, roll, second_roll)
+
+
+def full_combat(
+    attack_bonus: int,
+    armor_class: int,
+    damage_dice: str,
+    advantage: AdvantageType = AdvantageType.NORMAL,
+) -> tuple[AttackOutcome, DamageOutcome | None]:
+    """Roll an attack and, if it hits, its damage (doubled dice on a crit)"""
+    attack = attack_roll(attack_bonus, armor_class, advantage)
+    if not attack.hit:
+        return attack, None
+    return attack, damage_roll(damage_dice, attack.critical_hit)
@@ -1,6 +1,11 @@
-"""Service for combat calculations including attacks, damage, and saving throws"""
+"""Service for combat calculations including attacks, damage, and saving throws
+
+Requests are validated once at the HTTP edge; the kernel works on plain
+records, and responses are read off its outcomes by attribute.
+"""
+
+from collections import Counter
 
-import random
 from app.models.combat import (
     AdvantageType,
     AttackRollRequest,
@@ -11,33 +16,59 @@ from app.models.combat import (
     SavingThrowResponse,
     CombatCalculatorRequest,
     CombatCalculatorResponse,
+    BatchAttackRollRequest,
+    BatchAttackRollResponse,
+    BatchDamageRollRequest,
+    BatchDamageRollResponse,
+    BatchSavingThrowRequest,
+    BatchSavingThrowResponse,
+    BatchCombatRequest,
+    BatchCombatResponse,
+    DamageType,
 )
-from app.utils.dice import parse_dice_notation
-
-
-def roll_d20_with_advantage(advantage: AdvantageType) -> tuple[int, int | None]:
-    """
-    Roll a d20 with advantage, disadvantage, or normal.
-
-    Args:
-        advantage: Type of advantage on the roll
-
-    Returns:
-        Tuple of (primary_roll, second_roll)
-        - For normal: (roll, None)
-        - For advantage/disadvantage: (selected_roll, other_roll)
-    """
-    roll1 = random.randint(1, 20)
-
-    if advantage == AdvantageType.NORMAL:
-        return roll1, None
+from app.services.combat_kernel import (
+    AttackOutcome,
+    DamageOutcome,
+    SaveOutcome,
+    damage_roll,
+    full_combat,
+    resolve_attack,
+    resolve_damage,
+    resolve_save,
+    roll_d20_with_advantage,
+    select_d20,
+)
+from app.utils import rng
+from app.utils.dice_expression import compile_dice
+
+
+def attack_response(
+    outcome: AttackOutcome, response_model: type[AttackRollResponse] = AttackRollResponse
+) -> AttackRollResponse:
+    """Wrap a kernel attack outcome in its response model"""
+    return response_model.model_validate(outcome, from_attributes=True)
+
+
+def damage_response(
+    outcome: DamageOutcome,
+    damage_type: DamageType,
+    response_model: type[DamageRollResponse] = DamageRollResponse,
+) -> DamageRollResponse:
+    """Wrap a kernel damage outcome in its response model"""
+    return response_model(
+        rolls=outcome.rolls,
+        modifier=outcome.modifier,
+        total=outcome.total,
+        damage_type=damage_type,
+        critical_hit=outcome.critical_hit,
+    )
 
-    roll2 = random.randint(1, 20)
 
-    if advantage == AdvantageType.ADVANTAGE:
-        return max(roll1, roll2), min(roll1, roll2)
-    else:  # DISADVANTAGE
-        return min(roll1, roll2), max(roll1, roll2)
+def save_response(
+    outcome: SaveOutcome, response_model: type[SavingThrowResponse] = SavingThrowResponse
+) -> SavingThrowResponse:
+    """Wrap a kernel saving throw outcome in its response model"""
+    return response_model.model_validate(outcome, from_attributes=True)
 
 
 def calculate_attack_roll(request: AttackRollRequest) -> AttackRollResponse:
@@ -51,31 +82,10 @@ def calculate_attack_roll(request: AttackRollRequest) -> AttackRollResponse:
         Attack roll result with hit determination
     """
     roll, second_roll = roll_d20_with_advantage(request.advantage)
-    total = roll + request.attack_bonus
-
-    # Natural 20 is always a crit, natural 1 is always a miss
-    critical_hit = roll == 20
-    critical_miss = roll == 1
-
-    # Determine if attack hits (natural 20 always hits, natural 1 always misses)
-    if critical_hit:
-        hit = True
-    elif critical_miss:
-        hit = False
-    else:
-        hit = total >= request.armor_class
-
-    return AttackRollResponse(
-        roll=roll,
-        second_roll=second_roll,
-        attack_bonus=request.attack_bonus,
-        total=total,
-        armor_class=request.armor_class,
-        hit=hit,
-        critical_hit=critical_hit,
-        critical_miss=critical_miss,
-        advantage=request.advantage,
+    outcome = resolve_attack(
+        request.attack_bonus, request.armor_class, request.advantage, roll, second_roll
     )
+    return attack_response(outcome)
 
 
 def calculate_damage_roll(request: DamageRollRequest) -> DamageRollResponse:
@@ -88,23 +98,8 @@ def calculate_damage_roll(request: DamageRollRequest) -> DamageRollResponse:
     Returns:
         Damage roll result
     """
-    num_dice, die_size, modifier = parse_dice_notation(request.damage_dice)
-
-    # On a critical hit, double the number of dice (not the modifier)
-    if request.critical_hit:
-        num_dice *= 2
-
-    # Roll each die individually to show breakdown
-    rolls = [random.randint(1, die_size) for _ in range(num_dice)]
-    total = sum(rolls) + modifier
-
-    return DamageRollResponse(
-        rolls=rolls,
-        modifier=modifier,
-        total=total,
-        damage_type=request.damage_type,
-        critical_hit=request.critical_hit,
-    )
+    outcome = damage_roll(request.damage_dice, request.critical_hit)
+    return damage_response(outcome, request.damage_type)
 
 
 def calculate_saving_throw(request: SavingThrowRequest) -> SavingThrowResponse:
@@ -118,24 +113,15 @@ def calculate_saving_throw(request: SavingThrowRequest) -> SavingThrowResponse:
         Saving throw result with success determination
     """
     roll, second_roll = roll_d20_with_advantage(request.advantage)
-    total = roll + request.ability_modifier + request.proficiency_bonus
-
-    success = total >= request.dc
-    natural_20 = roll == 20
-    natural_1 = roll == 1
-
-    return SavingThrowResponse(
-        roll=roll,
-        second_roll=second_roll,
-        ability_modifier=request.ability_modifier,
-        proficiency_bonus=request.proficiency_bonus,
-        total=total,
-        dc=request.dc,
-        success=success,
-        natural_20=natural_20,
-        natural_1=natural_1,
-        advantage=request.advantage,
+    outcome = resolve_save(
+        request.ability_modifier,
+        request.proficiency_bonus,
+        request.dc,
+        request.advantage,
+        roll,
+        second_roll,
     )
+    return save_response(outcome)
 
 
 def calculate_full_combat(request: CombatCalculatorRequest) -> CombatCalculatorResponse:
@@ -148,25 +134,112 @@ def calculate_full_combat(request: CombatCalculatorRequest) -> CombatCalculatorR
     Returns:
         Complete combat result with attack and optional damage
     """
-    # Calculate attack roll
-    attack_request = AttackRollRequest(
-        attack_bonus=request.attack_bonus,
-        armor_class=request.armor_class,
-        advantage=request.advantage,
+    attack, damage = full_combat(
+        request.attack_bonus, request.armor_class, request.damage_dice, request.advantage
     )
-    attack_result = calculate_attack_roll(attack_request)
-
-    # If attack hits, calculate damage
-    damage_result = None
-    if attack_result.hit:
-        damage_request = DamageRollRequest(
-            damage_dice=request.damage_dice,
-            damage_type=request.damage_type,
-            critical_hit=attack_result.critical_hit,
-        )
-        damage_result = calculate_damage_roll(damage_request)
-
     return CombatCalculatorResponse(
-        attack=attack_result,
-        damage=damage_result,
+        attack=attack_response(attack),
+        damage=None if damage is None else damage_response(damage, request.damage_type),
     )
+
+
+def _d20s_needed(advantage: AdvantageType) -> int:
+    return 1 if advantage == AdvantageType.NORMAL else 2
+
+
+def resolve_combat_batch(requests: list) -> list:
+    """
+    Resolve a heterogeneous batch of rolls in one pass.
+
+    Every d20 and every damage die the batch could need is generated up
+    front with one vectorized draw per die size (full-combat entries reserve
+    crit-doubled dice), then entries consume them in order. Expressions
+    beyond plain XdY±Z are rolled individually from the thread's buffers.
+
+    Args:
+        requests: Batch entries (attack rolls, damage rolls, saves, full combat)
+
+    Returns:
+        One result per entry, in request order
+    """
+    generator = rng.generator()
+
+    d20_count = 0
+    dice_counts: Counter[int] = Counter()
+    for request in requests:
+        if not isinstance(request, BatchDamageRollRequest):
+            d20_count += _d20s_needed(request.advantage)
+        if isinstance(request, (BatchDamageRollRequest, BatchCombatRequest)):
+            simple = compile_dice(request.damage_dice).as_simple()
+            if simple is None:
+                continue  # Full expressions roll individually below
+            num_dice, die_size, _ = simple
+            doubled = isinstance(request, BatchCombatRequest) or request.critical_hit
+            dice_counts[die_size] += num_dice * 2 if doubled else num_dice
+
+    d20s = iter(generator.integers(1, 21, size=d20_count).tolist())
+    dice_pools = {
+        die_size: iter(generator.integers(1, die_size + 1, size=count).tolist())
+        for die_size, count in dice_counts.items()
+    }
+
+    def next_d20(advantage: AdvantageType) -> tuple[int, int | None]:
+        roll1 = next(d20s)
+        roll2 = next(d20s) if advantage != AdvantageType.NORMAL else None
+        return select_d20(advantage, roll1, roll2)
+
+    def next_damage(notation: str, critical_hit: bool) -> tuple[list[int], int]:
+        expression = compile_dice(notation)
+        simple = expression.as_simple()
+        if simple is None:
+            if critical_hit:
+                expression = expression.doubled
+            return expression.roll().rolls, expression.constant
+
+        num_dice, die_size, modifier = simple
+        if critical_hit:
+            num_dice *= 2
+        pool = dice_pools[die_size]
+        return [next(pool) for _ in range(num_dice)], modifier
+
+    results = []
+    for request in requests:
+        if isinstance(request, BatchAttackRollRequest):
+            roll, second_roll = next_d20(request.advantage)
+            outcome = resolve_attack(
+                request.attack_bonus, request.armor_class, request.advantage, roll, second_roll
+            )
+            results.append(attack_response(outcome, BatchAttackRollResponse))
+        elif isinstance(request, BatchDamageRollRequest):
+            rolls, modifier = next_damage(request.damage_dice, request.critical_hit)
+            outcome = resolve_damage(rolls, modifier, request.critical_hit)
+            results.append(
+                damage_response(outcome, request.damage_type, BatchDamageRollResponse)
+            )
+        elif isinstance(request, BatchSavingThrowRequest):
+            roll, second_roll = next_d20(request.advantage)
+            outcome = resolve_save(
+                request.ability_modifier,
+                request.proficiency_bonus,
+                request.dc,
+                request.advantage,
+                roll,
+                second_roll,
+            )
+            results.append(save_response(outcome, BatchSavingThrowResponse))
+        else:
+            roll, second_roll = next_d20(request.advantage)
+            attack = resolve_attack(
+                request.attack_bonus, request.armor_class, request.advantage, roll, second_roll
+            )
+            damage = None
+            if attack.hit:
+                rolls, modifier = next_damage(request.damage_dice, attack.critical_hit)
+                damage = damage_response(
+                    resolve_damage(rolls, modifier, attack.critical_hit), request.damage_type
+                )
+            results.append(
+                BatchCombatResponse(attack=attack_response(attack), damage=damage)
+            )
+
+    return results
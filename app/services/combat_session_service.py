@@ -0,0 +1,384 @@
+"""Stateful combat sessions: initiative, hit points and conditions per table"""
+
+import threading
+import uuid
+from array import array
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+
+from app.config import settings
+from app.models import (
+    CombatSessionCreateRequest,
+    Condition,
+    SessionAttackRequest,
+    SessionConditionsRequest,
+    SessionDamageRequest,
+    SessionHealRequest,
+    SessionSavingThrowRequest,
+)
+from app.models.combat import AdvantageType, DamageType
+from app.services import combat_kernel
+from app.services.query_utils import Record
+from app.services.ttl_store import TTLStore
+from app.utils import calculate_modifier, rng
+
+# Conditions and damage types are stored as bitmasks indexed like these lists
+CONDITIONS = list(Condition)
+DAMAGE_TYPES = list(DamageType)
+
+NO_MONSTER = -1
+
+# Attack roll modifiers from conditions (attacks are treated as melee)
+ATTACKER_ADVANTAGE = {Condition.INVISIBLE}
+ATTACKER_DISADVANTAGE = {
+    Condition.BLINDED,
+    Condition.FRIGHTENED,
+    Condition.POISONED,
+    Condition.PRONE,
+    Condition.RESTRAINED,
+}
+TARGET_ADVANTAGE = {
+    Condition.BLINDED,
+    Condition.PARALYZED,
+    Condition.PETRIFIED,
+    Condition.PRONE,
+    Condition.RESTRAINED,
+    Condition.STUNNED,
+    Condition.UNCONSCIOUS,
+}
+TARGET_DISADVANTAGE = {Condition.INVISIBLE}
+
+
+def to_mask(values, members: list) -> int:
+    """Pack enum values into a bitmask"""
+    mask = 0
+    for value in values:
+        mask |= 1 << members.index(value)
+    return mask
+
+
+def from_mask(mask: int, members: list) -> list:
+    """Unpack a bitmask into enum values"""
+    return [member for index, member in enumerate(members) if mask >> index & 1]
+
+
+@dataclass(slots=True)
+class CombatSession:
+    """
+    One table's combat, stored column-wise: slot i of every array is the
+    i-th combatant in initiative order. A session with a dozen combatants
+    takes a few hundred bytes, so thousands fit comfortably in memory.
+    """
+
+    id: str
+    names: list[str]
+    monster_ids: array  # NO_MONSTER for custom combatants
+    initiative: array
+    hit_points: array
+    max_hit_points: array
+    armor_class: array
+    conditions: array  # Condition bitmask
+    resistances: array  # DamageType bitmasks
+    immunities: array
+    vulnerabilities: array
+    round: int = 1
+    turn: int = 0
+    # Reentrant so a command and the state snapshot after it share one hold
+    lock: threading.RLock = field(default_factory=threading.RLock, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+@lru_cache(maxsize=1)
+def get_session_store() -> TTLStore[str, CombatSession]:
+    """Sessions expire after COMBAT_SESSION_TTL_SECONDS without being used"""
+    return TTLStore(
+        settings.combat_session_max_entries,
+        settings.combat_session_ttl_seconds,
+        sliding=True,
+    )
+
+
+def _combatant_row(spec, monster: Record | None) -> tuple:
+    """Resolve a spec (plus its catalog monster) into one row of session columns"""
+    resistances = set(spec.resistances)
+    immunities = set(spec.immunities)
+    vulnerabilities = set(spec.vulnerabilities)
+    if monster is not None:
+        resistances.update(DamageType(t.lower()) for t in monster.get("damage_resistances") or [])
+        immunities.update(DamageType(t.lower()) for t in monster.get("damage_immunities") or [])
+        vulnerabilities.update(
+            DamageType(t.lower()) for t in monster.get("damage_vulnerabilities") or []
+        )
+        name = spec.name or monster["name"]
+        hit_points = spec.hit_points or monster["hit_points"]
+        armor_class = spec.armor_class or monster["armor_class"]
+        bonus = spec.initiative_bonus
+        if bonus is None:
+            bonus = calculate_modifier(monster["stats"]["dexterity"])
+    else:
+        name, hit_points, armor_class = spec.name, spec.hit_points, spec.armor_class
+        bonus = spec.initiative_bonus or 0
+
+    initiative = spec.initiative if spec.initiative is not None else rng.randint(1, 20) + bonus
+    return (
+        (initiative, bonus),
+        name,
+        NO_MONSTER if monster is None else monster["id"],
+        initiative,
+        hit_points,
+        armor_class,
+        to_mask(resistances, DAMAGE_TYPES),
+        to_mask(immunities, DAMAGE_TYPES),
+        to_mask(vulnerabilities, DAMAGE_TYPES),
+    )
+
+
+def create_session(request: CombatSessionCreateRequest, monsters: list[Record]) -> CombatSession:
+    """
+    Roll initiative and store a new session.
+
+    Args:
+        request: Combatants to add
+        monsters: Catalog records for the specs with a monster_id, in order
+
+    Returns:
+        The stored session, combatants sorted by initiative (ties by bonus)
+    """
+    catalog = iter(monsters)
+    rows = [
+        _combatant_row(spec, next(catalog) if spec.monster_id is not None else None)
+        for spec in request.combatants
+    ]
+    rows.sort(key=lambda row: row[0], reverse=True)
+    _, names, monster_ids, initiative, hit_points, armor_class, resist, immune, vulnerable = zip(
+        *rows
+    )
+
+    session = CombatSession(
+        id=uuid.uuid4().hex,
+        names=list(names),
+        monster_ids=array("i", monster_ids),
+        initiative=array("h", initiative),
+        hit_points=array("i", hit_points),
+        max_hit_points=array("i", hit_points),
+        armor_class=array("h", armor_class),
+        conditions=array("I", [0] * len(rows)),
+        resistances=array("H", resist),
+        immunities=array("H", immune),
+        vulnerabilities=array("H", vulnerable),
+    )
+    get_session_store().put(session.id, session)
+    return session
+
+
+def get_session(session_id: str) -> CombatSession | None:
+    """Look up a live session, refreshing its idle timeout"""
+    return get_session_store().get(session_id)
+
+
+def delete_session(session_id: str) -> bool:
+    """End a session; returns False if it did not exist"""
+    return get_session_store().pop(session_id) is not None
+
+
+def combatant_state(session: CombatSession, slot: int) -> dict:
+    """One slot as a CombatantState dict"""
+    monster_id = session.monster_ids[slot]
+    return {
+        "slot": slot,
+        "name": session.names[slot],
+        "monster_id": None if monster_id == NO_MONSTER else monster_id,
+        "initiative": session.initiative[slot],
+        "hit_points": session.hit_points[slot],
+        "max_hit_points": session.max_hit_points[slot],
+        "armor_class": session.armor_class[slot],
+        "conditions": from_mask(session.conditions[slot], CONDITIONS),
+        "resistances": from_mask(session.resistances[slot], DAMAGE_TYPES),
+        "immunities": from_mask(session.immunities[slot], DAMAGE_TYPES),
+        "vulnerabilities": from_mask(session.vulnerabilities[slot], DAMAGE_TYPES),
+        "defeated": session.hit_points[slot] == 0,
+    }
+
+
+def session_state(session: CombatSession) -> dict:
+    """The whole session as a CombatSessionResponse dict"""
+    return {
+        "id": session.id,
+        "round": session.round,
+        "turn": session.turn,
+        "combatants": [combatant_state(session, slot) for slot in range(len(session))],
+    }
+
+
+def _take_damage(session: CombatSession, slot: int, amount: int, damage_type: DamageType) -> dict:
+    """
+    Apply damage through the slot's defenses (PHB order: immunity, then
+    resistance, then vulnerability) and return a DamageApplied dict.
+    """
+    bit = 1 << DAMAGE_TYPES.index(damage_type)
+    applied = amount
+    defenses = []
+    if session.immunities[slot] & bit:
+        applied = 0
+        defenses.append("immune")
+    else:
+        if session.resistances[slot] & bit:
+            applied //= 2
+            defenses.append("resistant")
+        if session.vulnerabilities[slot] & bit:
+            applied *= 2
+            defenses.append("vulnerable")
+
+    session.hit_points[slot] = max(0, session.hit_points[slot] - applied)
+    return {"rolled": amount, "applied": applied, "defenses": defenses}
+
+
+def _attack_advantage(session: CombatSession, request: SessionAttackRequest) -> AdvantageType:
+    """Combine requested advantage with condition effects; any of both cancels out"""
+    advantage = request.advantage == AdvantageType.ADVANTAGE
+    disadvantage = request.advantage == AdvantageType.DISADVANTAGE
+
+    target = set(from_mask(session.conditions[request.target], CONDITIONS))
+    advantage |= bool(target & TARGET_ADVANTAGE)
+    disadvantage |= bool(target & TARGET_DISADVANTAGE)
+    if request.attacker is not None:
+        attacker = set(from_mask(session.conditions[request.attacker], CONDITIONS))
+        advantage |= bool(attacker & ATTACKER_ADVANTAGE)
+        disadvantage |= bool(attacker & ATTACKER_DISADVANTAGE)
+
+    if advantage == disadvantage:
+        return AdvantageType.NORMAL
+    return AdvantageType.ADVANTAGE if advantage else AdvantageType.DISADVANTAGE
+
+
+def attack(session: CombatSession, request: SessionAttackRequest) -> dict:
+    """
+    Roll an attack against a session combatant and apply any damage.
+
+    The target's AC, resistances and immunities come from the session, and
+    the attacker's and target's conditions grant advantage or disadvantage.
+
+    Returns:
+        Dictionary matching SessionAttackResponse
+    """
+    with session.lock:
+        attack_outcome, damage_outcome = combat_kernel.full_combat(
+            request.attack_bonus,
+            session.armor_class[request.target],
+            request.damage_dice,
+            _attack_advantage(session, request),
+        )
+        result = {"attack": asdict(attack_outcome), "damage": None}
+        damage = None
+        if damage_outcome is not None:
+            result["damage"] = {**asdict(damage_outcome), "damage_type": request.damage_type}
+            amount = max(0, damage_outcome.total)
+            damage = _take_damage(session, request.target, amount, request.damage_type)
+        return {
+            "result": result,
+            "damage": damage,
+            "target": combatant_state(session, request.target),
+        }
+
+
+def apply_damage(session: CombatSession, request: SessionDamageRequest) -> dict:
+    """Apply already-rolled damage; returns a SessionDamageResponse dict"""
+    with session.lock:
+        damage = _take_damage(session, request.target, request.amount, request.damage_type)
+        return {"damage": damage, "target": combatant_state(session, request.target)}
+
+
+def saving_throw(session: CombatSession, request: SessionSavingThrowRequest) -> dict:
+    """
+    Roll a combatant's saving throw and apply any damage riding on it.
+
+    A failed save takes the full damage; a success takes half (or none
+    when half_on_success is off). Damage goes through the combatant's
+    defenses.
+
+    Returns:
+        Dictionary matching SessionSavingThrowResponse
+    """
+    with session.lock:
+        result = combat_kernel.saving_throw(
+            request.ability_modifier, request.proficiency_bonus, request.dc, request.advantage
+        )
+        damage = None
+        if request.damage is not None:
+            amount = request.damage
+            if result.success:
+                amount = amount // 2 if request.half_on_success else 0
+            damage = _take_damage(session, request.target, amount, request.damage_type)
+        return {
+            "result": asdict(result),
+            "damage": damage,
+            "target": combatant_state(session, request.target),
+        }
+
+
+def heal(session: CombatSession, request: SessionHealRequest) -> dict:
+    """Restore hit points up to the maximum; returns a CombatantState dict"""
+    with session.lock:
+        slot = request.target
+        session.hit_points[slot] = min(
+            session.max_hit_points[slot], session.hit_points[slot] + request.amount
+        )
+        return combatant_state(session, slot)
+
+
+def update_conditions(session: CombatSession, request: SessionConditionsRequest) -> dict:
+    """Add then remove conditions; returns a CombatantState dict"""
+    with session.lock:
+        slot = request.target
+        mask = session.conditions[slot] | to_mask(request.add, CONDITIONS)
+        session.conditions[slot] = mask & ~to_mask(request.remove, CONDITIONS)
+        return combatant_state(session, slot)
+
+
+def next_turn(session: CombatSession) -> dict:
+    """
+    Advance to the next combatant still standing, starting a new round
+    after the last slot. Returns the CombatSessionResponse dict.
+    """
+    with session.lock:
+        for _ in range(len(session)):
+            session.turn += 1
+            if session.turn == len(session):
+                session.turn = 0
+                session.round += 1
+            if session.hit_points[session.turn] > 0:
+                break
+        return session_state(session)
+
+
+COMMANDS = {
+    "attack": attack,
+    "damage": apply_damage,
+    "saving-throw": saving_throw,
+    "heal": heal,
+    "conditions": update_conditions,
+    "next-turn": lambda session, command: next_turn(session),
+}
+
+
+def command_slots(command) -> list[int]:
+    """Slots a command refers to, for validation against the session size"""
+    return [
+        slot
+        for slot in (getattr(command, "attacker", None), getattr(command, "target", None))
+        if slot is not None
+    ]
+
+
+def run_command(session: CombatSession, command) -> tuple[dict, dict]:
+    """
+    Resolve a tagged session command.
+
+    Returns the matching endpoint's response dict and the session state
+    right after it, taken under the same lock so no other command lands
+    between them.
+    """
+    with session.lock:
+        return COMMANDS[command.type](session, command), session_state(session)
@@ -0,0 +1,203 @@
+"""Encounter building against the DMG XP budget"""
+
+import math
+import random
+from collections import Counter
+from functools import reduce
+
+from app.models import EncounterBuildRequest, EncounterDifficulty
+from app.services.data_loader import load_monsters
+from app.services.query_utils import Record, filter_records
+from app.utils import calculate_encounter_multiplier, calculate_party_thresholds
+
+DIFFICULTIES = list(EncounterDifficulty)
+
+
+def resolve_party_levels(request: EncounterBuildRequest) -> list[int]:
+    """Expand a single shared level to the whole party"""
+    if request.party_size is not None and len(request.party_levels) == 1:
+        return request.party_levels * request.party_size
+    return list(request.party_levels)
+
+
+def target_xp_range(
+    thresholds: tuple[int, ...], difficulty: EncounterDifficulty
+) -> tuple[int, int]:
+    """
+    Adjusted-XP window for a difficulty: from its threshold up to the next one.
+
+    Deadly has no upper threshold, so its window extends by the hard-to-deadly gap.
+    """
+    index = DIFFICULTIES.index(difficulty)
+    low = thresholds[index]
+    if index + 1 < len(thresholds):
+        return low, thresholds[index + 1] - 1
+    return low, low + (low - thresholds[index - 1])
+
+
+def rate_difficulty(thresholds: tuple[int, ...], adjusted_xp: int) -> EncounterDifficulty:
+    """Return the highest difficulty whose threshold the adjusted XP reaches"""
+    rating = EncounterDifficulty.EASY
+    for difficulty, threshold in zip(DIFFICULTIES, thresholds):
+        if adjusted_xp >= threshold:
+            rating = difficulty
+    return rating
+
+
+def _candidate_predicates(request: EncounterBuildRequest) -> list:
+    predicates = [lambda monster: monster["experience_points"] > 0]
+    if request.monster_type:
+        predicates.append(lambda monster: monster["type"] == request.monster_type.value)
+    if request.size:
+        predicates.append(lambda monster: monster["size"] == request.size.value)
+    if request.min_cr is not None:
+        predicates.append(lambda monster: monster["challenge_rating"] >= request.min_cr)
+    if request.max_cr is not None:
+        predicates.append(lambda monster: monster["challenge_rating"] <= request.max_cr)
+    return predicates
+
+
+def _reachable_sums(weights: list[int], max_count: int, max_sum: int) -> list[int]:
+    """
+    Unbounded knapsack with a count dimension, using ints as bitsets.
+
+    Bit s of reach[c] is set when some multiset of exactly c weights sums to s.
+    Each weight is a whole XP bucket, so the work depends on the number of
+    distinct XP values (at most ~34 CRs), never on how many monsters matched.
+    """
+    mask = (1 << (max_sum + 1)) - 1
+    reach = [1] + [0] * max_count
+    for weight in weights:
+        # Ascending count lets the same weight be used repeatedly
+        for count in range(max_count):
+            reach[count + 1] |= (reach[count] << weight) & mask
+    return reach
+
+
+def _sums_in_window(bits: int, low: int, high: int) -> list[int]:
+    if high < low:
+        return []
+    window = (bits >> low) & ((1 << (high - low + 1)) - 1)
+    sums = []
+    while window:
+        lowest = window & -window
+        sums.append(low + lowest.bit_length() - 1)
+        window ^= lowest
+    return sums
+
+
+def _reconstruct(
+    reach: list[int], weights: list[int], count: int, total: int, rng: random.Random
+) -> list[int]:
+    """Walk back through the reachable sums, preferring to repeat the last weight"""
+    picks: list[int] = []
+    previous = None
+    for remaining in range(count, 0, -1):
+        order = rng.sample(weights, len(weights))
+        if previous is not None:
+            order.remove(previous)
+            order.insert(0, previous)
+        for weight in order:
+            rest = total - weight
+            if rest >= 0 and (reach[remaining - 1] >> rest) & 1:
+                picks.append(weight)
+                total = rest
+                previous = weight
+                break
+    return picks
+
+
+def build_encounters(request: EncounterBuildRequest) -> dict:
+    """
+    Suggest catalog encounters whose adjusted XP lands in the target difficulty.
+
+    Args:
+        request: Party composition, difficulty and monster filters
+
+    Returns:
+        Dictionary matching EncounterBuildResponse
+    """
+    rng = random.Random()
+    party_levels = resolve_party_levels(request)
+    party_size = len(party_levels)
+    thresholds = calculate_party_thresholds(party_levels)
+    low, high = target_xp_range(thresholds, request.difficulty)
+
+    candidates = filter_records(load_monsters(), _candidate_predicates(request))
+    buckets: dict[int, list[Record]] = {}
+    for monster in candidates:
+        buckets.setdefault(monster["experience_points"], []).append(monster)
+
+    encounters = []
+    if buckets:
+        scale = reduce(math.gcd, buckets)
+        weights = [xp // scale for xp in sorted(buckets)]
+
+        # Raw XP window for each monster count, after dividing out the multiplier
+        windows = {}
+        for count in range(1, request.max_monsters + 1):
+            multiplier = calculate_encounter_multiplier(count, party_size)
+            windows[count] = (
+                math.ceil(low / (multiplier * scale)),
+                math.floor(high / (multiplier * scale)),
+                multiplier,
+            )
+        max_sum = max(window[1] for window in windows.values())
+        reach = _reachable_sums(weights, request.max_monsters, max_sum)
+
+        feasible = {
+            count: sums
+            for count, (window_low, window_high, _) in windows.items()
+            if (sums := _sums_in_window(reach[count], window_low, window_high))
+        }
+
+        seen = set()
+        counts = list(feasible)
+        rng.shuffle(counts)
+        for attempt in range(request.suggestions * 4):
+            if len(encounters) == request.suggestions or not counts:
+                break
+            count = counts[attempt % len(counts)]
+            total = rng.choice(feasible[count])
+            picks = _reconstruct(reach, weights, count, total, rng)
+
+            groups = [
+                (rng.choice(buckets[weight * scale]), group_count)
+                for weight, group_count in Counter(picks).items()
+            ]
+            key = tuple(sorted((monster["id"], n) for monster, n in groups))
+            if key in seen:
+                continue
+            seen.add(key)
+
+            multiplier = windows[count][2]
+            total_xp = total * scale
+            adjusted_xp = int(total_xp * multiplier)
+            encounters.append(
+                {
+                    "monsters": [
+                        {
+                            "id": monster["id"],
+                            "name": monster["name"],
+                            "challenge_rating": monster["challenge_rating"],
+                            "experience_points": monster["experience_points"],
+                            "count": group_count,
+                        }
+                        for monster, group_count in groups
+                    ],
+                    "monster_count": count,
+                    "total_xp": total_xp,
+                    "multiplier": multiplier,
+                    "adjusted_xp": adjusted_xp,
+                    "difficulty": rate_difficulty(thresholds, adjusted_xp),
+                }
+            )
+
+    return {
+        "party_size": party_size,
+        "thresholds": dict(zip(DIFFICULTIES, thresholds)),
+        "target_min_xp": low,
+        "target_max_xp": high,
+        "candidates": len(candidates),
+        "encounters": encounters,
+    }
@@ -0,0 +1,365 @@
+"""Vectorized party-vs-monster encounter simulation"""
+
+import math
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from app.models import EncounterSimulationRequest, PartyMember, SavingThrowAbility
+from app.services.data_loader import load_monsters
+from app.services.query_utils import Record
+from app.services.simulation_service import PERCENTILES
+from app.utils import calculate_modifier, calculate_proficiency_bonus, rng
+from app.utils.dice_expression import DiceExpression, compile_dice
+
+ABILITIES = list(SavingThrowAbility)
+PARTY, MONSTERS = 0, 1
+SIDE_NAMES = ("party", "monsters")
+
+HIT_POINT_BINS = 20
+
+# Fights simulated per pass; progress is reported between passes
+BATCH_TRIALS = 10_000
+
+# Save-based area actions (breath weapons etc.) recharge on a d6 roll of 5-6
+RECHARGE_MIN = 5
+
+MULTIATTACK_COUNTS = {"two": 2, "three": 3, "four": 4}
+
+# Attacks that only work on an already disabled target (e.g. a mind flayer's
+# Extract Brain) are finishers, not the routine a monster repeats each turn
+CONDITIONAL_ATTACK = re.compile(
+    r"\bagainst an? (incapacitated|grappled|restrained|paralyzed|stunned|unconscious)\b"
+)
+
+
+@dataclass
+class Combatant:
+    """Combat profile shared by every simulated fight"""
+
+    name: str
+    side: int
+    hit_points: int
+    armor_class: int
+    initiative_bonus: int
+    save_bonuses: list[int]  # Indexed like ABILITIES
+    attacks: int = 0
+    attack_bonus: int = 0
+    damage: DiceExpression | None = None
+    damage_type: str | None = None
+    defenses: dict[str, float] = field(default_factory=dict)  # Damage type -> multiplier
+    area_damage: DiceExpression | None = None
+    area_damage_type: str | None = None
+    area_dc: int = 0
+    area_ability: int = 0
+    area_half_on_save: bool = True
+
+
+def party_combatant(member: PartyMember) -> Combatant:
+    """Build a combat profile from a request party member"""
+    return Combatant(
+        name=member.name,
+        side=PARTY,
+        hit_points=member.hit_points,
+        armor_class=member.armor_class,
+        initiative_bonus=member.initiative_bonus,
+        save_bonuses=[member.save_bonuses.get(ability, 0) for ability in ABILITIES],
+        attacks=member.attacks,
+        attack_bonus=member.attack_bonus,
+        damage=compile_dice(member.damage_dice),
+        damage_type=member.damage_type.value,
+    )
+
+
+def monster_combatant(monster: Record) -> Combatant:
+    """
+    Build a combat profile from a catalog monster.
+
+    The monster attacks with its highest-average attack action, as many
+    times as its Multiattack says; attacks restricted to a disabled target
+    are skipped. A damaging action without an attack
+    bonus is treated as a save-for-half area effect (recharge 5-6) that hits
+    every standing party member; its DC and ability come from the
+    description when present, otherwise 8 + proficiency + Con, vs Dexterity.
+    """
+    stats = monster["stats"]
+    saving_throws = monster.get("saving_throws") or {}
+    save_bonuses = [
+        saving_throws.get(ability.value, calculate_modifier(stats[ability.value]))
+        for ability in ABILITIES
+    ]
+
+    defenses = {}
+    for key, multiplier in (
+        ("damage_vulnerabilities", 2.0),
+        ("damage_resistances", 0.5),
+        ("damage_immunities", 0.0),
+    ):
+        for damage_type in monster.get(key) or []:
+            defenses[damage_type.lower()] = multiplier
+
+    combatant = Combatant(
+        name=monster["name"],
+        side=MONSTERS,
+        hit_points=monster["hit_points"],
+        armor_class=monster["armor_class"],
+        initiative_bonus=calculate_modifier(stats["dexterity"]),
+        save_bonuses=save_bonuses,
+        defenses=defenses,
+    )
+
+    actions = monster.get("actions") or []
+    attacks = [
+        a
+        for a in actions
+        if a.get("damage_dice")
+        and a.get("attack_bonus") is not None
+        and not CONDITIONAL_ATTACK.search(a["description"].lower())
+    ]
+    areas = [a for a in actions if a.get("damage_dice") and a.get("attack_bonus") is None]
+
+    if attacks:
+        best = max(attacks, key=lambda action: compile_dice(action["damage_dice"]).mean)
+        combatant.attacks = 1
+        combatant.attack_bonus = best["attack_bonus"]
+        combatant.damage = compile_dice(best["damage_dice"])
+        combatant.damage_type = (best.get("damage_type") or "").lower()
+        for action in actions:
+            match = re.search(r"makes (\w+) attacks", action["description"].lower())
+            if action["name"].lower() == "multiattack" and match:
+                combatant.attacks = MULTIATTACK_COUNTS.get(match[1], 1)
+
+    if areas:
+        area = max(areas, key=lambda action: compile_dice(action["damage_dice"]).mean)
+        description = area["description"].lower()
+        dc = re.search(r"dc (\d+)", description)
+        ability = re.search(rf"({'|'.join(a.value for a in ABILITIES)}) saving throw", description)
+        proficiency = calculate_proficiency_bonus(max(1, math.ceil(monster["challenge_rating"])))
+
+        combatant.area_damage = compile_dice(area["damage_dice"])
+        combatant.area_damage_type = (area.get("damage_type") or "").lower()
+        combatant.area_dc = (
+            int(dc[1]) if dc else 8 + proficiency + calculate_modifier(stats["constitution"])
+        )
+        combatant.area_ability = ABILITIES.index(
+            SavingThrowAbility(ability[1]) if ability else SavingThrowAbility.DEXTERITY
+        )
+        combatant.area_half_on_save = "half" in description or "breath" in area["name"].lower()
+
+    return combatant
+
+
+def find_monsters(monster_ids: list[int]) -> tuple[list[Record], list[int]]:
+    """Look up catalog monsters, keeping repeats; also return unknown ids"""
+    by_id = {monster["id"]: monster for monster in load_monsters()}
+    missing = sorted({monster_id for monster_id in monster_ids if monster_id not in by_id})
+    return [by_id[monster_id] for monster_id in monster_ids if monster_id in by_id], missing
+
+
+def _pick_targets(
+    standing: np.ndarray, generator: np.random.Generator
+) -> tuple[np.ndarray, np.ndarray]:
+    """Uniformly pick one standing column per row; also flag rows with any"""
+    counts = standing.sum(axis=1)
+    pick = (generator.random(standing.shape[0]) * counts).astype(np.int64)
+    ranks = np.cumsum(standing, axis=1) - 1
+    return (standing & (ranks == pick[:, None])).argmax(axis=1), counts > 0
+
+
+def run_fights(
+    combatants: list[Combatant],
+    trials: int,
+    max_rounds: int,
+    generator: np.random.Generator,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Fight every trial to the end at once, one initiative slot at a time.
+
+    Each trial has its own initiative order, so slot k holds a different
+    combatant in each trial; per-combatant profiles are gathered by index
+    and all dice for a round are drawn in bulk before the slots run.
+
+    Returns:
+        (hit points remaining per trial and combatant, rounds per trial,
+        winning side per trial or -1 if unresolved)
+    """
+    count = len(combatants)
+    fights = np.arange(trials)
+    side = np.array([c.side for c in combatants])
+    party_cols = np.flatnonzero(side == PARTY)
+    monster_cols = np.flatnonzero(side == MONSTERS)
+
+    armor_class = np.array([c.armor_class for c in combatants])
+    attack_bonus = np.array([c.attack_bonus for c in combatants])
+    attacks = np.array([c.attacks for c in combatants])
+    saves = np.array([c.save_bonuses for c in combatants])
+    has_area = np.array([c.area_damage is not None for c in combatants])
+    area_dc = np.array([c.area_dc for c in combatants])
+    area_ability = np.array([c.area_ability for c in combatants])
+    area_half = np.array([c.area_half_on_save for c in combatants])
+    weapon_multiplier = np.array(
+        [[target.defenses.get(c.damage_type, 1.0) for target in combatants] for c in combatants]
+    )
+    area_multiplier = np.array(
+        [[target.defenses.get(c.area_damage_type, 1.0) for target in combatants] for c in combatants]
+    )
+    enemies = side[:, None] != side[None, :]
+
+    hp = np.tile(np.array([c.hit_points for c in combatants], dtype=np.int64), (trials, 1))
+    initiative = (
+        generator.integers(1, 21, size=(trials, count))
+        + np.array([c.initiative_bonus for c in combatants])
+        + generator.random((trials, count))  # Random tie-break
+    )
+    order = np.argsort(-initiative, axis=1)
+    charged = np.tile(has_area, (trials, 1))
+
+    ended = np.zeros(trials, dtype=bool)
+    rounds = np.full(trials, max_rounds)
+    winner = np.full(trials, -1)
+    max_attacks = int(attacks.max())
+
+    for round_number in range(1, max_rounds + 1):
+        weapon = np.zeros((count, trials, max(max_attacks, 1)), dtype=np.int64)
+        critical = np.zeros_like(weapon)
+        area = np.zeros((count, trials), dtype=np.int64)
+        for index, combatant in enumerate(combatants):
+            if combatant.attacks:
+                size = trials * combatant.attacks
+                shape = (trials, combatant.attacks)
+                weapon[index, :, : combatant.attacks] = combatant.damage.sample(generator, size).reshape(shape)
+                critical[index, :, : combatant.attacks] = combatant.damage.doubled.sample(
+                    generator, size
+                ).reshape(shape)
+            if combatant.area_damage is not None:
+                area[index] = combatant.area_damage.sample(generator, trials)
+
+        for slot in range(count):
+            actor = order[:, slot]
+            active = ~ended & (hp[fights, actor] > 0)
+            if not active.any():
+                continue
+
+            using_area = np.zeros(trials, dtype=bool)
+            if has_area.any():
+                recharging = active & has_area[actor] & ~charged[fights, actor]
+                if recharging.any():
+                    charged[fights[recharging], actor[recharging]] = (
+                        generator.integers(1, 7, size=int(recharging.sum())) >= RECHARGE_MIN
+                    )
+                using_area = active & has_area[actor] & charged[fights, actor]
+                if using_area.any():
+                    charged[fights[using_area], actor[using_area]] = False
+                    rolled = area[actor, fights]
+                    for target in range(count):
+                        affected = using_area & enemies[actor, target] & (hp[:, target] > 0)
+                        if not affected.any():
+                            continue
+                        saved = (
+                            generator.integers(1, 21, size=trials) + saves[target, area_ability[actor]]
+                            >= area_dc[actor]
+                        )
+                        damage = np.where(saved, np.where(area_half[actor], rolled // 2, 0), rolled)
+                        damage = np.floor(damage * area_multiplier[actor, target]).astype(np.int64)
+                        hp[:, target] -= np.where(affected, np.maximum(damage, 0), 0)
+
+            swinging = active & ~using_area
+            actor_is_party = side[actor] == PARTY
+            for attack in range(max_attacks):
+                swinging &= attacks[actor] > attack
+                if not swinging.any():
+                    break
+                standing = hp > 0
+                on_monster, any_monster = _pick_targets(standing[:, monster_cols], generator)
+                on_party, any_party = _pick_targets(standing[:, party_cols], generator)
+                target = np.where(actor_is_party, monster_cols[on_monster], party_cols[on_party])
+                swinging &= np.where(actor_is_party, any_monster, any_party)
+
+                d20 = generator.integers(1, 21, size=trials)
+                crit = d20 == 20
+                hit = swinging & (
+                    crit | ((d20 != 1) & (d20 + attack_bonus[actor] >= armor_class[target]))
+                )
+                damage = np.where(crit, critical[actor, fights, attack], weapon[actor, fights, attack])
+                damage = np.floor(damage * weapon_multiplier[actor, target]).astype(np.int64)
+                hp[fights, target] -= np.where(hit, np.maximum(damage, 0), 0)
+
+            standing = hp > 0
+            party_up = standing[:, party_cols].any(axis=1)
+            monsters_up = standing[:, monster_cols].any(axis=1)
+            finished = ~ended & ~(party_up & monsters_up)
+            if finished.any():
+                rounds[finished] = round_number
+                winner[finished] = np.where(party_up[finished], PARTY, MONSTERS)
+                ended |= finished
+
+        if ended.all():
+            break
+
+    return np.maximum(hp, 0), rounds, winner
+
+
+def simulate_encounter(
+    request: EncounterSimulationRequest,
+    monsters: list[Record],
+    progress: Callable[[float], None] | None = None,
+) -> dict:
+    """
+    Simulate a party fighting catalog monsters many times.
+
+    Args:
+        request: Party, monster ids, trial count and round limit
+        monsters: Catalog records for request.monster_ids (see find_monsters)
+        progress: Optional callback with the fraction of fights done
+
+    Returns:
+        Dictionary matching EncounterSimulationResponse
+    """
+    combatants = [party_combatant(member) for member in request.party]
+    combatants += [monster_combatant(monster) for monster in monsters]
+    generator = rng.generator() if request.seed is None else np.random.default_rng(request.seed)
+
+    batches = []
+    for start in range(0, request.trials, BATCH_TRIALS):
+        size = min(BATCH_TRIALS, request.trials - start)
+        batches.append(run_fights(combatants, size, request.max_rounds, generator))
+        if progress is not None:
+            progress((start + size) / request.trials)
+    hp, rounds, winner = (np.concatenate(parts) for parts in zip(*batches))
+
+    party_cols = [i for i, c in enumerate(combatants) if c.side == PARTY]
+    party_hp = hp[:, party_cols].sum(axis=1)
+    party_max = sum(combatants[i].hit_points for i in party_cols)
+    edges = np.unique(np.linspace(0, party_max + 1, HIT_POINT_BINS + 1).astype(np.int64))
+    counts, _ = np.histogram(party_hp, bins=edges)
+
+    return {
+        "trials": request.trials,
+        "party_win_probability": float(np.mean(winner == PARTY)),
+        "monster_win_probability": float(np.mean(winner == MONSTERS)),
+        "unresolved_probability": float(np.mean(winner == -1)),
+        "expected_rounds": float(rounds.mean()),
+        "party_hit_points": {
+            f"p{p}": int(np.percentile(party_hp, p, method="inverted_cdf")) for p in PERCENTILES
+        },
+        "party_hit_points_distribution": [
+            {
+                "min_hit_points": int(low),
+                "max_hit_points": int(high) - 1,
+                "probability": float(n / request.trials),
+            }
+            for low, high, n in zip(edges[:-1], edges[1:], counts)
+        ],
+        "combatants": [
+            {
+                "name": combatant.name,
+                "side": SIDE_NAMES[combatant.side],
+                "max_hit_points": combatant.hit_points,
+                "survival_probability": float(np.mean(hp[:, index] > 0)),
+                "mean_hit_points": float(hp[:, index].mean()),
+            }
+            for index, combatant in enumerate(combatants)
+        ],
+    }
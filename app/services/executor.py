@@ -0,0 +1,79 @@
+"""Worker pool for CPU-bound simulation chunks"""
+
+import multiprocessing
+import os
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from typing import TypeVar
+
+from app.config import settings
+
+T = TypeVar("T")
+
+
+def running_on_lambda() -> bool:
+    """Lambda has no /dev/shm, so multiprocessing pools cannot start there"""
+    return "AWS_LAMBDA_FUNCTION_NAME" in os.environ
+
+
+def worker_count() -> int:
+    return settings.simulation_workers or os.cpu_count() or 1
+
+
+@lru_cache(maxsize=1)
+def get_executor() -> Executor | None:
+    """
+    Create the shared simulation pool on first use.
+
+    Returns None when work should run in-process: on Lambda, on single-core
+    hosts, or when SIMULATION_EXECUTOR is "inline".
+    """
+    if settings.simulation_executor == "inline" or running_on_lambda() or worker_count() < 2:
+        return None
+
+    # Forking a threaded server is unsafe; start workers from a clean process
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+    return ProcessPoolExecutor(max_workers=worker_count(), mp_context=context)
+
+
+def shutdown_executor() -> None:
+    """Stop the shared pool if one was started"""
+    if get_executor.cache_info().currsize:
+        executor = get_executor()
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        get_executor.cache_clear()
+
+
+def run_chunks(
+    function: Callable[..., T],
+    chunks: Iterable[tuple],
+    executor: Executor | None = None,
+    on_result: Callable[[int, int], None] | None = None,
+) -> list[T]:
+    """
+    Apply function to each argument tuple, on the executor when given.
+
+    Results come back in chunk order either way, so merging them is
+    deterministic regardless of where the chunks ran. on_result is called
+    with (done, total) after each chunk; if it raises, pending chunks are
+    cancelled.
+    """
+    chunks = list(chunks)
+    if executor is None or len(chunks) < 2:
+        results_iter = (function(*args) for args in chunks)
+    else:
+        results_iter = executor.map(function, *zip(*chunks))
+
+    results = []
+    try:
+        for result in results_iter:
+            results.append(result)
+            if on_result is not None:
+                on_result(len(results), len(chunks))
+    finally:
+        # Closing executor.map's iterator cancels the chunks not yet started
+        results_iter.close()
+    return results
@@ -0,0 +1,86 @@
+"""Ids and short-term storage for randomly generated monsters and characters"""
+
+import os
+import secrets
+import threading
+import time
+from functools import lru_cache
+
+from app.config import settings
+from app.models import Character, Monster
+from app.services.ttl_store import TTLStore
+
+# Ids are snowflake-style: 41 bits of milliseconds since EPOCH_MS (~69
+# years), a 2-bit sequence within the millisecond, then a 10-bit node id
+# drawn at random per process, so separate processes (e.g. concurrent Lambda
+# containers) almost never mint the same id. 53 bits in all keeps them exact
+# for JSON clients that parse numbers as doubles, far above any catalog id.
+EPOCH_MS = 1_735_689_600_000  # 2025-01-01T00:00:00Z
+SEQUENCE_BITS = 2
+NODE_BITS = 10
+
+
+class IdAllocator:
+    """
+    Monotonic, time-ordered ids for generated entities.
+
+    The time and sequence bits form a tick: each allocation starts at the
+    current millisecond's first tick or just past the last tick handed
+    out, whichever is later, so ids never repeat within a process even
+    across clock steps backwards or bursts beyond the sequence (which
+    borrow ticks from the following milliseconds).
+    """
+
+    def __init__(self, clock=time.time, node: int | None = None):
+        self._clock = clock
+        self.node = secrets.randbits(NODE_BITS) if node is None else node
+        self._last = 0
+        self._lock = threading.Lock()
+
+    def allocate(self, count: int = 1) -> range:
+        """Reserve count increasing ids, spaced 2**NODE_BITS apart"""
+        now = (int(self._clock() * 1000) - EPOCH_MS) << SEQUENCE_BITS
+        with self._lock:
+            start = max(self._last + 1, now)
+            self._last = start + count - 1
+        return range(
+            start << NODE_BITS | self.node, (start + count) << NODE_BITS | self.node, 1 << NODE_BITS
+        )
+
+
+@lru_cache(maxsize=1)
+def get_id_allocator() -> IdAllocator:
+    return IdAllocator()
+
+
+# A forked worker would otherwise share its parent's node id
+os.register_at_fork(after_in_child=get_id_allocator.cache_clear)
+
+
+def allocate_ids(count: int) -> range:
+    """Ids for a batch of generated entities"""
+    return get_id_allocator().allocate(count)
+
+
+@lru_cache(maxsize=1)
+def get_generated_monsters() -> TTLStore[int, Monster]:
+    """Generated monsters, kept GENERATED_STORE_TTL_SECONDS after they are served"""
+    return TTLStore(settings.generated_store_max_entries, settings.generated_store_ttl_seconds)
+
+
+@lru_cache(maxsize=1)
+def get_generated_characters() -> TTLStore[int, Character]:
+    """Generated characters, kept GENERATED_STORE_TTL_SECONDS after they are served"""
+    return TTLStore(settings.generated_store_max_entries, settings.generated_store_ttl_seconds)
+
+
+def remember_monsters(monsters: list[Monster]) -> list[Monster]:
+    """Store served monsters so they can be fetched again by id"""
+    get_generated_monsters().put_many((monster.id, monster) for monster in monsters)
+    return monsters
+
+
+def remember_characters(characters: list[Character]) -> list[Character]:
+    """Store served characters so they can be fetched again by id"""
+    get_generated_characters().put_many((character.id, character) for character in characters)
+    return characters
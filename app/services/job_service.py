@@ -0,0 +1,234 @@
+"""Background jobs for simulations that outlast a request timeout"""
+
+import queue
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import dataclass, field, fields, replace
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any
+
+from pydantic import BaseModel
+
+from app.config import settings
+from app.models import JobKind, JobStatus
+from app.services.encounter_simulation_service import find_monsters, simulate_encounter
+from app.services.simulation_service import simulate_combat
+from app.services.ttl_store import TTLStore
+
+Progress = Callable[[float], None]
+
+
+class JobQueueFull(Exception):
+    """Raised when a job is submitted while the queue is at capacity"""
+
+
+class JobCancelled(Exception):
+    """Raised inside a running job once cancellation has been requested"""
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@dataclass(frozen=True)
+class Job:
+    """Snapshot of a job; updates replace the stored snapshot"""
+
+    id: str
+    kind: JobKind
+    request: BaseModel
+    status: JobStatus = JobStatus.QUEUED
+    progress: float = 0.0
+    submitted_at: datetime = field(default_factory=_now)
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    cancel_requested: bool = False
+
+    def to_dict(self) -> dict:
+        """Public fields, as a JobResponse dict"""
+        return {
+            item.name: getattr(self, item.name)
+            for item in fields(self)
+            if item.name not in ("request", "cancel_requested")
+        }
+
+
+class JobStore(ABC):
+    """
+    Where job snapshots live between submit and poll.
+
+    The in-memory store serves a single instance; a shared backend (Redis,
+    DynamoDB) implementing these three methods lets any instance answer
+    polls for any job.
+    """
+
+    @abstractmethod
+    def get(self, job_id: str) -> Job | None: ...
+
+    @abstractmethod
+    def save(self, job: Job) -> None: ...
+
+    @abstractmethod
+    def delete(self, job_id: str) -> None: ...
+
+
+class InMemoryJobStore(JobStore):
+    """Process-local store; jobs expire ttl_seconds after their last update"""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self._jobs: TTLStore[str, Job] = TTLStore(max_entries, ttl_seconds)
+
+    def get(self, job_id: str) -> Job | None:
+        return self._jobs.get(job_id)
+
+    def save(self, job: Job) -> None:
+        self._jobs.put(job.id, job)
+
+    def delete(self, job_id: str) -> None:
+        self._jobs.pop(job_id)
+
+
+def _run_combat_simulation(request, progress: Progress) -> dict:
+    return simulate_combat(request, progress=progress)
+
+
+def _run_encounter_simulation(request, progress: Progress) -> dict:
+    monsters, missing = find_monsters(request.monster_ids)
+    if missing:
+        raise ValueError(f"Monsters with ids {', '.join(map(str, missing))} not found")
+    return simulate_encounter(request, monsters, progress=progress)
+
+
+JOB_RUNNERS: dict[JobKind, Callable[[Any, Progress], dict]] = {
+    JobKind.COMBAT_SIMULATION: _run_combat_simulation,
+    JobKind.ENCOUNTER_SIMULATION: _run_encounter_simulation,
+}
+
+
+class JobManager:
+    """
+    Bounded queue of jobs drained by a fixed set of worker threads.
+
+    Cancellation is cooperative: queued jobs are dropped immediately, and
+    running jobs stop at their next progress report.
+    """
+
+    def __init__(self, store: JobStore, workers: int, queue_size: int):
+        self.store = store
+        self.workers = workers
+        self._queue: queue.Queue[str | None] = queue.Queue(maxsize=queue_size)
+        self._threads: list[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    def _ensure_workers(self) -> None:
+        with self._lock:
+            if self._threads:
+                return
+            for index in range(self.workers):
+                thread = threading.Thread(target=self._work, name=f"job-worker-{index}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def _update(self, job_id: str, change: Callable[[Job], Job]) -> Job | None:
+        """Apply a change to the stored snapshot under the manager lock"""
+        with self._lock:
+            job = self.store.get(job_id)
+            if job is None:
+                return None
+            updated = change(job)
+            if updated is not job:
+                self.store.save(updated)
+            return updated
+
+    def submit(self, kind: JobKind, request: BaseModel) -> Job:
+        """
+        Queue a job.
+
+        Raises:
+            JobQueueFull: If the queue is at capacity
+        """
+        self._ensure_workers()
+        job = Job(id=uuid.uuid4().hex, kind=kind, request=request)
+        self.store.save(job)
+        try:
+            self._queue.put_nowait(job.id)
+        except queue.Full:
+            self.store.delete(job.id)
+            raise JobQueueFull(f"Job queue is full ({self._queue.maxsize} jobs)") from None
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        return self.store.get(job_id)
+
+    def cancel(self, job_id: str) -> Job | None:
+        """Cancel a queued job or ask a running one to stop; finished jobs are unchanged"""
+
+        def change(job: Job) -> Job:
+            if job.status == JobStatus.QUEUED:
+                return replace(job, status=JobStatus.CANCELLED, finished_at=_now())
+            if job.status == JobStatus.RUNNING:
+                return replace(job, cancel_requested=True)
+            return job
+
+        return self._update(job_id, change)
+
+    def shutdown(self) -> None:
+        """Stop workers after their current job"""
+        for _ in self._threads:
+            self._queue.put(None)
+        self._threads = []
+
+    def _work(self) -> None:
+        while True:
+            job_id = self._queue.get()
+            if job_id is None:
+                return
+            try:
+                self._run(job_id)
+            finally:
+                self._queue.task_done()
+
+    def _run(self, job_id: str) -> None:
+        job = self._update(
+            job_id,
+            lambda job: replace(job, status=JobStatus.RUNNING, started_at=_now())
+            if job.status == JobStatus.QUEUED
+            else job,
+        )
+        if job is None or job.status != JobStatus.RUNNING:
+            return  # Cancelled while queued, or expired
+
+        def progress(fraction: float) -> None:
+            current = self._update(job_id, lambda job: replace(job, progress=fraction))
+            if current is None or current.cancel_requested:
+                raise JobCancelled
+
+        try:
+            result = JOB_RUNNERS[job.kind](job.request, progress)
+        except JobCancelled:
+            self._finish(job_id, status=JobStatus.CANCELLED)
+        except Exception as exc:
+            self._finish(job_id, status=JobStatus.FAILED, error=str(exc))
+        else:
+            self._finish(job_id, status=JobStatus.SUCCEEDED, progress=1.0, result=result)
+
+    def _finish(self, job_id: str, **changes) -> None:
+        self._update(job_id, lambda job: replace(job, finished_at=_now(), **changes))
+
+
+@lru_cache(maxsize=1)
+def get_job_manager() -> JobManager:
+    """Create the process-wide job manager with an in-memory store"""
+    store = InMemoryJobStore(settings.job_store_max_entries, settings.job_result_ttl_seconds)
+    return JobManager(store, settings.job_workers, settings.job_queue_size)
+
+
+def shutdown_job_manager() -> None:
+    """Stop job workers if the manager was started"""
+    if get_job_manager.cache_info().currsize:
+        get_job_manager().shutdown()
@@ -0,0 +1,149 @@
+"""Derived offensive and defensive metrics for every catalog monster"""
+
+from functools import lru_cache
+
+from app.models import DamageType
+from app.config.constants import EFFECTIVE_HP_MULTIPLIERS, MONSTER_STATS_BY_CR
+from app.services.data_loader import load_monsters
+from app.services.encounter_simulation_service import monster_combatant
+from app.services.query_utils import Predicate, Record
+
+# Low, typical and high party armor classes for hit chances
+REFERENCE_ARMOR_CLASSES = (12, 15, 18)
+
+# Weapon damage types whose resistance or immunity raises effective hit points
+WEAPON_DAMAGE_TYPES = {DamageType.BLUDGEONING, DamageType.PIERCING, DamageType.SLASHING}
+
+# Resisting this many damage types of any kind counts like weapon resistance
+MANY_DEFENSES = 3
+
+CR_ROWS = [row[0] for row in MONSTER_STATS_BY_CR]
+
+
+def hit_chance(attack_bonus: int, armor_class: int) -> float:
+    """Chance a d20 + bonus meets the AC; natural 1s miss and 20s hit"""
+    needed = armor_class - attack_bonus
+    return min(0.95, max(0.05, (21 - needed) / 20))
+
+
+def effective_hit_points(monster: Record) -> int:
+    """
+    Hit points scaled by the DMG multiplier for resistances and immunities.
+
+    The multiplier applies when the monster shrugs off weapon damage or at
+    least three damage types; immunity takes the larger one.
+    """
+    resistances = set(monster.get("damage_resistances") or [])
+    immunities = set(monster.get("damage_immunities") or [])
+    hit_points = monster["hit_points"]
+    if not (
+        (resistances | immunities) & WEAPON_DAMAGE_TYPES
+        or len(resistances | immunities) >= MANY_DEFENSES
+    ):
+        return hit_points
+
+    resist, immune = next(
+        (resist, immune)
+        for max_cr, resist, immune in EFFECTIVE_HP_MULTIPLIERS
+        if monster["challenge_rating"] <= max_cr
+    )
+    immune_to_weapons = bool(immunities & WEAPON_DAMAGE_TYPES)
+    return round(hit_points * (immune if immune_to_weapons else resist))
+
+
+def _row_for(value: float, column: int) -> int:
+    """Index of the first table row whose column covers the value"""
+    return next(
+        (index for index, row in enumerate(MONSTER_STATS_BY_CR) if value <= row[column]),
+        len(MONSTER_STATS_BY_CR) - 1,
+    )
+
+
+def _adjusted(row: int, actual: int, column: int) -> int:
+    """Move one row per 2 points the stat is above or below the row's expected value"""
+    steps = int((actual - MONSTER_STATS_BY_CR[row][column]) / 2)
+    return min(len(CR_ROWS) - 1, max(0, row + steps))
+
+
+def _nearest_cr(value: float) -> float:
+    return min(CR_ROWS, key=lambda cr: (abs(cr - value), cr))
+
+
+def monster_metrics(monster: Record) -> Record:
+    """
+    Threat metrics for one stat block, following the DMG's CR procedure.
+
+    expected_dpr is the average damage per round over three rounds with
+    every attack hitting: the Multiattack routine of the best attack action,
+    or a recharge area action in round one when it out-damages the routine.
+    Defensive CR comes from effective hit points adjusted for AC, offensive
+    CR from damage per round adjusted for attack bonus (or save DC when the
+    area action drives the damage), and calculated_cr is their average.
+    """
+    combatant = monster_combatant(monster)
+    routine = combatant.attacks * combatant.damage.mean if combatant.damage else 0.0
+    area = combatant.area_damage.mean if combatant.area_damage else 0.0
+    area_led = area > routine
+    expected_dpr = (area + 2 * routine) / 3 if area_led else routine
+
+    hit_points = effective_hit_points(monster)
+    defensive = _adjusted(_row_for(hit_points, 2), monster["armor_class"], 1)
+    offensive = _row_for(expected_dpr, 4)
+    if area_led:
+        offensive = _adjusted(offensive, combatant.area_dc, 5)
+    elif combatant.damage:
+        offensive = _adjusted(offensive, combatant.attack_bonus, 3)
+
+    attack_bonus = combatant.attack_bonus if combatant.damage else None
+    return {
+        "expected_dpr": round(expected_dpr, 2),
+        "attack_bonus": attack_bonus,
+        "save_dc": combatant.area_dc if combatant.area_damage else None,
+        **{
+            f"hit_chance_ac{armor_class}": (
+                None if attack_bonus is None else hit_chance(attack_bonus, armor_class)
+            )
+            for armor_class in REFERENCE_ARMOR_CLASSES
+        },
+        "effective_hit_points": hit_points,
+        "offensive_cr": CR_ROWS[offensive],
+        "defensive_cr": CR_ROWS[defensive],
+        "calculated_cr": _nearest_cr((CR_ROWS[offensive] + CR_ROWS[defensive]) / 2),
+    }
+
+
+@lru_cache(maxsize=1)
+def get_monster_metrics() -> dict[int, Record]:
+    """Metrics for the whole catalog, keyed by monster id"""
+    return {monster["id"]: monster_metrics(monster) for monster in load_monsters()}
+
+
+def with_metrics(monster: Record) -> Record:
+    """A copy of a catalog record with its metrics attached"""
+    return {**monster, "metrics": get_monster_metrics()[monster["id"]]}
+
+
+def metric_range_predicates(
+    ranges: dict[str, tuple[float | None, float | None]],
+) -> list[Predicate]:
+    """Predicates keeping monsters whose metrics fall within inclusive ranges"""
+    metrics = get_monster_metrics()
+    predicates = []
+    for field, (low, high) in ranges.items():
+        if low is not None:
+            predicates.append(lambda monster, f=field, v=low: metrics[monster["id"]][f] >= v)
+        if high is not None:
+            predicates.append(lambda monster, f=field, v=high: metrics[monster["id"]][f] <= v)
+    return predicates
+
+
+def sort_monsters(monsters: list[Record], field: str, descending: bool = False) -> list[Record]:
+    """Order by a stat block or metric field; missing values sort last either way"""
+    metrics = get_monster_metrics()
+
+    def value(monster: Record):
+        return monster[field] if field in monster else metrics[monster["id"]][field]
+
+    present = [monster for monster in monsters if value(monster) is not None]
+    missing = [monster for monster in monsters if value(monster) is None]
+    return sorted(present, key=value, reverse=descending) + missing
@@ -1,169 +1,229 @@
 """Monster service for business logic and monster generation"""
 
-import random
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+
 from app.models import Monster, MonsterType, Size, Alignment, Stats, Action, DamageType
 from app.config.constants import XP_BY_CR
 from app.services.data_loader import load_monster_names
-from app.utils import calculate_hp_from_cr, calculate_ac_from_cr, get_xp_by_cr
+from app.services.generated_store import allocate_ids
+from app.utils import calculate_ac_from_cr, calculate_hp_from_cr, rng
+
+STAT_FIELDS = ("strength", "dexterity", "constitution", "intelligence", "wisdom", "charisma")
+
+# Most monsters one /monsters/random call may generate
+MAX_RANDOM_MONSTERS = 500
 
 
 def generate_random_monster_name(monster_type: MonsterType) -> str:
     """Generate a random monster name based on type"""
     names_data = load_monster_names()
 
-    prefix = random.choice(names_data["prefixes"].get(monster_type.value, ["Unknown"]))
-    suffix = random.choice(names_data["suffixes"].get(monster_type.value, ["Creature"]))
+    prefix = rng.choice(names_data["prefixes"].get(monster_type.value, ["Unknown"]))
+    suffix = rng.choice(names_data["suffixes"].get(monster_type.value, ["Creature"]))
 
     return f"{prefix} {suffix}"
 
 
-def generate_random_monster_stats(challenge_rating: float) -> Stats:
-    """Generate monster stats based on challenge rating"""
+def generate_random_monster_stats(challenge_rating: float | np.ndarray) -> Stats | np.ndarray:
+    """
+    Generate monster stats based on challenge rating.
+
+    Given an array of ratings, returns one row of scores per rating in
+    STAT_FIELDS order instead of a Stats.
+    """
     # Base stats scale with CR
-    base_stat = 10 + int(challenge_rating * 1.5)
-    variation = int(challenge_rating / 2) + 1
+    challenge_ratings = np.atleast_1d(np.asarray(challenge_rating, dtype=float))
+    base_stats = 10 + (challenge_ratings * 1.5).astype(np.int64)
+    variations = (challenge_ratings / 2).astype(np.int64) + 1
+    shape = (len(challenge_ratings), len(STAT_FIELDS))
+    offsets = rng.generator().integers(-variations[:, None], variations[:, None] + 1, size=shape)
+    rows = base_stats[:, None] + offsets
+
+    if np.ndim(challenge_rating):
+        return rows
+    return Stats(**dict(zip(STAT_FIELDS, rows[0].tolist())))
 
-    return Stats(
-        strength=base_stat + random.randint(-variation, variation),
-        dexterity=base_stat + random.randint(-variation, variation),
-        constitution=base_stat + random.randint(-variation, variation),
-        intelligence=base_stat + random.randint(-variation, variation),
-        wisdom=base_stat + random.randint(-variation, variation),
-        charisma=base_stat + random.randint(-variation, variation),
-    )
+
+@dataclass(frozen=True, slots=True)
+class ActionTemplate:
+    """
+    An action or trait with its CR-dependent parts left open.
+
+    Attacks get an attack bonus of 2 + CR; damage is a function of CR; one
+    of damage_types is chosen per monster when there are several.
+    """
+
+    name: str
+    description: str
+    attack: bool = False
+    damage: Callable[[float], str] | None = None
+    damage_types: tuple[DamageType, ...] = ()
+    min_cr: float = 0
+
+    def build(self, challenge_rating: float) -> Action:
+        damage_type = None
+        if len(self.damage_types) > 1:
+            damage_type = rng.choice(self.damage_types)
+        elif self.damage_types:
+            damage_type = self.damage_types[0]
+        return Action(
+            name=self.name,
+            description=self.description,
+            attack_bonus=int(2 + challenge_rating) if self.attack else None,
+            damage_dice=self.damage(challenge_rating) if self.damage else None,
+            damage_type=damage_type,
+        )
+
+
+SPECIAL_ABILITY_TEMPLATES: dict[MonsterType, tuple[ActionTemplate, ...]] = {
+    MonsterType.DRAGON: (
+        ActionTemplate(
+            name="Frightful Presence",
+            description="Each creature within 60 feet that is aware of the dragon must succeed on a Wisdom saving throw or become frightened for 1 minute",
+        ),
+    ),
+    MonsterType.UNDEAD: (
+        ActionTemplate(
+            name="Undead Fortitude",
+            description="If damage reduces the creature to 0 hit points, it can make a Constitution saving throw to drop to 1 hit point instead",
+        ),
+    ),
+    MonsterType.ABERRATION: (
+        ActionTemplate(
+            name="Telepathy",
+            description="The creature can communicate telepathically with any creature within 120 feet that has a language",
+        ),
+    ),
+    MonsterType.FIEND: (
+        ActionTemplate(
+            name="Magic Resistance",
+            description="The creature has advantage on saving throws against spells and other magical effects",
+        ),
+    ),
+    MonsterType.CELESTIAL: (
+        ActionTemplate(
+            name="Divine Blessing",
+            description="The creature's weapon attacks are magical and deal an extra 2d8 radiant damage",
+            damage=lambda cr: "2d8",
+            damage_types=(DamageType.RADIANT,),
+        ),
+    ),
+    MonsterType.FEY: (
+        ActionTemplate(
+            name="Fey Ancestry",
+            description="The creature has advantage on saving throws against being charmed, and magic can't put it to sleep",
+        ),
+    ),
+    MonsterType.ELEMENTAL: (
+        ActionTemplate(
+            name="Elemental Body",
+            description="The creature can move through spaces as narrow as 1 inch wide without squeezing",
+        ),
+    ),
+    MonsterType.CONSTRUCT: (
+        ActionTemplate(
+            name="Immutable Form",
+            description="The creature is immune to any spell or effect that would alter its form",
+        ),
+    ),
+    MonsterType.OOZE: (
+        ActionTemplate(
+            name="Amorphous",
+            description="The creature can move through spaces as narrow as 1 inch wide without squeezing",
+        ),
+    ),
+    MonsterType.PLANT: (
+        ActionTemplate(
+            name="False Appearance",
+            description="While motionless, the creature is indistinguishable from a normal plant",
+        ),
+    ),
+    MonsterType.BEAST: (
+        ActionTemplate(
+            name="Keen Senses",
+            description="The creature has advantage on Wisdom (Perception) checks that rely on sight, hearing, or smell",
+            min_cr=2,
+        ),
+    ),
+    MonsterType.GIANT: (
+        ActionTemplate(
+            name="Powerful Build",
+            description="The creature counts as one size larger when determining its carrying capacity and the weight it can push, drag, or lift",
+        ),
+    ),
+}
+
+LEGENDARY_RESISTANCE = ActionTemplate(
+    name="Legendary Resistance (3/Day)",
+    description="If the creature fails a saving throw, it can choose to succeed instead",
+    min_cr=10,
+)
+
+ACTION_TEMPLATES: dict[MonsterType, tuple[ActionTemplate, ...]] = {
+    MonsterType.DRAGON: (
+        ActionTemplate(
+            name="Bite",
+            description="Melee Weapon Attack",
+            attack=True,
+            damage=lambda cr: f"{max(1, int(cr))}d10+{int(cr)}",
+            damage_types=(DamageType.PIERCING,),
+        ),
+        ActionTemplate(
+            name="Breath Weapon",
+            description="Exhales destructive energy in a cone",
+            damage=lambda cr: f"{int(cr * 2)}d6",
+            damage_types=(DamageType.FIRE, DamageType.COLD, DamageType.LIGHTNING),
+        ),
+    ),
+    MonsterType.UNDEAD: (
+        ActionTemplate(
+            name="Life Drain",
+            description="Melee Weapon Attack that drains life force",
+            attack=True,
+            damage=lambda cr: f"{max(1, int(cr / 2))}d6+{int(cr / 2)}",
+            damage_types=(DamageType.NECROTIC,),
+        ),
+    ),
+    MonsterType.BEAST: (
+        ActionTemplate(
+            name="Claw",
+            description="Melee Weapon Attack",
+            attack=True,
+            damage=lambda cr: f"{max(1, int(cr / 2))}d6+{int(cr)}",
+            damage_types=(DamageType.SLASHING,),
+        ),
+    ),
+}
+
+GENERIC_ACTION_TEMPLATES = (
+    ActionTemplate(
+        name="Strike",
+        description="Melee Weapon Attack",
+        attack=True,
+        damage=lambda cr: f"{max(1, int(cr / 2))}d8+{int(cr)}",
+        damage_types=(DamageType.BLUDGEONING, DamageType.PIERCING, DamageType.SLASHING),
+    ),
+)
 
 
 def generate_special_abilities(
     monster_type: MonsterType, challenge_rating: float
 ) -> list[Action] | None:
     """Generate passive abilities and traits based on monster type"""
-
-    abilities_map = {
-        MonsterType.DRAGON: [
-            Action(
-                name="Frightful Presence",
-                description="Each creature within 60 feet that is aware of the dragon must succeed on a Wisdom saving throw or become frightened for 1 minute",
-                attack_bonus=None,
-                damage_dice=None,
-                damage_type=None,
-            ),
-        ],
-        MonsterType.UNDEAD: [
-            Action(
-                name="Undead Fortitude",
-                description="If damage reduces the creature to 0 hit points, it can make a Constitution saving throw to drop to 1 hit point instead",
-                attack_bonus=None,
-                damage_dice=None,
-                damage_type=None,
-            ),
-        ],
-        MonsterType.ABERRATION: [
-            Action(
-                name="Telepathy",
-                description="The creature can communicate telepathically with any creature within 120 feet that has a language",
-                attack_bonus=None,
-                damage_dice=None,
-                damage_type=None,
-            ),
-        ],
-        MonsterType.FIEND: [
-            Action(
-                name="Magic Resistance",
-                description="The creature has advantage on saving throws against spells and other magical effects",
-                attack_bonus=None,
-                damage_dice=None,
-                damage_type=None,
-            ),
-        ],
-        MonsterType.CELESTIAL: [
-            Action(
-                name="Divine Blessing",
-                description="The creature's weapon attacks are magical and deal an extra 2d8 radiant damage",
-                attack_bonus=None,
-                damage_dice="2d8",
-                damage_type=DamageType.RADIANT,
-            ),
-        ],
-        MonsterType.FEY: [
-            Action(
-                name="Fey Ancestry",
-                description="The creature has advantage on saving throws against being charmed, and magic can't put it to sleep",
-                attack_bonus=None,
-                damage_dice=None,
-                damage_type=None,
-            ),
-        ],
-        MonsterType.ELEMENTAL: [
-            Action(
-                name="Elemental Body",
-                description="The creature can move through spaces as narrow as 1 inch wide without squeezing",
-                attack_bonus=None,
-                damage_dice=None,
-                damage_type=None,
-            ),
-        ],
-        MonsterType.CONSTRUCT: [
-            Action(
-                name="Immutable Form",
-                description="The creature is immune to any spell or effect that would alter its form",
-                attack_bonus=None,
-                damage_dice=None,
-                damage_type=None,
-            ),
-        ],
-        MonsterType.OOZE: [
-            Action(
-                name="Amorphous",
-                description="The creature can move through spaces as narrow as 1 inch wide without squeezing",
-                attack_bonus=None,
-                damage_dice=None,
-                damage_type=None,
-            ),
-        ],
-        MonsterType.PLANT: [
-            Action(
-                name="False Appearance",
-                description="While motionless, the creature is indistinguishable from a normal plant",
-                attack_bonus=None,
-                damage_dice=None,
-                damage_type=None,
-            ),
-        ],
-        MonsterType.BEAST: [
-            Action(
-                name="Keen Senses",
-                description="The creature has advantage on Wisdom (Perception) checks that rely on sight, hearing, or smell",
-                attack_bonus=None,
-                damage_dice=None,
-                damage_type=None,
-            ),
-        ]
-        if challenge_rating >= 2
-        else None,
-        MonsterType.GIANT: [
-            Action(
-                name="Powerful Build",
-                description="The creature counts as one size larger when determining its carrying capacity and the weight it can push, drag, or lift",
-                attack_bonus=None,
-                damage_dice=None,
-                damage_type=None,
-            ),
-        ],
-    }
-
-    abilities = abilities_map.get(monster_type)
+    abilities = [
+        template.build(challenge_rating)
+        for template in SPECIAL_ABILITY_TEMPLATES.get(monster_type, ())
+        if challenge_rating >= template.min_cr
+    ]
+    if not abilities:
+        return None
 
     # Add legendary resistance for high CR monsters
-    if challenge_rating >= 10 and abilities:
-        abilities.append(
-            Action(
-                name="Legendary Resistance (3/Day)",
-                description="If the creature fails a saving throw, it can choose to succeed instead",
-                attack_bonus=None,
-                damage_dice=None,
-                damage_type=None,
-            )
-        )
+    if challenge_rating >= LEGENDARY_RESISTANCE.min_cr:
+        abilities.append(LEGENDARY_RESISTANCE.build(challenge_rating))
 
     return abilities
 
@@ -172,78 +232,33 @@ def generate_monster_actions(
     monster_type: MonsterType, challenge_rating: float
 ) -> list[Action]:
     """Generate monster actions based on type and CR"""
+    templates = ACTION_TEMPLATES.get(monster_type, GENERIC_ACTION_TEMPLATES)
+    return [template.build(challenge_rating) for template in templates]
 
-    action_templates = {
-        MonsterType.DRAGON: [
-            Action(
-                name="Bite",
-                description="Melee Weapon Attack",
-                attack_bonus=int(2 + challenge_rating),
-                damage_dice=f"{max(1, int(challenge_rating))}d10+{int(challenge_rating)}",
-                damage_type=DamageType.PIERCING,
-            ),
-            Action(
-                name="Breath Weapon",
-                description="Exhales destructive energy in a cone",
-                damage_dice=f"{int(challenge_rating * 2)}d6",
-                damage_type=random.choice(
-                    [DamageType.FIRE, DamageType.COLD, DamageType.LIGHTNING]
-                ),
-            ),
-        ],
-        MonsterType.UNDEAD: [
-            Action(
-                name="Life Drain",
-                description="Melee Weapon Attack that drains life force",
-                attack_bonus=int(2 + challenge_rating),
-                damage_dice=f"{max(1, int(challenge_rating / 2))}d6+{int(challenge_rating / 2)}",
-                damage_type=DamageType.NECROTIC,
-            ),
-        ],
-        MonsterType.BEAST: [
-            Action(
-                name="Claw",
-                description="Melee Weapon Attack",
-                attack_bonus=int(2 + challenge_rating),
-                damage_dice=f"{max(1, int(challenge_rating / 2))}d6+{int(challenge_rating)}",
-                damage_type=DamageType.SLASHING,
-            ),
-        ],
-    }
-
-    # Return type-specific actions or generic attack
-    actions = action_templates.get(
-        monster_type,
-        [
-            Action(
-                name="Strike",
-                description="Melee Weapon Attack",
-                attack_bonus=int(2 + challenge_rating),
-                damage_dice=f"{max(1, int(challenge_rating / 2))}d8+{int(challenge_rating)}",
-                damage_type=random.choice(
-                    [DamageType.BLUDGEONING, DamageType.PIERCING, DamageType.SLASHING]
-                ),
-            ),
-        ],
-    )
-
-    return actions
 
+def _pick(generator: np.random.Generator, options: list, count: int, fixed=None) -> list:
+    """count random options (or the fixed one), drawn in one call"""
+    if fixed is not None:
+        return [fixed] * count
+    return [options[i] for i in generator.integers(0, len(options), size=count)]
 
-def generate_random_monster(
+
+def generate_random_monsters(
+    count: int,
     monster_type: MonsterType | None = None,
     size: Size | None = None,
     min_cr: float | None = None,
     max_cr: float | None = None,
-) -> Monster:
-    """Generate a random monster with optional constraints"""
-
-    # Random selections
-    if monster_type is None:
-        monster_type = random.choice(list(MonsterType))
+) -> list[Monster]:
+    """
+    Generate random monsters with optional constraints.
 
-    if size is None:
-        size = random.choice(list(Size))
+    Type, size, CR, alignment, ability scores, hit points, AC and speed are
+    drawn as arrays for the whole batch, the stats through the same helpers
+    a single monster would use; names and the per-type template actions are
+    built monster by monster.
+    """
+    generator = rng.generator()
 
     # Generate CR within constraints
     if min_cr is None:
@@ -252,42 +267,60 @@ def generate_random_monster(
         max_cr = 20
 
     cr_options = [0, 0.125, 0.25, 0.5] + list(range(1, 21))
-    valid_crs = [cr for cr in cr_options if min_cr <= cr <= max_cr]
-    challenge_rating = random.choice(valid_crs if valid_crs else [1])
-
-    alignment = random.choice(list(Alignment))
-    name = generate_random_monster_name(monster_type)
-    stats = generate_random_monster_stats(challenge_rating)
-    hit_points, hit_dice = calculate_hp_from_cr(challenge_rating, size)
-    armor_class = calculate_ac_from_cr(challenge_rating)
-    experience_points = XP_BY_CR.get(challenge_rating, int(challenge_rating * 1000))
-    special_abilities = generate_special_abilities(monster_type, challenge_rating)
-    actions = generate_monster_actions(monster_type, challenge_rating)
-
-    # Generate speed based on type
-    speed = {"walk": 30}
-    if monster_type in [MonsterType.DRAGON, MonsterType.FEY, MonsterType.CELESTIAL]:
-        speed["fly"] = 60
-    if monster_type in [MonsterType.BEAST, MonsterType.ELEMENTAL]:
-        if random.random() > 0.5:
+    valid_crs = [cr for cr in cr_options if min_cr <= cr <= max_cr] or [1]
+
+    monster_types = _pick(generator, list(MonsterType), count, monster_type)
+    sizes = _pick(generator, list(Size), count, size)
+    alignments = _pick(generator, list(Alignment), count)
+    crs = _pick(generator, valid_crs, count)
+    challenge_ratings = np.array(crs, dtype=float)
+
+    stat_rows = generate_random_monster_stats(challenge_ratings).tolist()
+    hit_points, hit_dice = calculate_hp_from_cr(challenge_ratings, sizes)
+    armor_classes = calculate_ac_from_cr(challenge_ratings)
+
+    swims = generator.random(count) > 0.5
+    monster_ids = allocate_ids(count)
+
+    monsters = []
+    for i in range(count):
+        kind = monster_types[i]
+        challenge_rating = crs[i]
+
+        # Generate speed based on type
+        speed = {"walk": 30}
+        if kind in [MonsterType.DRAGON, MonsterType.FEY, MonsterType.CELESTIAL]:
+            speed["fly"] = 60
+        if kind in [MonsterType.BEAST, MonsterType.ELEMENTAL] and swims[i]:
             speed["swim"] = 30
 
-    # Generate random ID
-    monster_id = random.randint(1000, 9999)
-
-    return Monster(
-        id=monster_id,
-        name=name,
-        size=size,
-        type=monster_type,
-        alignment=alignment,
-        armor_class=armor_class,
-        hit_points=hit_points,
-        hit_dice=hit_dice,
-        speed=speed,
-        stats=stats,
-        challenge_rating=challenge_rating,
-        special_abilities=special_abilities,
-        experience_points=experience_points,
-        actions=actions,
-    )
+        monsters.append(
+            Monster(
+                id=monster_ids[i],
+                name=generate_random_monster_name(kind),
+                size=sizes[i],
+                type=kind,
+                alignment=alignments[i],
+                armor_class=int(armor_classes[i]),
+                hit_points=int(hit_points[i]),
+                hit_dice=hit_dice[i],
+                speed=speed,
+                stats=Stats(**dict(zip(STAT_FIELDS, stat_rows[i]))),
+                challenge_rating=challenge_rating,
+                special_abilities=generate_special_abilities(kind, challenge_rating),
+                experience_points=XP_BY_CR.get(challenge_rating, int(challenge_rating * 1000)),
+                actions=generate_monster_actions(kind, challenge_rating),
+            )
+        )
+
+    return monsters
+
+
+def generate_random_monster(
+    monster_type: MonsterType | None = None,
+    size: Size | None = None,
+    min_cr: float | None = None,
+    max_cr: float | None = None,
+) -> Monster:
+    """Generate a random monster with optional constraints"""
+    return generate_random_monsters(1, monster_type, size, min_cr, max_cr)[0]
@@ -0,0 +1,178 @@
+"""Typo-tolerant name lookup backed by a BK-tree over catalog names"""
+
+from functools import lru_cache
+
+from app.models.search import EntityKind
+from app.services.data_loader import load_characters, load_items, load_monsters
+from app.services.query_utils import Predicate
+
+# Words shorter than this are too ambiguous to index on their own ("of", "red")
+MIN_WORD_LENGTH = 4
+
+NameEntry = tuple[EntityKind, int, str]
+
+
+def levenshtein(a: str, b: str) -> int:
+    """
+    Compute the edit distance between two strings.
+
+    Args:
+        a: First string
+        b: Second string
+
+    Returns:
+        Minimum number of insertions, deletions and substitutions
+
+    Example:
+        levenshtein("beholdr", "beholder")  # Returns 1
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, start=1):
+        current = [i]
+        for j, char_b in enumerate(b, start=1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (char_a != char_b),
+                )
+            )
+        previous = current
+    return previous[-1]
+
+
+def default_max_distance(query: str) -> int:
+    """Pick an edit-distance bound that scales with the query length"""
+    return 1 if len(query) <= 4 else 2
+
+
+class BKTree:
+    """
+    Burkhard-Keller tree for bounded edit-distance lookups.
+
+    Each child edge is labelled with its distance to the parent term. By the
+    triangle inequality, a query within radius r of some term under a node at
+    distance d can only live under edges labelled d - r .. d + r, so whole
+    subtrees are skipped without computing their distances.
+    """
+
+    def __init__(self):
+        self.root: tuple[str, dict[int, tuple]] | None = None
+        self.payloads: dict[str, list[NameEntry]] = {}
+
+    def add(self, term: str, entry: NameEntry) -> None:
+        """Insert a term, attaching the entity it belongs to"""
+        if term in self.payloads:
+            self.payloads[term].append(entry)
+            return
+        self.payloads[term] = [entry]
+
+        node = (term, {})
+        if self.root is None:
+            self.root = node
+            return
+
+        current = self.root
+        while True:
+            distance = levenshtein(term, current[0])
+            child = current[1].get(distance)
+            if child is None:
+                current[1][distance] = node
+                return
+            current = child
+
+    def search(self, query: str, max_distance: int) -> list[tuple[int, str]]:
+        """
+        Find every indexed term within max_distance of the query.
+
+        Returns:
+            List of (distance, term) pairs
+        """
+        if self.root is None:
+            return []
+
+        results = []
+        stack = [self.root]
+        while stack:
+            term, children = stack.pop()
+            distance = levenshtein(query, term)
+            if distance <= max_distance:
+                results.append((distance, term))
+            for edge in range(distance - max_distance, distance + max_distance + 1):
+                child = children.get(edge)
+                if child is not None:
+                    stack.append(child)
+        return results
+
+
+def _name_terms(name: str) -> set[str]:
+    """Index both the full name and its longer individual words"""
+    lowered = name.lower()
+    words = {word for word in lowered.replace("-", " ").split() if len(word) >= MIN_WORD_LENGTH}
+    return {lowered} | words
+
+
+@lru_cache(maxsize=1)
+def get_name_index() -> BKTree:
+    """Build and cache a BK-tree over all monster, item and character names"""
+    tree = BKTree()
+    catalogs = (
+        (EntityKind.MONSTER, load_monsters()),
+        (EntityKind.ITEM, load_items()),
+        (EntityKind.CHARACTER, load_characters()),
+    )
+    for kind, records in catalogs:
+        for record in records:
+            entry = (kind, record["id"], record["name"])
+            for term in _name_terms(record["name"]):
+                tree.add(term, entry)
+    return tree
+
+
+def find_similar_names(
+    query: str,
+    max_distance: int | None = None,
+    kinds: set[EntityKind] | None = None,
+) -> list[tuple[NameEntry, int]]:
+    """
+    Look up catalog entities whose name (or a word in it) is close to the query.
+
+    Args:
+        query: Possibly misspelled name
+        max_distance: Edit-distance bound (defaults to one scaled by query length)
+        kinds: Entity kinds to include (defaults to all)
+
+    Returns:
+        List of (entry, distance) pairs, closest first
+    """
+    query = query.lower().strip()
+    if max_distance is None:
+        max_distance = default_max_distance(query)
+
+    tree = get_name_index()
+    best: dict[NameEntry, int] = {}
+    for distance, term in tree.search(query, max_distance):
+        for entry in tree.payloads[term]:
+            if kinds is not None and entry[0] not in kinds:
+                continue
+            if distance < best.get(entry, max_distance + 1):
+                best[entry] = distance
+
+    return sorted(best.items(), key=lambda match: (match[1], match[0][2], match[0][1]))
+
+
+def build_name_predicate(kind: EntityKind, name: str, fuzzy: bool = False) -> Predicate:
+    """
+    Build a predicate for the name filter on list endpoints.
+
+    Substring matches always pass; in fuzzy mode, names within the default
+    edit distance of the query pass as well.
+    """
+    name_filter = name.lower()
+    if not fuzzy:
+        return lambda record: name_filter in record["name"].lower()
+
+    fuzzy_ids = {entry[1] for entry, _ in find_similar_names(name, kinds={kind})}
+    return lambda record: record["id"] in fuzzy_ids or name_filter in record["name"].lower()
@@ -0,0 +1,200 @@
+"""Exact probability distributions for attacks, saves and damage"""
+
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+
+import numpy as np
+
+from app.config import settings
+from app.models.combat import (
+    AdvantageType,
+    AttackRollRequest,
+    CombatCalculatorRequest,
+    DamageRollRequest,
+    SavingThrowRequest,
+)
+from app.services.data_loader import load_items, load_monsters
+from app.utils.dice_expression import compile_dice
+
+
+@dataclass(frozen=True)
+class Distribution:
+    """Discrete distribution over consecutive integers starting at offset"""
+
+    offset: int
+    pmf: np.ndarray
+
+    @property
+    def values(self) -> np.ndarray:
+        return np.arange(self.pmf.size) + self.offset
+
+    @cached_property
+    def cdf(self) -> np.ndarray:
+        return np.cumsum(self.pmf)
+
+    def mean(self) -> float:
+        return float(self.values @ self.pmf)
+
+    def std(self) -> float:
+        return float(((self.values - self.mean()) ** 2) @ self.pmf) ** 0.5
+
+    def summary(self) -> dict:
+        """Summarize as a DamageDistributionResponse dict"""
+        return {
+            "min_damage": self.offset,
+            "max_damage": self.offset + self.pmf.size - 1,
+            "mean_damage": self.mean(),
+            "std_damage": self.std(),
+            "pmf": [
+                {"value": int(value), "probability": float(p), "cumulative": float(c)}
+                for value, p, c in zip(self.values, self.pmf, self.cdf)
+            ],
+        }
+
+
+def mixture(components: list[tuple[float, Distribution]]) -> Distribution:
+    """Weighted mixture of distributions (weights should sum to 1)"""
+    components = [(weight, dist) for weight, dist in components if weight > 0]
+    low = min(dist.offset for _, dist in components)
+    high = max(dist.offset + dist.pmf.size for _, dist in components)
+    pmf = np.zeros(high - low)
+    for weight, dist in components:
+        start = dist.offset - low
+        pmf[start : start + dist.pmf.size] += weight * dist.pmf
+    return Distribution(offset=low, pmf=pmf)
+
+
+def d20_pmf(advantage: AdvantageType) -> np.ndarray:
+    """
+    Probability of each kept d20 face, indexed 1-20 (index 0 unused).
+
+    With advantage P(r) = (2r - 1) / 400; with disadvantage P(r) = (41 - 2r) / 400.
+    """
+    faces = np.arange(21, dtype=float)
+    if advantage == AdvantageType.ADVANTAGE:
+        pmf = (2 * faces - 1) / 400
+    elif advantage == AdvantageType.DISADVANTAGE:
+        pmf = (41 - 2 * faces) / 400
+    else:
+        pmf = np.full(21, 1 / 20)
+    pmf[0] = 0.0
+    return pmf
+
+
+@lru_cache(maxsize=settings.dice_cache_size)
+def damage_distribution(notation: str, critical_hit: bool = False) -> Distribution:
+    """
+    Distribution of a damage roll; crits double the dice, not the modifier.
+
+    Cached per (notation, critical_hit), so crit-doubled variants are only
+    built the first time a critical hit needs them.
+    """
+    expression = compile_dice(notation)
+    if critical_hit:
+        expression = expression.doubled
+    offset, pmf = expression.distribution
+    return Distribution(offset=offset, pmf=pmf)
+
+
+def catalog_damage_notations() -> set[str]:
+    """Every damage expression used by monster actions and items"""
+    notations = {
+        action["damage_dice"]
+        for monster in load_monsters()
+        for action in monster.get("actions") or []
+        if action.get("damage_dice")
+    }
+    notations.update(item["damage"] for item in load_items() if item.get("damage"))
+    return notations
+
+
+def warm_dice_cache() -> int:
+    """
+    Pre-populate the dice caches with every catalog damage expression.
+
+    Returns:
+        Number of expressions warmed
+    """
+    notations = catalog_damage_notations()
+    for notation in notations:
+        damage_distribution(notation, False)
+    return len(notations)
+
+
+def _cache_stats(cached_function) -> dict:
+    info = cached_function.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "max_size": info.maxsize,
+        "hit_ratio": info.hits / lookups if lookups else 0.0,
+    }
+
+
+def dice_cache_stats() -> dict:
+    """Hit ratio and occupancy of the dice caches, as a DiceCacheStatsResponse dict"""
+    return {
+        "parsed": _cache_stats(compile_dice),
+        "distributions": _cache_stats(damage_distribution),
+    }
+
+
+def attack_probabilities(request: AttackRollRequest) -> dict:
+    """
+    Exact hit, crit and miss probabilities for an attack roll.
+
+    Natural 20 always hits and natural 1 always misses, as in calculate_attack_roll.
+    """
+    pmf = d20_pmf(request.advantage)
+    faces = np.arange(21)
+    hits_on_total = (faces + request.attack_bonus >= request.armor_class) & (faces >= 2)
+    hits_on_total[20] = True
+
+    hit = float(pmf[hits_on_total].sum())
+    return {
+        "hit_probability": hit,
+        "critical_hit_probability": float(pmf[20]),
+        "critical_miss_probability": float(pmf[1]),
+        "miss_probability": 1.0 - hit,
+    }
+
+
+def saving_throw_probabilities(request: SavingThrowRequest) -> dict:
+    """Exact success probability for a saving throw (total must meet the DC)"""
+    pmf = d20_pmf(request.advantage)
+    faces = np.arange(21)
+    bonus = request.ability_modifier + request.proficiency_bonus
+    success = float(pmf[(faces >= 1) & (faces + bonus >= request.dc)].sum())
+    return {
+        "success_probability": success,
+        "failure_probability": 1.0 - success,
+        "natural_20_probability": float(pmf[20]),
+        "natural_1_probability": float(pmf[1]),
+    }
+
+
+def damage_roll_distribution(request: DamageRollRequest) -> dict:
+    """Exact damage distribution for a damage roll"""
+    return damage_distribution(request.damage_dice, request.critical_hit).summary()
+
+
+def combat_distribution(request: CombatCalculatorRequest) -> dict:
+    """
+    Exact outcome probabilities and damage distribution for a full combat turn.
+
+    Damage is a mixture of a miss (0), a normal hit and a critical hit.
+    """
+    attack = attack_probabilities(request)
+    crit = attack["critical_hit_probability"]
+    normal_hit = attack["hit_probability"] - crit
+
+    damage = mixture(
+        [
+            (attack["miss_probability"], Distribution(offset=0, pmf=np.ones(1))),
+            (normal_hit, damage_distribution(request.damage_dice, False)),
+            (crit, damage_distribution(request.damage_dice, True)),
+        ]
+    )
+    return {"attack": attack, "damage": damage.summary()}
@@ -0,0 +1,187 @@
+"""Warm pools of pre-generated random monsters and characters"""
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Hashable
+from functools import lru_cache, partial
+
+from app.config import settings
+from app.models import Character, Monster, MonsterType, Size
+from app.services.character_service import generate_random_characters
+from app.services.generated_store import remember_characters, remember_monsters
+from app.services.monster_service import generate_random_monsters
+
+logger = logging.getLogger(__name__)
+
+Factory = Callable[[int], list]
+
+
+class RandomPool:
+    """
+    Pre-generated objects per parameter combination, refilled in the background.
+
+    A combination gets a stock the first time it is requested (up to
+    max_keys combinations; later ones are always generated on demand). When
+    a stock drops below low_water, the worker thread tops it back up to size
+    with one bulk generation call. Requests take what is stocked and
+    generate any shortfall themselves, so an empty pool only costs the
+    synchronous path. A combination whose refill raises is logged and left
+    alone for retry_after seconds.
+    """
+
+    def __init__(self, size: int, low_water: int, max_keys: int, retry_after: float = 30.0):
+        self.size = size
+        self.low_water = low_water
+        self.max_keys = max_keys
+        self.retry_after = retry_after
+        self._stocks: dict[Hashable, deque] = {}
+        self._factories: dict[Hashable, Factory] = {}
+        self._retry_at: dict[Hashable, float] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = False
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._work, name="random-pool", daemon=True)
+                self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the worker after its current refill"""
+        self._stopped = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def register(self, key: Hashable, factory: Factory) -> bool:
+        """Start stocking a combination; False if the pool already tracks max_keys"""
+        with self._lock:
+            if key not in self._stocks:
+                if len(self._stocks) >= self.max_keys:
+                    return False
+                self._stocks[key] = deque()
+                self._factories[key] = factory
+        self._wake.set()
+        return True
+
+    def stocked(self, key: Hashable) -> int:
+        with self._lock:
+            stock = self._stocks.get(key)
+            return len(stock) if stock is not None else 0
+
+    def take(self, key: Hashable, count: int, factory: Factory) -> list:
+        """Pop up to count stocked objects and generate the rest synchronously"""
+        self.register(key, factory)
+        with self._lock:
+            stock = self._stocks.get(key)
+            taken = [stock.popleft() for _ in range(min(count, len(stock)))] if stock else []
+            low = stock is not None and len(stock) < self.low_water
+        if low:
+            self._wake.set()
+        if len(taken) < count:
+            taken.extend(factory(count - len(taken)))
+        return taken
+
+    def _work(self) -> None:
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            if self._stopped:
+                return
+            now = time.monotonic()
+            with self._lock:
+                shortfalls = [
+                    (key, self._factories[key], self.size - len(stock))
+                    for key, stock in self._stocks.items()
+                    if len(stock) < self.low_water and self._retry_at.get(key, 0.0) <= now
+                ]
+            for key, factory, missing in shortfalls:
+                if self._stopped:
+                    return
+                try:
+                    objects = factory(missing)
+                except Exception:
+                    logger.exception("Refilling random pool %r failed", key)
+                    with self._lock:
+                        self._retry_at[key] = time.monotonic() + self.retry_after
+                    continue
+                with self._lock:
+                    self._stocks[key].extend(objects)
+                    self._retry_at.pop(key, None)
+
+
+@lru_cache(maxsize=1)
+def get_random_pool() -> RandomPool | None:
+    """
+    Create and start the process-wide pool, stocking unconstrained generation.
+
+    Returns None unless RANDOM_POOL_ENABLED is set: on Lambda a background
+    thread is frozen between invocations, so the pool would rarely refill.
+    """
+    if not settings.random_pool_enabled:
+        return None
+    pool = RandomPool(
+        settings.random_pool_size, settings.random_pool_low_water, settings.random_pool_max_keys
+    )
+    pool.register(_monster_key(None, None, None, None), generate_random_monsters)
+    pool.register(("character",), generate_random_characters)
+    pool.start()
+    return pool
+
+
+def shutdown_random_pool() -> None:
+    """Stop the refill worker if the pool was started"""
+    if get_random_pool.cache_info().currsize:
+        pool = get_random_pool()
+        if pool is not None:
+            pool.stop()
+        get_random_pool.cache_clear()
+
+
+def _monster_key(
+    monster_type: MonsterType | None,
+    size: Size | None,
+    min_cr: float | None,
+    max_cr: float | None,
+) -> tuple:
+    return ("monster", monster_type, size, min_cr, max_cr)
+
+
+def random_monsters(
+    count: int,
+    monster_type: MonsterType | None = None,
+    size: Size | None = None,
+    min_cr: float | None = None,
+    max_cr: float | None = None,
+) -> list[Monster]:
+    """
+    Random monsters from the pool when enabled, otherwise generated now.
+
+    Served monsters are remembered so GET /monsters/{id} can return them.
+    """
+    factory = partial(
+        generate_random_monsters, monster_type=monster_type, size=size, min_cr=min_cr, max_cr=max_cr
+    )
+    pool = get_random_pool()
+    if pool is None:
+        return remember_monsters(factory(count))
+    return remember_monsters(
+        pool.take(_monster_key(monster_type, size, min_cr, max_cr), count, factory)
+    )
+
+
+def random_characters(count: int) -> list[Character]:
+    """
+    Random characters from the pool when enabled, otherwise generated now.
+
+    Served characters are remembered so GET /characters/{id} can return them.
+    """
+    pool = get_random_pool()
+    if pool is None:
+        return remember_characters(generate_random_characters(count))
+    return remember_characters(pool.take(("character",), count, generate_random_characters))
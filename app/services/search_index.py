@@ -0,0 +1,198 @@
+"""Full-text search over catalog records using a BM25-ranked inverted index"""
+
+import heapq
+import math
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+
+from app.services.data_loader import load_characters, load_items, load_monsters
+from app.services.query_utils import Record
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+STOP_WORDS = frozenset(
+    {
+        "a", "an", "and", "are", "as", "at", "be", "by", "can", "for", "from",
+        "has", "if", "in", "into", "is", "it", "its", "of", "on", "one", "or",
+        "that", "the", "their", "this", "to", "was", "with",
+    }
+)
+
+# Action lists on a monster stat block that carry searchable ability text
+MONSTER_ACTION_FIELDS = ("special_abilities", "actions", "legendary_actions", "reactions")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase text and split it into searchable terms, dropping stop words"""
+    return [
+        token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOP_WORDS
+    ]
+
+
+class BM25Index:
+    """
+    Inverted index scored with Okapi BM25.
+
+    Term impacts are precomputed at build time (document lengths never change
+    after load), so a query only sums impacts from the posting lists of its
+    terms. Posting lists are visited in order of their best impact, which lets
+    top-k queries stop admitting new documents once the remaining terms can no
+    longer lift an unseen document into the result set (MaxScore pruning).
+    """
+
+    def __init__(self, documents: Iterable[tuple[int, str]], k1: float = 1.5, b: float = 0.75):
+        doc_terms: dict[int, list[str]] = {
+            doc_id: tokenize(text) for doc_id, text in documents
+        }
+        self.doc_count = len(doc_terms)
+        total_length = sum(len(terms) for terms in doc_terms.values())
+        average_length = total_length / self.doc_count if self.doc_count else 0.0
+
+        frequencies: dict[str, dict[int, int]] = {}
+        for doc_id, terms in doc_terms.items():
+            for term in terms:
+                postings = frequencies.setdefault(term, {})
+                postings[doc_id] = postings.get(doc_id, 0) + 1
+
+        self.postings: dict[str, dict[int, float]] = {}
+        self.max_impact: dict[str, float] = {}
+        for term, postings in frequencies.items():
+            document_frequency = len(postings)
+            idf = math.log(
+                1 + (self.doc_count - document_frequency + 0.5) / (document_frequency + 0.5)
+            )
+            impacts = {}
+            for doc_id, frequency in postings.items():
+                length_norm = 1 - b + b * len(doc_terms[doc_id]) / average_length
+                impacts[doc_id] = idf * frequency * (k1 + 1) / (frequency + k1 * length_norm)
+            self.postings[term] = impacts
+            self.max_impact[term] = max(impacts.values())
+
+    def search(
+        self, query: str, k: int, candidates: set[int] | None = None
+    ) -> tuple[list[tuple[int, float]], int]:
+        """
+        Return the top-k documents for a query and the total number of matches.
+
+        Args:
+            query: Free-text query
+            k: Number of ranked results to return
+            candidates: Optional set of document ids allowed in the results
+
+        Returns:
+            Tuple of ([(doc_id, score), ...] best first, total_matches)
+        """
+        terms = sorted(
+            {term for term in tokenize(query) if term in self.postings},
+            key=lambda term: self.max_impact[term],
+            reverse=True,
+        )
+        if not terms or k <= 0:
+            return [], self._count_matches(terms, candidates)
+
+        # remaining_bound[i] is the best score a document could collect from terms[i:]
+        remaining_bound = [0.0] * (len(terms) + 1)
+        for i in range(len(terms) - 1, -1, -1):
+            remaining_bound[i] = remaining_bound[i + 1] + self.max_impact[terms[i]]
+
+        scores: dict[int, float] = {}
+        for i, term in enumerate(terms):
+            admit_new = True
+            if len(scores) >= k:
+                threshold = heapq.nlargest(k, scores.values())[-1]
+                admit_new = remaining_bound[i] > threshold
+
+            for doc_id, impact in self.postings[term].items():
+                if doc_id in scores:
+                    scores[doc_id] += impact
+                elif admit_new and (candidates is None or doc_id in candidates):
+                    scores[doc_id] = impact
+
+        ranked = heapq.nsmallest(k, scores.items(), key=lambda entry: (-entry[1], entry[0]))
+        return ranked, self._count_matches(terms, candidates)
+
+    def _count_matches(self, terms: list[str], candidates: set[int] | None) -> int:
+        """Count documents containing at least one of the terms"""
+        matches: set[int] = set()
+        for term in terms:
+            matches.update(self.postings[term])
+        if candidates is not None:
+            matches &= candidates
+        return len(matches)
+
+
+def _action_text(record: Record, fields: Iterable[str]) -> str:
+    """Join the names and descriptions of every action in the given fields"""
+    parts = []
+    for field in fields:
+        for action in record.get(field) or []:
+            parts.append(action["name"])
+            parts.append(action["description"])
+    return " ".join(parts)
+
+
+@lru_cache(maxsize=1)
+def get_monster_search_index() -> BM25Index:
+    """Build and cache the monster index over names, types and ability text"""
+    return BM25Index(
+        (
+            monster["id"],
+            " ".join(
+                [
+                    monster["name"],
+                    monster["type"],
+                    monster.get("description", ""),
+                    _action_text(monster, MONSTER_ACTION_FIELDS),
+                ]
+            ),
+        )
+        for monster in load_monsters()
+    )
+
+
+@lru_cache(maxsize=1)
+def get_item_search_index() -> BM25Index:
+    """Build and cache the item index over names, descriptions and properties"""
+    return BM25Index(
+        (
+            item["id"],
+            " ".join([item["name"], item["description"], *item["properties"]]),
+        )
+        for item in load_items()
+    )
+
+
+@lru_cache(maxsize=1)
+def get_character_search_index() -> BM25Index:
+    """Build and cache the character index over names and descriptions"""
+    return BM25Index(
+        (character["id"], f"{character['name']} {character['description']}")
+        for character in load_characters()
+    )
+
+
+def search_records(
+    index: BM25Index,
+    records: list[Record],
+    query: str,
+    skip: int,
+    limit: int,
+) -> tuple[list[Record], int]:
+    """
+    Rank already-filtered records by relevance and paginate the result.
+
+    Args:
+        index: Search index covering the records
+        records: Records that passed every other filter
+        query: Free-text query
+        skip: Number of ranked records to skip
+        limit: Maximum number of records to return
+
+    Returns:
+        Tuple of (ranked page of records, total matching records)
+    """
+    by_id = {record["id"]: record for record in records}
+    ranked, total = index.search(query, skip + limit, set(by_id))
+    page = [by_id[doc_id] for doc_id, _ in ranked[skip:]]
+    return page, total
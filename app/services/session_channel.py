@@ -0,0 +1,104 @@
+"""Fan-out of combat session updates to connected WebSocket clients"""
+
+import asyncio
+import threading
+from collections import deque
+from functools import lru_cache
+
+
+class Subscriber:
+    """
+    One connected client's outbox.
+
+    Command results queue up to max_pending, dropping (and counting) the
+    oldest beyond that; session state is coalesced to the latest snapshot.
+    The client's sender drains everything pending into one message per
+    wake-up, so a slow client falls behind on its own without stalling the
+    session or other players.
+    """
+
+    def __init__(self, max_pending: int):
+        self.loop = asyncio.get_running_loop()
+        self.results: deque[dict] = deque(maxlen=max_pending)
+        self.state: dict | None = None
+        self.dropped = 0
+        self._ready = asyncio.Event()
+
+    def push(self, result: dict | None, state: dict | None) -> None:
+        """Queue a result and/or replace the pending state (call on self.loop)"""
+        if result is not None:
+            if len(self.results) == self.results.maxlen:
+                self.dropped += 1
+            self.results.append(result)
+        if state is not None:
+            self.state = state
+        self._ready.set()
+
+    async def next_message(self) -> dict:
+        """Wait for pending updates and take them as one "update" message"""
+        await self._ready.wait()
+        self._ready.clear()
+        message = {
+            "type": "update",
+            "results": list(self.results),
+            "state": self.state,
+            "dropped": self.dropped,
+        }
+        self.results.clear()
+        self.state = None
+        self.dropped = 0
+        return message
+
+
+class SessionChannels:
+    """Subscribers per session id"""
+
+    def __init__(self):
+        self._subscribers: dict[str, set[Subscriber]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, session_id: str, max_pending: int) -> Subscriber:
+        """Register a client; must be called from its event loop"""
+        subscriber = Subscriber(max_pending)
+        with self._lock:
+            self._subscribers.setdefault(session_id, set()).add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, session_id: str, subscriber: Subscriber) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(session_id)
+            if subscribers is not None:
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    del self._subscribers[session_id]
+
+    def has_subscribers(self, session_id: str) -> bool:
+        return bool(self._subscribers.get(session_id))
+
+    def publish(self, session_id: str, result: dict, state: dict) -> None:
+        """
+        Send a result and the new state to every client of a session.
+
+        Safe to call from any thread: pushes for clients on another event
+        loop (or from a sync route's worker thread) are scheduled on that
+        client's loop.
+        """
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        with self._lock:
+            subscribers = list(self._subscribers.get(session_id, ()))
+        for subscriber in subscribers:
+            if subscriber.loop is running:
+                subscriber.push(result, state)
+                continue
+            try:
+                subscriber.loop.call_soon_threadsafe(subscriber.push, result, state)
+            except RuntimeError:
+                pass  # Loop already closed; the client is disconnecting
+
+
+@lru_cache(maxsize=1)
+def get_session_channels() -> SessionChannels:
+    return SessionChannels()
@@ -0,0 +1,131 @@
+"""Similar-monster search via k-nearest neighbours over normalized stat vectors"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from app.models import DamageType
+from app.services.data_loader import load_monsters
+from app.services.query_utils import Record
+
+STAT_FIELDS = ("strength", "dexterity", "constitution", "intelligence", "wisdom", "charisma")
+SPEED_MODES = ("walk", "fly", "swim", "climb", "burrow")
+DAMAGE_TYPES = tuple(damage_type.value for damage_type in DamageType)
+
+
+def _feature_row(monster: Record) -> list[float]:
+    """Flatten a monster into stats, defenses, CR, speeds and damage flags"""
+    resistances = set(monster.get("damage_resistances") or [])
+    immunities = set(monster.get("damage_immunities") or [])
+    return [
+        *(monster["stats"][field] for field in STAT_FIELDS),
+        monster["armor_class"],
+        np.log1p(monster["hit_points"]),
+        monster["challenge_rating"],
+        *(monster["speed"].get(mode, 0) for mode in SPEED_MODES),
+        *(damage_type in resistances for damage_type in DAMAGE_TYPES),
+        *(damage_type in immunities for damage_type in DAMAGE_TYPES),
+    ]
+
+
+def _feature_weights() -> np.ndarray:
+    """
+    Weight feature blocks so the many sparse damage flags don't outvote stats.
+
+    Each resistance/immunity block counts roughly as much as one numeric feature.
+    """
+    numeric = len(STAT_FIELDS) + 3 + len(SPEED_MODES)
+    flag_weight = 1 / np.sqrt(len(DAMAGE_TYPES))
+    return np.concatenate(
+        [np.ones(numeric), np.full(2 * len(DAMAGE_TYPES), flag_weight)]
+    )
+
+
+class MonsterFeatureIndex:
+    """Z-score normalized feature matrix with a row per catalog monster"""
+
+    def __init__(self, monsters: list[Record]):
+        self.records = monsters
+        self.ids = np.array([monster["id"] for monster in monsters])
+        self.rows = {monster["id"]: row for row, monster in enumerate(monsters)}
+        self.types = np.array([monster["type"] for monster in monsters])
+        self.challenge_ratings = np.array(
+            [monster["challenge_rating"] for monster in monsters], dtype=float
+        )
+
+        raw = np.array([_feature_row(monster) for monster in monsters], dtype=float)
+        std = raw.std(axis=0)
+        std[std == 0] = 1.0
+        self.features = (raw - raw.mean(axis=0)) / std * _feature_weights()
+
+    def nearest(
+        self,
+        monster_id: int,
+        k: int,
+        monster_type: str | None = None,
+        min_cr: float | None = None,
+        max_cr: float | None = None,
+    ) -> list[tuple[Record, float]]:
+        """
+        Find the k monsters closest to the given one.
+
+        Filters are applied before ranking, so k results are returned whenever
+        at least k monsters pass them.
+
+        Args:
+            monster_id: Catalog id of the reference monster
+            k: Number of neighbours to return
+            monster_type: Only consider monsters of this type
+            min_cr: Minimum challenge rating
+            max_cr: Maximum challenge rating
+
+        Returns:
+            List of (monster, distance) pairs, closest first
+        """
+        row = self.rows[monster_id]
+        mask = self.ids != monster_id
+        if monster_type is not None:
+            mask &= self.types == monster_type
+        if min_cr is not None:
+            mask &= self.challenge_ratings >= min_cr
+        if max_cr is not None:
+            mask &= self.challenge_ratings <= max_cr
+
+        candidates = np.flatnonzero(mask)
+        if candidates.size == 0:
+            return []
+
+        distances = np.linalg.norm(self.features[candidates] - self.features[row], axis=1)
+        k = min(k, candidates.size)
+        nearest = np.argpartition(distances, k - 1)[:k]
+        nearest = nearest[np.argsort(distances[nearest], kind="stable")]
+
+        return [
+            (self.records[candidates[i]], float(distances[i])) for i in nearest
+        ]
+
+
+@lru_cache(maxsize=1)
+def get_monster_feature_index() -> MonsterFeatureIndex:
+    """Build and cache the feature index over the monster catalog"""
+    return MonsterFeatureIndex(load_monsters())
+
+
+def find_similar_monsters(
+    monster_id: int,
+    k: int = 10,
+    monster_type: str | None = None,
+    min_cr: float | None = None,
+    max_cr: float | None = None,
+) -> list[tuple[Record, float]] | None:
+    """
+    Find catalog monsters with stat blocks most like the given monster.
+
+    Returns:
+        List of (monster, distance) pairs closest first, or None if the
+        monster id is not in the catalog
+    """
+    index = get_monster_feature_index()
+    if monster_id not in index.rows:
+        return None
+    return index.nearest(monster_id, k, monster_type, min_cr, max_cr)
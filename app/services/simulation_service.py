@@ -0,0 +1,245 @@
+"""Vectorized Monte Carlo simulation of combat turns"""
+
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from app.config import settings
+from app.models.combat import (
+    AdvantageType,
+    CombatCalculatorRequest,
+    CombatSimulationRequest,
+    CombatSimulationStreamRequest,
+)
+from app.services.executor import get_executor, run_chunks
+from app.utils import rng
+from app.utils.dice_expression import compile_dice
+
+# Trials generated per NumPy pass; bounds peak memory for large dice pools
+CHUNK_TRIALS = 1 << 17
+
+PERCENTILES = (5, 25, 50, 75, 95)
+
+# Two-sided 95% normal quantile for streamed confidence intervals
+Z_95 = 1.959963984540054
+
+
+@dataclass
+class DamageAccumulator:
+    """
+    Mergeable running totals for simulated damage.
+
+    The histogram is indexed by damage - offset so negative results (e.g.
+    "1d4-3") still fit. Moments and counts merge exactly by addition.
+    """
+
+    offset: int
+    histogram: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    trials: int = 0
+    hits: int = 0
+    crits: int = 0
+
+    def add_damage(self, damage: np.ndarray, hits: int, crits: int) -> None:
+        counts = np.bincount(damage - self.offset)
+        self._add_histogram(counts)
+        self.trials += damage.size
+        self.hits += hits
+        self.crits += crits
+
+    def merge(self, other: "DamageAccumulator") -> None:
+        self._add_histogram(other.histogram)
+        self.trials += other.trials
+        self.hits += other.hits
+        self.crits += other.crits
+
+    def _add_histogram(self, counts: np.ndarray) -> None:
+        if counts.size > self.histogram.size:
+            counts = counts.copy()
+            counts[: self.histogram.size] += self.histogram
+            self.histogram = counts
+        else:
+            self.histogram[: counts.size] += counts
+
+    def moments(self) -> tuple[float, float]:
+        """Mean and variance of the damage accumulated so far"""
+        values = np.arange(self.histogram.size) + self.offset
+        weights = self.histogram / self.trials
+        mean = float(values @ weights)
+        return mean, float(((values - mean) ** 2) @ weights)
+
+    def histogram_bins(self) -> list[dict]:
+        """Non-empty histogram bins as HistogramBin dicts"""
+        observed = np.flatnonzero(self.histogram)
+        return [
+            {"damage": int(i + self.offset), "count": int(self.histogram[i])} for i in observed
+        ]
+
+    def estimate(self) -> dict:
+        """Running estimates with 95% normal-approximation confidence intervals"""
+        mean, variance = self.moments()
+        hit_rate = self.hits / self.trials
+        mean_margin = Z_95 * (variance / self.trials) ** 0.5
+        hit_margin = Z_95 * (hit_rate * (1 - hit_rate) / self.trials) ** 0.5
+        return {
+            "trials": self.trials,
+            "hit_rate": hit_rate,
+            "hit_rate_ci": [max(0.0, hit_rate - hit_margin), min(1.0, hit_rate + hit_margin)],
+            "crit_rate": self.crits / self.trials,
+            "mean_damage": mean,
+            "mean_damage_ci": [mean - mean_margin, mean + mean_margin],
+            "ci_half_width": mean_margin,
+        }
+
+    def summary(self) -> dict:
+        """Summarize the accumulated trials as a CombatSimulationResponse dict"""
+        values = np.arange(self.histogram.size) + self.offset
+        observed = np.flatnonzero(self.histogram)
+        mean, variance = self.moments()
+
+        cumulative = np.cumsum(self.histogram)
+        percentiles = {
+            f"p{p}": int(values[np.searchsorted(cumulative, self.trials * p / 100)])
+            for p in PERCENTILES
+        }
+
+        return {
+            "trials": self.trials,
+            "hit_rate": self.hits / self.trials,
+            "crit_rate": self.crits / self.trials,
+            "mean_damage": mean,
+            "std_damage": variance**0.5,
+            "min_damage": int(values[observed[0]]),
+            "max_damage": int(values[observed[-1]]),
+            "percentiles": percentiles,
+            "histogram": self.histogram_bins(),
+        }
+
+
+def damage_offset(request: CombatCalculatorRequest) -> int:
+    """Lowest histogram index needed: a miss (0) or the worst damage roll"""
+    expression = compile_dice(request.damage_dice)
+    return min(0, expression.min_total, expression.doubled.min_total)
+
+
+def simulate_combat_chunk(
+    request: CombatCalculatorRequest, trials: int, generator: np.random.Generator
+) -> DamageAccumulator:
+    """
+    Simulate attack + damage for a block of trials with array operations.
+
+    Mirrors calculate_full_combat: natural 20 always hits and doubles the
+    damage dice, natural 1 always misses, misses deal no damage.
+    """
+    expression = compile_dice(request.damage_dice)
+
+    rolls = generator.integers(1, 21, size=trials)
+    if request.advantage != AdvantageType.NORMAL:
+        second = generator.integers(1, 21, size=trials)
+        if request.advantage == AdvantageType.ADVANTAGE:
+            rolls = np.maximum(rolls, second)
+        else:
+            rolls = np.minimum(rolls, second)
+
+    crit = rolls == 20
+    hit = crit | ((rolls != 1) & (rolls + request.attack_bonus >= request.armor_class))
+
+    damage = np.zeros(trials, dtype=np.int64)
+    hit_count = int(hit.sum())
+    if hit_count:
+        normal = hit & ~crit
+        damage[normal] = expression.sample(generator, int(normal.sum()))
+        crit_count = int(crit.sum())
+        if crit_count:
+            damage[crit] = expression.doubled.sample(generator, crit_count)
+
+    accumulator = DamageAccumulator(offset=damage_offset(request))
+    accumulator.add_damage(damage, hit_count, int(crit.sum()))
+    return accumulator
+
+
+def simulate_seeded_chunk(
+    request: CombatCalculatorRequest, trials: int, seed: np.random.SeedSequence
+) -> DamageAccumulator:
+    """Simulate one chunk on its own generator (runs in pool workers)"""
+    return simulate_combat_chunk(request, trials, np.random.default_rng(seed))
+
+
+def chunk_plan(
+    request: CombatSimulationRequest, chunk_trials: int
+) -> tuple[list[int], list[np.random.SeedSequence]]:
+    """Split the trials into chunks, each with a seed spawned from the request seed"""
+    seed = request.seed
+    if seed is None:
+        seed = int(rng.generator().integers(2**63))
+    sizes = [chunk_trials] * (request.trials // chunk_trials)
+    if request.trials % chunk_trials:
+        sizes.append(request.trials % chunk_trials)
+    return sizes, np.random.SeedSequence(seed).spawn(len(sizes))
+
+
+def simulate_combat(
+    request: CombatSimulationRequest, progress: Callable[[float], None] | None = None
+) -> dict:
+    """
+    Run a Monte Carlo simulation of a full combat turn.
+
+    Trials are split into fixed-size chunks, each with its own seed spawned
+    from one root, so the result for a given seed is the same whether the
+    chunks run in-process or on the worker pool. Runs of at least
+    SIMULATION_PARALLEL_MIN_TRIALS use the pool.
+
+    Args:
+        request: Attack and damage parameters plus trial count and optional seed
+        progress: Optional callback with the fraction of chunks done
+
+    Returns:
+        Dictionary matching CombatSimulationResponse
+    """
+    sizes, seeds = chunk_plan(request, CHUNK_TRIALS)
+
+    executor = get_executor() if request.trials >= settings.simulation_parallel_min_trials else None
+    partials = run_chunks(
+        simulate_seeded_chunk,
+        [(request, size, chunk_seed) for size, chunk_seed in zip(sizes, seeds)],
+        executor,
+        on_result=None if progress is None else lambda done, total: progress(done / total),
+    )
+
+    accumulator = DamageAccumulator(offset=damage_offset(request))
+    for partial in partials:
+        accumulator.merge(partial)
+    return accumulator.summary()
+
+
+def stream_combat_simulation(request: CombatSimulationStreamRequest) -> Iterator[tuple[str, dict]]:
+    """
+    Simulate chunk by chunk, yielding running estimates as they converge.
+
+    Each "estimate" event carries the running hit rate and mean damage with
+    95% confidence intervals, plus the histogram bins added by that chunk.
+    The run stops early once the mean-damage interval is within
+    ci_half_width. A final "result" event carries the full summary.
+
+    Chunks run in-process and one at a time, so a consumer that stops
+    iterating (e.g. on client disconnect) stops the work.
+
+    Args:
+        request: Simulation parameters plus chunk size and optional CI target
+
+    Yields:
+        (event name, payload) pairs
+    """
+    sizes, seeds = chunk_plan(request, request.chunk_trials)
+    accumulator = DamageAccumulator(offset=damage_offset(request))
+    converged = False
+    for size, chunk_seed in zip(sizes, seeds):
+        partial = simulate_seeded_chunk(request, size, chunk_seed)
+        accumulator.merge(partial)
+        estimate = accumulator.estimate()
+        yield "estimate", {**estimate, "histogram_delta": partial.histogram_bins()}
+        if request.ci_half_width is not None and estimate["ci_half_width"] <= request.ci_half_width:
+            converged = accumulator.trials < request.trials
+            break
+
+    yield "result", {**accumulator.summary(), "stopped_early": converged}
@@ -0,0 +1,85 @@
+"""Bounded in-memory key/value store with LRU capacity and TTL expiry"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLStore(Generic[K, V]):
+    """
+    Thread-safe mapping that expires entries and caps their number.
+
+    Entries are kept in expiry order, so expired ones are always at the
+    front and purging is proportional to what is removed. With sliding
+    expiry a read refreshes the entry's TTL (idle timeout, LRU order);
+    otherwise the TTL runs from the last write.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        sliding: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.sliding = sliding
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def _purge(self, now: float) -> None:
+        while self._entries:
+            key, (expires, _) = next(iter(self._entries.items()))
+            if expires > now:
+                break
+            del self._entries[key]
+            self.evictions += 1
+
+    def get(self, key: K) -> V | None:
+        """Return a live entry, refreshing its TTL when sliding"""
+        with self._lock:
+            now = self._clock()
+            self._purge(now)
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self.sliding:
+                self._entries[key] = (now + self.ttl_seconds, entry[1])
+                self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: K, value: V) -> None:
+        """Insert or replace an entry, evicting the oldest beyond capacity"""
+        self.put_many([(key, value)])
+
+    def put_many(self, items: Iterable[tuple[K, V]]) -> None:
+        """Insert or replace several entries under one lock acquisition"""
+        with self._lock:
+            now = self._clock()
+            self._purge(now)
+            expires = now + self.ttl_seconds
+            for key, value in items:
+                self._entries[key] = (expires, value)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: K) -> V | None:
+        """Remove and return an entry"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            return None if entry is None else entry[1]
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._purge(self._clock())
+            return len(self._entries)
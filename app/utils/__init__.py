@@ -1,14 +1,18 @@
 """Utils package - exports all utility functions"""
 
 from .dice import roll_dice, roll_ability_score, parse_dice_notation, roll_from_notation
+from .dice_expression import DiceExpression, DiceRoll, DiceTerm, compile_dice
+from .rng import DiceRNG, get_rng, seed_rng, use_rng
 from .calculations import (
     calculate_modifier,
     calculate_proficiency_bonus,
     calculate_hp_from_cr,
     calculate_ac_from_cr,
     get_xp_by_cr,
+    calculate_party_thresholds,
+    calculate_encounter_multiplier,
 )
-from .formatters import format_modifier, pluralize, titlecase
+from .formatters import format_modifier, pluralize, titlecase, format_sse_event
 from .validators import (
     validate_ability_score,
     validate_level,
@@ -22,16 +26,28 @@ __all__ = [
     "roll_ability_score",
     "parse_dice_notation",
     "roll_from_notation",
+    "DiceExpression",
+    "DiceRoll",
+    "DiceTerm",
+    "compile_dice",
+    # Random numbers
+    "DiceRNG",
+    "get_rng",
+    "seed_rng",
+    "use_rng",
     # Calculations
     "calculate_modifier",
     "calculate_proficiency_bonus",
     "calculate_hp_from_cr",
     "calculate_ac_from_cr",
     "get_xp_by_cr",
+    "calculate_party_thresholds",
+    "calculate_encounter_multiplier",
     # Formatters
     "format_modifier",
     "pluralize",
     "titlecase",
+    "format_sse_event",
     # Validators
     "validate_ability_score",
     "validate_level",
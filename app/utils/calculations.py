@@ -1,8 +1,18 @@
 """Calculation utilities for D&D game mechanics"""
 
-from app.config.constants import XP_BY_CR, HIT_DICE_BY_SIZE
+import numpy as np
+
+from app.config.constants import (
+    XP_BY_CR,
+    HIT_DICE_BY_SIZE,
+    XP_THRESHOLDS_BY_LEVEL,
+    ENCOUNTER_MULTIPLIERS,
+    ENCOUNTER_MULTIPLIER_STEPS,
+)
 from app.models import Size
 
+from . import rng
+
 
 def calculate_modifier(ability_score: int) -> int:
     """
@@ -33,49 +43,64 @@ def calculate_proficiency_bonus(level: int) -> int:
     return 2 + ((level - 1) // 4)
 
 
-def calculate_hp_from_cr(challenge_rating: float, size: Size, constitution_modifier: int = 0) -> tuple[int, str]:
+def calculate_hp_from_cr(
+    challenge_rating: float | np.ndarray,
+    size: Size | list[Size],
+    constitution_modifier: int = 0,
+) -> tuple[int, str] | tuple[np.ndarray, list[str]]:
     """
     Calculate HP and hit dice based on CR and size.
     
     Args:
-        challenge_rating: Monster challenge rating
-        size: Monster size (affects hit die size)
-        constitution_modifier: Constitution modifier per die
+        challenge_rating: Monster challenge rating, or an array of them for a batch
+        size: Monster size (affects hit die size), or one size per rating
+        constitution_modifier: Constitution modifier per die (0 uses the CR)
     
     Returns:
-        Tuple of (hit_points, hit_dice_notation)
+        Tuple of (hit_points, hit_dice_notation); for a batch, an array of
+        hit points and a list of notations
     
     Example:
         calculate_hp_from_cr(5.0, Size.LARGE, 2)  # Returns (95, "10d10+20")
     """
-    import random
-    
-    die_size = HIT_DICE_BY_SIZE[size]
-    num_dice = max(1, int(challenge_rating * 3) + random.randint(1, 6))
+    challenge_ratings = np.atleast_1d(np.asarray(challenge_rating, dtype=float))
+    count = len(challenge_ratings)
+    sizes = [size] * count if isinstance(size, Size) else size
+    die_sizes = np.array([HIT_DICE_BY_SIZE[s] for s in sizes])
+    num_dice = np.maximum(
+        1, (challenge_ratings * 3).astype(np.int64) + rng.generator().integers(1, 7, size=count)
+    )
     
     if constitution_modifier == 0:
-        constitution_modifier = int(challenge_rating)
+        constitution_modifier = challenge_ratings.astype(np.int64)
     
     # Calculate HP: (num_dice * (die_size / 2 + 0.5)) + (num_dice * con_bonus)
-    average_roll = (die_size / 2) + 0.5
-    hit_points = int((num_dice * average_roll) + (num_dice * constitution_modifier))
-    hit_dice = f"{num_dice}d{die_size}+{num_dice * constitution_modifier}"
-    
-    return hit_points, hit_dice
+    average_roll = (die_sizes / 2) + 0.5
+    hit_points = ((num_dice * average_roll) + (num_dice * constitution_modifier)).astype(np.int64)
+    con_bonus = (num_dice * constitution_modifier).tolist()
+    hit_dice = [
+        f"{dice}d{die}+{bonus}"
+        for dice, die, bonus in zip(num_dice.tolist(), die_sizes.tolist(), con_bonus)
+    ]
+    
+    if np.ndim(challenge_rating):
+        return hit_points, hit_dice
+    return int(hit_points[0]), hit_dice[0]
 
 
-def calculate_ac_from_cr(challenge_rating: float) -> int:
+def calculate_ac_from_cr(challenge_rating: float | np.ndarray) -> int | np.ndarray:
     """
     Calculate appropriate AC based on challenge rating.
     
     Args:
-        challenge_rating: Monster challenge rating
+        challenge_rating: Monster challenge rating, or an array of them
     
     Returns:
-        Armor class value
+        Armor class value, or an array of them
     """
     # Base AC 10 + CR scaling
-    return min(10 + int(challenge_rating * 0.75), 25)
+    armor_class = np.minimum(10 + (np.asarray(challenge_rating) * 0.75).astype(np.int64), 25)
+    return int(armor_class) if armor_class.ndim == 0 else armor_class
 
 
 def get_xp_by_cr(challenge_rating: float) -> int:
@@ -89,3 +114,51 @@ def get_xp_by_cr(challenge_rating: float) -> int:
         Experience points value
     """
     return XP_BY_CR.get(challenge_rating, 0)
+
+
+def calculate_party_thresholds(party_levels: list[int]) -> tuple[int, int, int, int]:
+    """
+    Sum per-character XP thresholds for a party.
+    
+    Args:
+        party_levels: Level of each character (1-20)
+    
+    Returns:
+        Tuple of (easy, medium, hard, deadly) XP thresholds
+    
+    Example:
+        calculate_party_thresholds([3, 3, 3, 3])  # Returns (300, 600, 900, 1600)
+    """
+    thresholds = [XP_THRESHOLDS_BY_LEVEL[level] for level in party_levels]
+    easy, medium, hard, deadly = (sum(column) for column in zip(*thresholds))
+    return easy, medium, hard, deadly
+
+
+def calculate_encounter_multiplier(monster_count: int, party_size: int) -> float:
+    """
+    Get the XP multiplier for a group of monsters.
+    
+    Parties of fewer than 3 characters use the next higher multiplier;
+    parties of 6 or more use the next lower one.
+    
+    Args:
+        monster_count: Number of monsters in the encounter
+        party_size: Number of characters in the party
+    
+    Returns:
+        Multiplier applied to total monster XP
+    
+    Example:
+        calculate_encounter_multiplier(4, 4)  # Returns 2.0
+    """
+    multiplier = 1.0
+    for min_count, value in ENCOUNTER_MULTIPLIERS:
+        if monster_count >= min_count:
+            multiplier = value
+
+    step = ENCOUNTER_MULTIPLIER_STEPS.index(multiplier)
+    if party_size < 3:
+        step += 1
+    elif party_size >= 6:
+        step -= 1
+    return ENCOUNTER_MULTIPLIER_STEPS[step]
@@ -1,6 +1,7 @@
 """Dice rolling utilities for D&D mechanics"""
 
-import random
+from . import rng
+from .dice_expression import compile_dice
 
 
 def roll_dice(num_dice: int, die_size: int, modifier: int = 0) -> int:
@@ -18,7 +19,7 @@ def roll_dice(num_dice: int, die_size: int, modifier: int = 0) -> int:
     Example:
         roll_dice(2, 6, 3)  # Rolls 2d6+3
     """
-    rolls = [random.randint(1, die_size) for _ in range(num_dice)]
+    rolls = [rng.randint(1, die_size) for _ in range(num_dice)]
     return sum(rolls) + modifier
 
 
@@ -29,14 +30,17 @@ def roll_ability_score() -> int:
     Returns:
         Ability score between 3 and 18
     """
-    rolls = [random.randint(1, 6) for _ in range(4)]
+    rolls = [rng.randint(1, 6) for _ in range(4)]
     rolls.remove(min(rolls))
     return sum(rolls)
 
 
 def parse_dice_notation(notation: str) -> tuple[int, int, int]:
     """
-    Parse dice notation string (e.g., "2d6+3") into components.
+    Parse simple dice notation (e.g., "2d6+3") into components.
+    
+    Use compile_dice for the full grammar (multiple terms, keep/drop,
+    rerolls, exploding dice).
     
     Args:
         notation: Dice notation string (e.g., "2d6+3", "1d20", "3d8-2")
@@ -44,24 +48,16 @@ def parse_dice_notation(notation: str) -> tuple[int, int, int]:
     Returns:
         Tuple of (num_dice, die_size, modifier)
     
+    Raises:
+        ValueError: If the notation is invalid or not a single XdY±Z
+    
     Example:
         parse_dice_notation("2d6+3")  # Returns (2, 6, 3)
     """
-    modifier = 0
-    
-    # Handle modifier
-    if '+' in notation:
-        dice_part, mod_part = notation.split('+')
-        modifier = int(mod_part)
-    elif '-' in notation:
-        dice_part, mod_part = notation.split('-')
-        modifier = -int(mod_part)
-    else:
-        dice_part = notation
-    
-    # Parse dice
-    num_dice, die_size = dice_part.split('d')
-    return int(num_dice), int(die_size), modifier
+    simple = compile_dice(notation).as_simple()
+    if simple is None:
+        raise ValueError(f"'{notation}' is not a single XdY±Z expression")
+    return simple
 
 
 def roll_from_notation(notation: str) -> int:
@@ -69,7 +65,7 @@ def roll_from_notation(notation: str) -> int:
     Roll dice from notation string.
     
     Args:
-        notation: Dice notation string (e.g., "2d6+3")
+        notation: Dice expression (e.g., "2d6+3", "4d6kh3", "1d20-1d4")
     
     Returns:
         Total rolled value
@@ -77,5 +73,4 @@ def roll_from_notation(notation: str) -> int:
     Example:
         roll_from_notation("2d6+3")  # Rolls 2d6+3
     """
-    num_dice, die_size, modifier = parse_dice_notation(notation)
-    return roll_dice(num_dice, die_size, modifier)
+    return compile_dice(notation).roll().total
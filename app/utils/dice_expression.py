@@ -0,0 +1,412 @@
+"""Dice expression grammar compiled into reusable evaluators
+
+Grammar (case-insensitive, whitespace ignored):
+
+    expression := term (("+" | "-") term)*
+    term       := dice | integer
+    dice       := integer "d" integer modifier*
+    modifier   := "kh" n | "kl" n     keep the highest / lowest n dice
+                | "dh" n | "dl" n     drop the highest / lowest n dice
+                | "r" n               reroll a die once if it shows n or lower
+                | "!"                 explode: roll again and add on the max face
+
+Examples: "2d6+3", "2d6+1d4+3", "4d6kh3", "1d20-1d4", "2d6r2", "3d6!".
+"""
+
+import re
+from dataclasses import dataclass, replace
+from functools import cached_property, lru_cache
+from math import comb
+from typing import Callable, NamedTuple
+
+import numpy as np
+
+from app.config import settings
+
+from . import rng
+
+MAX_TERMS = 20
+MAX_DICE = 100
+MAX_SIDES = 1000
+MAX_CONSTANT = 10_000
+
+# Chained explosions per die; after this many the last roll counts as is
+MAX_EXPLOSIONS = 10
+
+# Estimated multiply-adds allowed for an exact distribution (about half a
+# second of numpy). Checked against the crit variant, which the probability
+# endpoints always compute alongside the normal one.
+MAX_DISTRIBUTION_COST = 2_500_000_000
+
+_TOKEN = re.compile(
+    r"(?P<dice>(?P<count>\d+)d(?P<sides>\d+)(?P<mods>(?:kh\d+|kl\d+|dh\d+|dl\d+|r\d+|!)*))"
+    r"|(?P<number>\d+)"
+    r"|(?P<op>[+-])"
+)
+_MODIFIER = re.compile(r"(kh|kl|dh|dl|r)(\d+)|(!)")
+
+
+class DiceRoll(NamedTuple):
+    """Result of rolling an expression once"""
+
+    total: int
+    rolls: list[int]  # Value of each kept die, negated for subtracted terms
+
+
+@dataclass(frozen=True)
+class DiceTerm:
+    """A group of identical dice, e.g. "4d6kh3" or "-1d4" """
+
+    count: int
+    sides: int
+    sign: int = 1
+    keep: int | None = None  # None keeps every die
+    keep_highest: bool = True
+    reroll_below: int = 0  # Reroll once on this face or lower (0 disables)
+    explode: bool = False
+
+    @property
+    def kept(self) -> int:
+        return self.count if self.keep is None else self.keep
+
+    @property
+    def is_plain(self) -> bool:
+        return self.keep is None and not self.reroll_below and not self.explode
+
+    def __str__(self) -> str:
+        text = f"{self.count}d{self.sides}"
+        if self.keep is not None:
+            text += f"{'kh' if self.keep_highest else 'kl'}{self.keep}"
+        if self.reroll_below:
+            text += f"r{self.reroll_below}"
+        if self.explode:
+            text += "!"
+        return text
+
+    def value_range(self) -> tuple[int, int]:
+        """Lowest and highest signed contribution of this term"""
+        top = self.sides * (MAX_EXPLOSIONS + 1) if self.explode else self.sides
+        low, high = self.kept, self.kept * top
+        return (low, high) if self.sign > 0 else (-high, -low)
+
+    def distribution_cost(self) -> int:
+        """Rough multiply-adds needed by distribution()"""
+        faces = self.sides * (MAX_EXPLOSIONS + 1) if self.explode else self.sides
+        if self.keep is None:
+            return self.count**2 * faces**2 // 2
+        # _kept_sum_pmf updates a kept-sum row per (face, assigned, chosen) in a
+        # Python loop, so it is weighted for the interpreter overhead per row
+        return 2 * faces * self.count**2 * (self.keep * faces + 1000)
+
+    def roll(self, randint: Callable[[int, int], int]) -> list[int]:
+        """Roll each die (rerolls and explosions included) and return kept values"""
+        faces = []
+        for _ in range(self.count):
+            value = randint(1, self.sides)
+            if value <= self.reroll_below:
+                value = randint(1, self.sides)
+            if self.explode:
+                last, explosions = value, 0
+                while last == self.sides and explosions < MAX_EXPLOSIONS:
+                    last = randint(1, self.sides)
+                    value += last
+                    explosions += 1
+            faces.append(value)
+
+        if self.keep is not None:
+            order = sorted(range(self.count), key=faces.__getitem__, reverse=self.keep_highest)
+            kept = sorted(order[: self.keep])
+            faces = [faces[i] for i in kept]
+        return [self.sign * value for value in faces]
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        """Vectorized totals of this term for size independent rolls"""
+        faces = rng.integers(1, self.sides + 1, size=(size, self.count), dtype=np.int16)
+        if self.reroll_below:
+            reroll = faces <= self.reroll_below
+            faces[reroll] = rng.integers(1, self.sides + 1, size=int(reroll.sum()), dtype=np.int16)
+        if self.explode:
+            last = faces.copy()
+            for _ in range(MAX_EXPLOSIONS):
+                live = last == self.sides
+                live_count = int(live.sum())
+                if not live_count:
+                    break
+                last = np.zeros_like(faces)
+                last[live] = rng.integers(1, self.sides + 1, size=live_count, dtype=np.int16)
+                faces += last
+        if self.keep is not None:
+            faces.sort(axis=1)
+            faces = faces[:, self.count - self.keep :] if self.keep_highest else faces[:, : self.keep]
+        return self.sign * faces.sum(axis=1, dtype=np.int64)
+
+    def die_pmf(self) -> np.ndarray:
+        """Probability of each single-die value, indexed by value"""
+        plain = np.zeros(self.sides + 1)
+        plain[1:] = 1 / self.sides
+        first = plain.copy()
+        if self.reroll_below:
+            first[1 : self.reroll_below + 1] = 0
+            first[1:] += self.reroll_below / self.sides * plain[1:]
+        if not self.explode:
+            return first
+
+        # Grow the explosion chain from the innermost roll outwards; only
+        # the first roll of a die is subject to the reroll
+        chain = plain
+        for _ in range(MAX_EXPLOSIONS - 1):
+            chain = self._explode_once(plain, chain)
+        return self._explode_once(first, chain)
+
+    def _explode_once(self, roll: np.ndarray, rest: np.ndarray) -> np.ndarray:
+        """Value of a roll that adds rest when it lands on the max face"""
+        value = np.zeros(self.sides + rest.size)
+        value[: self.sides] = roll[: self.sides]
+        value[self.sides :] += roll[self.sides] * rest
+        return value
+
+    def distribution(self) -> tuple[int, np.ndarray]:
+        """Exact (offset, pmf) of this term's signed contribution"""
+        die = self.die_pmf()
+        if self.keep is None:
+            pmf = np.ones(1)
+            for _ in range(self.count):
+                pmf = np.convolve(pmf, die)
+        else:
+            pmf = _kept_sum_pmf(die, self.count, self.keep, self.keep_highest)
+
+        nonzero = np.flatnonzero(pmf)
+        offset, pmf = int(nonzero[0]), pmf[nonzero[0] : nonzero[-1] + 1]
+        if self.sign < 0:
+            return -(offset + pmf.size - 1), pmf[::-1]
+        return offset, pmf
+
+
+def _kept_sum_pmf(die: np.ndarray, count: int, keep: int, highest: bool) -> np.ndarray:
+    """
+    PMF of the sum of the highest (or lowest) keep of count i.i.d. dice.
+
+    Faces are visited from best to worst; dp[a] holds the kept-sum
+    distribution once a dice have been assigned a face. Choosing c of the
+    remaining dice for the current face multiplies by C(remaining, c) * p^c,
+    so the products of the binomials are the multinomial coefficients.
+    """
+    faces = np.flatnonzero(die)
+    if highest:
+        faces = faces[::-1]
+    max_sum = keep * int(faces.max())
+    dp = np.zeros((count + 1, max_sum + 1))
+    dp[0, 0] = 1.0
+    for face in faces:
+        p = die[face]
+        updated = np.zeros_like(dp)
+        for assigned in range(count + 1):
+            row = dp[assigned]
+            if not row.any():
+                continue
+            kept_before = min(assigned, keep)
+            for chosen in range(count - assigned + 1):
+                weight = comb(count - assigned, chosen) * p**chosen
+                shift = (min(assigned + chosen, keep) - kept_before) * int(face)
+                updated[assigned + chosen, shift:] += weight * row[: max_sum + 1 - shift]
+        dp = updated
+    return dp[count]
+
+
+@dataclass(frozen=True)
+class DiceExpression:
+    """
+    A compiled dice expression: a sum of dice terms plus a constant.
+
+    Instances are immutable and shared through compile_dice, so rolling,
+    sampling and exact distributions all reuse one parse.
+    """
+
+    terms: tuple[DiceTerm, ...]
+    constant: int = 0
+
+    def __str__(self) -> str:
+        text = ""
+        for term in self.terms:
+            sign = "-" if term.sign < 0 else "+"
+            text += f"{sign}{term}" if text or term.sign < 0 else str(term)
+        if self.constant or not text:
+            text += f"{self.constant:+d}" if text else str(self.constant)
+        return text
+
+    def as_simple(self) -> tuple[int, int, int] | None:
+        """(num_dice, die_size, modifier) for a plain XdY±Z expression, else None"""
+        if len(self.terms) != 1:
+            return None
+        term = self.terms[0]
+        if term.sign < 0 or not term.is_plain:
+            return None
+        return term.count, term.sides, self.constant
+
+    @cached_property
+    def doubled(self) -> "DiceExpression":
+        """Critical-hit variant: every dice term rolls twice the dice, constants unchanged"""
+        return DiceExpression(
+            terms=tuple(
+                replace(
+                    term,
+                    count=term.count * 2,
+                    keep=None if term.keep is None else term.keep * 2,
+                )
+                for term in self.terms
+            ),
+            constant=self.constant,
+        )
+
+    def distribution_cost(self) -> int:
+        """Rough multiply-adds needed by distribution, including combining terms"""
+        cost, width = 0, 1
+        for term in self.terms:
+            low, high = term.value_range()
+            cost += term.distribution_cost() + width * (high - low + 1)
+            width += high - low
+        return cost
+
+    @property
+    def min_total(self) -> int:
+        return self.constant + sum(term.value_range()[0] for term in self.terms)
+
+    @property
+    def max_total(self) -> int:
+        return self.constant + sum(term.value_range()[1] for term in self.terms)
+
+    def roll(self, randint: Callable[[int, int], int] | None = None) -> DiceRoll:
+        """
+        Roll the expression once.
+
+        Args:
+            randint: Inclusive integer source, defaults to the thread's dice RNG
+
+        Returns:
+            DiceRoll with the total and the kept dice
+        """
+        randint = randint or rng.randint
+        rolls = [value for term in self.terms for value in term.roll(randint)]
+        return DiceRoll(total=sum(rolls) + self.constant, rolls=rolls)
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        """Totals of size independent rolls as an int64 array"""
+        totals = np.full(size, self.constant, dtype=np.int64)
+        for term in self.terms:
+            totals += term.sample(rng, size)
+        return totals
+
+    @cached_property
+    def distribution(self) -> tuple[int, np.ndarray]:
+        """Exact (offset, pmf) of the total; the pmf is read-only and shared"""
+        offset, pmf = self.constant, np.ones(1)
+        for term in self.terms:
+            term_offset, term_pmf = term.distribution()
+            offset += term_offset
+            pmf = np.convolve(pmf, term_pmf)
+        pmf.setflags(write=False)
+        return offset, pmf
+
+    @cached_property
+    def mean(self) -> float:
+        """Expected total"""
+        offset, pmf = self.distribution
+        return float((np.arange(pmf.size) + offset) @ pmf)
+
+
+def _parse_term(match: re.Match, sign: int) -> DiceTerm:
+    count, sides = int(match["count"]), int(match["sides"])
+    if not 1 <= count <= MAX_DICE:
+        raise ValueError(f"Dice count must be between 1 and {MAX_DICE}")
+    if not 1 <= sides <= MAX_SIDES:
+        raise ValueError(f"Die size must be between 1 and {MAX_SIDES}")
+
+    options: dict = {}
+    for name, value, bang in _MODIFIER.findall(match["mods"].lower()):
+        if bang:
+            if "explode" in options:
+                raise ValueError("A term can only explode once")
+            if sides < 2:
+                raise ValueError("Exploding dice need at least 2 sides")
+            options["explode"] = True
+        elif name == "r":
+            if "reroll_below" in options:
+                raise ValueError("A term can only have one reroll")
+            if not 1 <= int(value) < sides:
+                raise ValueError(f"Reroll threshold must be between 1 and {sides - 1}")
+            options["reroll_below"] = int(value)
+        else:
+            if "keep" in options:
+                raise ValueError("A term can only have one keep or drop")
+            n = int(value)
+            if not 0 <= n <= count:
+                raise ValueError(f"Cannot keep or drop {n} of {count} dice")
+            if name[0] == "k":
+                options["keep"], options["keep_highest"] = n, name == "kh"
+            else:
+                options["keep"], options["keep_highest"] = count - n, name == "dl"
+            if options["keep"] == 0:
+                raise ValueError("At least one die must be kept")
+
+    return DiceTerm(count=count, sides=sides, sign=sign, **options)
+
+
+@lru_cache(maxsize=settings.dice_cache_size)
+def compile_dice(notation: str) -> DiceExpression:
+    """
+    Parse dice notation into a cached, reusable expression.
+
+    Args:
+        notation: Dice expression (e.g., "2d6+3", "4d6kh3", "1d20-1d4")
+
+    Returns:
+        Compiled DiceExpression
+
+    Raises:
+        ValueError: If the notation does not match the grammar or exceeds
+            limits, including for its critical-hit variant
+
+    Example:
+        compile_dice("2d6+1d4+3").roll().total  # Rolls 2d6 + 1d4 + 3
+    """
+    text = re.sub(r"\s+", "", notation).lower()
+    position, sign, expect_term = 0, 1, True
+    terms: list[DiceTerm] = []
+    constant = 0
+
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if match is None or match.end() == position:
+            raise ValueError(f"Invalid dice notation: '{notation}'")
+        position = match.end()
+
+        if match["op"]:
+            if expect_term:
+                raise ValueError(f"Invalid dice notation: '{notation}'")
+            sign, expect_term = (1 if match["op"] == "+" else -1), True
+            continue
+        if not expect_term:
+            raise ValueError(f"Invalid dice notation: '{notation}'")
+
+        if match["dice"]:
+            terms.append(_parse_term(match, sign))
+        else:
+            constant += sign * int(match["number"])
+        expect_term = False
+
+    if expect_term:
+        raise ValueError(f"Invalid dice notation: '{notation}'")
+    if len(terms) > MAX_TERMS:
+        raise ValueError(f"Expressions are limited to {MAX_TERMS} dice terms")
+    if abs(constant) > MAX_CONSTANT:
+        raise ValueError(f"Constant modifier must be within ±{MAX_CONSTANT}")
+
+    expression = DiceExpression(terms=tuple(terms), constant=constant)
+    critical = expression.doubled
+    if any(term.count > MAX_DICE for term in critical.terms):
+        raise ValueError(
+            f"Dice count must be at most {MAX_DICE // 2} so critical hits stay within {MAX_DICE}"
+        )
+    if critical.distribution_cost() > MAX_DISTRIBUTION_COST:
+        raise ValueError(f"Dice expression is too expensive to evaluate exactly: '{notation}'")
+    return expression
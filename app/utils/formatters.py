@@ -1,5 +1,8 @@
 """String formatting and text utilities"""
 
+import json
+from typing import Any
+
 
 def format_modifier(value: int) -> str:
     """
@@ -66,3 +69,21 @@ def titlecase(text: str) -> str:
             result.append(word.lower())
     
     return ' '.join(result)
+
+
+def format_sse_event(event: str, data: Any) -> str:
+    """
+    Format one Server-Sent Events message with a JSON payload.
+    
+    Args:
+        event: Event name (the client's addEventListener type)
+        data: JSON-serializable payload
+    
+    Returns:
+        The message, terminated by a blank line
+    
+    Example:
+        format_sse_event("done", {"trials": 10})  # 'event: done\ndata: {"trials":10}\n\n'
+    """
+    payload = json.dumps(data, separators=(",", ":"))
+    return f"event: {event}\ndata: {payload}\n\n"
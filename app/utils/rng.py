@@ -0,0 +1,155 @@
+"""Per-thread random number generation with buffered dice
+
+Every thread gets its own NumPy PCG64 generator, so concurrent requests
+never contend for (or interleave draws from) one shared generator. Single
+dice are served from per-die-size buffers that are refilled with one
+vectorized draw, which is far cheaper than a Python-level call per die.
+
+Thread generators are spawned from one root SeedSequence. Seeding the root
+(RNG_SEED setting or seed_rng) makes a run reproducible.
+"""
+
+import os
+import threading
+from collections.abc import Sequence
+from contextlib import contextmanager
+from typing import TypeVar
+
+import numpy as np
+
+from app.config import settings
+
+T = TypeVar("T")
+
+# Buffers start small so rarely used die sizes stay cheap, then double per refill
+MIN_BUFFER = 64
+MAX_BUFFER = 4096
+
+
+class DiceRNG:
+    """
+    Random source backed by a PCG64 generator and per-range roll buffers.
+
+    Not thread-safe by design: use get_rng() to obtain the calling
+    thread's instance.
+    """
+
+    def __init__(self, seed: int | np.random.SeedSequence | None = None):
+        self.generator = np.random.Generator(np.random.PCG64(seed))
+        self._buffers: dict[int, list[int]] = {}
+        self._buffer_sizes: dict[int, int] = {}
+        self._floats: list[float] = []
+
+    def roll(self, sides: int) -> int:
+        """Roll one die with the given number of sides"""
+        buffer = self._buffers.get(sides)
+        if not buffer:
+            size = min(self._buffer_sizes.get(sides, MIN_BUFFER // 2) * 2, MAX_BUFFER)
+            self._buffer_sizes[sides] = size
+            buffer = self.generator.integers(1, sides + 1, size=size).tolist()
+            self._buffers[sides] = buffer
+        return buffer.pop()
+
+    def randint(self, low: int, high: int) -> int:
+        """Random integer in [low, high], inclusive like random.randint"""
+        return low - 1 + self.roll(high - low + 1)
+
+    def choice(self, seq: Sequence[T]) -> T:
+        """Random element of a non-empty sequence"""
+        return seq[self.roll(len(seq)) - 1]
+
+    def random(self) -> float:
+        """Random float in [0, 1)"""
+        if not self._floats:
+            self._floats = self.generator.random(MAX_BUFFER).tolist()
+        return self._floats.pop()
+
+
+_local = threading.local()
+_lock = threading.Lock()
+_root = np.random.SeedSequence(settings.rng_seed)
+_generation = 0
+
+
+def seed_rng(seed: int | None = None) -> None:
+    """
+    Reseed every thread's generator from a new root seed.
+
+    Threads pick up the new stream on their next draw. With a fixed seed,
+    a single-threaded run replays exactly.
+    """
+    global _root, _generation
+    with _lock:
+        _root = np.random.SeedSequence(seed)
+        _generation += 1
+
+
+def get_rng() -> DiceRNG:
+    """Return the generator for the calling thread (or its installed override)"""
+    override = getattr(_local, "override", None)
+    if override is not None:
+        return override
+    rng = getattr(_local, "rng", None)
+    if rng is None or _local.generation != _generation:
+        with _lock:
+            (child,) = _root.spawn(1)
+            _local.generation = _generation
+        rng = _local.rng = DiceRNG(child)
+    return rng
+
+
+@contextmanager
+def use_rng(rng: DiceRNG):
+    """
+    Route the calling thread's draws through one generator, e.g. for benchmarks.
+
+    The override is thread-local like the generators themselves, so a
+    DiceRNG is never shared between threads.
+    """
+    previous = getattr(_local, "override", None)
+    _local.override = rng
+    try:
+        yield rng
+    finally:
+        _local.override = previous
+
+
+def _reset_after_fork() -> None:
+    # A forked worker must not replay its parent's buffered rolls, and the
+    # lock may have been held by a thread that does not exist in the child
+    global _lock
+    _lock = threading.Lock()
+    seed_rng(None)
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def roll(sides: int) -> int:
+    """Roll one die on the calling thread's generator"""
+    return get_rng().roll(sides)
+
+
+def randint(low: int, high: int) -> int:
+    """Random integer in [low, high] on the calling thread's generator"""
+    return get_rng().randint(low, high)
+
+
+def choice(seq: Sequence[T]) -> T:
+    """Random element of a sequence on the calling thread's generator"""
+    return get_rng().choice(seq)
+
+
+def random() -> float:
+    """Random float in [0, 1) on the calling thread's generator"""
+    return get_rng().random()
+
+
+def choices(seq: Sequence[T], k: int) -> list[T]:
+    """k random elements (with replacement) drawn in one vectorized call"""
+    return [seq[i] for i in get_rng().generator.integers(0, len(seq), size=k)]
+
+
+def generator() -> np.random.Generator:
+    """The calling thread's NumPy generator, for vectorized draws"""
+    return get_rng().generator
@@ -1,5 +1,7 @@
 """Validation utilities for D&D game data"""
 
+from .dice_expression import compile_dice
+
 
 def validate_ability_score(score: int) -> bool:
     """
@@ -51,11 +53,13 @@ def validate_dice_notation(notation: str) -> bool:
     Validate dice notation format.
     
     Args:
-        notation: Dice notation string (e.g., "2d6+3")
+        notation: Dice expression (e.g., "2d6+3", "4d6kh3")
     
     Returns:
         True if valid format, False otherwise
     """
-    import re
-    pattern = r'^\d+d\d+([+-]\d+)?$'
-    return bool(re.match(pattern, notation))
+    try:
+        compile_dice(notation)
+    except ValueError:
+        return False
+    return True
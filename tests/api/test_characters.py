@@ -91,3 +91,28 @@ def test_get_random_character(client):
         ]
     )
     assert all(3 <= stats[key] <= 18 for key in stats)
+
+
+def test_get_random_characters_with_count(client):
+    """Test generating a list of random characters"""
+    response = client.get("/api/v1/characters/random?count=1000")
+    assert response.status_code == 200
+    data = response.json()
+    assert isinstance(data, list)
+    assert len(data) == 1000
+    assert all(data[0].keys() == character.keys() for character in data)
+    assert all(3 <= character["stats"]["wisdom"] <= 18 for character in data)
+
+
+def test_get_random_characters_count_capped(client):
+    """Test counts above the cap are rejected"""
+    response = client.get("/api/v1/characters/random?count=5001")
+    assert response.status_code == 422
+
+
+def test_get_generated_character_by_id(client):
+    """Test a generated character can be fetched again by its id"""
+    character = client.get("/api/v1/characters/random").json()
+    response = client.get(f"/api/v1/characters/{character['id']}")
+    assert response.status_code == 200
+    assert response.json() == character
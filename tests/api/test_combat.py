@@ -1,7 +1,12 @@
 """Tests for combat API endpoints"""
 
+import json
 from unittest.mock import patch
 
+from fastapi.testclient import TestClient
+
+from app.main import app
+
 
 class TestCombatCalculatorInfo:
     """Tests for combat calculator info endpoint"""
@@ -21,7 +26,7 @@ class TestAttackRollEndpoint:
 
     def test_basic_attack_roll(self, client):
         """Test basic attack roll endpoint"""
-        with patch("random.randint", return_value=15):
+        with patch("app.utils.rng.randint", return_value=15):
             response = client.post(
                 "/api/v1/combat/attack-roll",
                 json={"attack_bonus": 5, "armor_class": 15, "advantage": "normal"},
@@ -41,7 +46,7 @@ class TestAttackRollEndpoint:
 
     def test_attack_roll_with_advantage(self, client):
         """Test attack roll with advantage"""
-        with patch("random.randint", side_effect=[10, 18]):
+        with patch("app.utils.rng.randint", side_effect=[10, 18]):
             response = client.post(
                 "/api/v1/combat/attack-roll",
                 json={"attack_bonus": 3, "armor_class": 15, "advantage": "advantage"},
@@ -57,7 +62,7 @@ class TestAttackRollEndpoint:
 
     def test_attack_roll_with_disadvantage(self, client):
         """Test attack roll with disadvantage"""
-        with patch("random.randint", side_effect=[18, 10]):
+        with patch("app.utils.rng.randint", side_effect=[18, 10]):
             response = client.post(
                 "/api/v1/combat/attack-roll",
                 json={
@@ -77,7 +82,7 @@ class TestAttackRollEndpoint:
 
     def test_critical_hit(self, client):
         """Test natural 20 (critical hit)"""
-        with patch("random.randint", return_value=20):
+        with patch("app.utils.rng.randint", return_value=20):
             response = client.post(
                 "/api/v1/combat/attack-roll",
                 json={"attack_bonus": 0, "armor_class": 25, "advantage": "normal"},
@@ -91,7 +96,7 @@ class TestAttackRollEndpoint:
 
     def test_critical_miss(self, client):
         """Test natural 1 (critical miss)"""
-        with patch("random.randint", return_value=1):
+        with patch("app.utils.rng.randint", return_value=1):
             response = client.post(
                 "/api/v1/combat/attack-roll",
                 json={"attack_bonus": 50, "armor_class": 10, "advantage": "normal"},
@@ -120,7 +125,7 @@ class TestDamageRollEndpoint:
 
     def test_basic_damage_roll(self, client):
         """Test basic damage roll endpoint"""
-        with patch("random.randint", side_effect=[4, 6]):
+        with patch("app.utils.rng.randint", side_effect=[4, 6]):
             response = client.post(
                 "/api/v1/combat/damage-roll",
                 json={
@@ -140,7 +145,7 @@ class TestDamageRollEndpoint:
 
     def test_critical_damage_roll(self, client):
         """Test damage roll with critical hit"""
-        with patch("random.randint", side_effect=[3, 5, 4, 6]):
+        with patch("app.utils.rng.randint", side_effect=[3, 5, 4, 6]):
             response = client.post(
                 "/api/v1/combat/damage-roll",
                 json={
@@ -160,7 +165,7 @@ class TestDamageRollEndpoint:
 
     def test_damage_no_modifier(self, client):
         """Test damage roll without modifier"""
-        with patch("random.randint", side_effect=[3, 4, 5]):
+        with patch("app.utils.rng.randint", side_effect=[3, 4, 5]):
             response = client.post(
                 "/api/v1/combat/damage-roll",
                 json={
@@ -178,7 +183,7 @@ class TestDamageRollEndpoint:
 
     def test_damage_negative_modifier(self, client):
         """Test damage roll with negative modifier"""
-        with patch("random.randint", return_value=5):
+        with patch("app.utils.rng.randint", return_value=5):
             response = client.post(
                 "/api/v1/combat/damage-roll",
                 json={
@@ -194,6 +199,28 @@ class TestDamageRollEndpoint:
             assert data["modifier"] == -2
             assert data["total"] == 3
 
+    def test_damage_compound_expression(self, client):
+        """Test damage roll with several dice terms"""
+        with patch("app.utils.rng.randint", side_effect=[2, 5, 3]):
+            response = client.post(
+                "/api/v1/combat/damage-roll",
+                json={"damage_dice": "2d6+1d4+3", "damage_type": "fire"},
+            )
+            assert response.status_code == 200
+            data = response.json()
+
+            assert data["rolls"] == [2, 5, 3]
+            assert data["modifier"] == 3
+            assert data["total"] == 13
+
+    def test_damage_invalid_notation(self, client):
+        """Test malformed dice notation is rejected"""
+        response = client.post(
+            "/api/v1/combat/damage-roll",
+            json={"damage_dice": "2d6++3", "damage_type": "fire"},
+        )
+        assert response.status_code == 422
+
     def test_various_damage_types(self, client):
         """Test different damage types"""
         damage_types = [
@@ -213,7 +240,7 @@ class TestDamageRollEndpoint:
         ]
 
         for dmg_type in damage_types:
-            with patch("random.randint", return_value=4):
+            with patch("app.utils.rng.randint", return_value=4):
                 response = client.post(
                     "/api/v1/combat/damage-roll",
                     json={
@@ -244,7 +271,7 @@ class TestSavingThrowEndpoint:
 
     def test_successful_save(self, client):
         """Test successful saving throw"""
-        with patch("random.randint", return_value=15):
+        with patch("app.utils.rng.randint", return_value=15):
             response = client.post(
                 "/api/v1/combat/saving-throw",
                 json={
@@ -268,7 +295,7 @@ class TestSavingThrowEndpoint:
 
     def test_failed_save(self, client):
         """Test failed saving throw"""
-        with patch("random.randint", return_value=8):
+        with patch("app.utils.rng.randint", return_value=8):
             response = client.post(
                 "/api/v1/combat/saving-throw",
                 json={
@@ -287,7 +314,7 @@ class TestSavingThrowEndpoint:
 
     def test_save_with_advantage(self, client):
         """Test saving throw with advantage"""
-        with patch("random.randint", side_effect=[8, 16]):
+        with patch("app.utils.rng.randint", side_effect=[8, 16]):
             response = client.post(
                 "/api/v1/combat/saving-throw",
                 json={
@@ -307,7 +334,7 @@ class TestSavingThrowEndpoint:
 
     def test_natural_20_save(self, client):
         """Test natural 20 on saving throw"""
-        with patch("random.randint", return_value=20):
+        with patch("app.utils.rng.randint", return_value=20):
             response = client.post(
                 "/api/v1/combat/saving-throw",
                 json={
@@ -327,7 +354,7 @@ class TestSavingThrowEndpoint:
 
     def test_natural_1_save(self, client):
         """Test natural 1 on saving throw"""
-        with patch("random.randint", return_value=1):
+        with patch("app.utils.rng.randint", return_value=1):
             response = client.post(
                 "/api/v1/combat/saving-throw",
                 json={
@@ -347,7 +374,7 @@ class TestSavingThrowEndpoint:
 
     def test_no_proficiency_bonus(self, client):
         """Test save without proficiency bonus"""
-        with patch("random.randint", return_value=10):
+        with patch("app.utils.rng.randint", return_value=10):
             response = client.post(
                 "/api/v1/combat/saving-throw",
                 json={
@@ -369,7 +396,7 @@ class TestFullCombatEndpoint:
 
     def test_successful_combat(self, client):
         """Test full combat calculation with hit"""
-        with patch("random.randint", side_effect=[15, 4, 6]):
+        with patch("app.utils.rng.randint", side_effect=[15, 4, 6]):
             # 15 for attack, [4, 6] for 2d6 damage
             response = client.post(
                 "/api/v1/combat/combat",
@@ -399,7 +426,7 @@ class TestFullCombatEndpoint:
 
     def test_missed_combat(self, client):
         """Test full combat calculation with miss"""
-        with patch("random.randint", return_value=5):
+        with patch("app.utils.rng.randint", return_value=5):
             response = client.post(
                 "/api/v1/combat/combat",
                 json={
@@ -421,7 +448,7 @@ class TestFullCombatEndpoint:
 
     def test_critical_hit_combat(self, client):
         """Test full combat with critical hit"""
-        with patch("random.randint", side_effect=[20, 3, 5, 4, 6]):
+        with patch("app.utils.rng.randint", side_effect=[20, 3, 5, 4, 6]):
             # 20 for crit, [3, 5, 4, 6] for doubled 2d6
             response = client.post(
                 "/api/v1/combat/combat",
@@ -448,7 +475,7 @@ class TestFullCombatEndpoint:
 
     def test_critical_miss_combat(self, client):
         """Test full combat with critical miss"""
-        with patch("random.randint", return_value=1):
+        with patch("app.utils.rng.randint", return_value=1):
             response = client.post(
                 "/api/v1/combat/combat",
                 json={
@@ -468,7 +495,7 @@ class TestFullCombatEndpoint:
 
     def test_combat_with_advantage(self, client):
         """Test full combat with advantage"""
-        with patch("random.randint", side_effect=[10, 18, 5, 3]):
+        with patch("app.utils.rng.randint", side_effect=[10, 18, 5, 3]):
             # [10, 18] for advantage, [5, 3] for damage
             response = client.post(
                 "/api/v1/combat/combat",
@@ -490,7 +517,7 @@ class TestFullCombatEndpoint:
 
     def test_combat_with_disadvantage(self, client):
         """Test full combat with disadvantage"""
-        with patch("random.randint", side_effect=[18, 10]):
+        with patch("app.utils.rng.randint", side_effect=[18, 10]):
             response = client.post(
                 "/api/v1/combat/combat",
                 json={
@@ -508,3 +535,282 @@ class TestFullCombatEndpoint:
             assert data["attack"]["second_roll"] == 18
             assert data["attack"]["hit"] is False
             assert data["damage"] is None
+
+
+class TestBatchEndpoint:
+    """Tests for batch combat endpoint"""
+
+    def test_batch(self, client):
+        """Test resolving a mixed batch"""
+        response = client.post(
+            "/api/v1/combat/batch",
+            json={
+                "requests": [
+                    {"type": "attack-roll", "attack_bonus": 5, "armor_class": 15},
+                    {"type": "damage-roll", "damage_dice": "2d6+3", "damage_type": "slashing"},
+                    {"type": "saving-throw", "ability_modifier": 2, "dc": 15},
+                    {
+                        "type": "combat",
+                        "attack_bonus": 7,
+                        "armor_class": 18,
+                        "damage_dice": "1d8+5",
+                        "damage_type": "piercing",
+                    },
+                ]
+            },
+        )
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [r["type"] for r in results] == [
+            "attack-roll",
+            "damage-roll",
+            "saving-throw",
+            "combat",
+        ]
+        assert 5 <= results[1]["total"] <= 15
+        assert "attack" in results[3]
+
+    def test_batch_unknown_type(self, client):
+        """Test entries with an unknown type are rejected"""
+        response = client.post(
+            "/api/v1/combat/batch",
+            json={"requests": [{"type": "fireball", "dc": 15}]},
+        )
+        assert response.status_code == 422
+
+    def test_batch_empty(self, client):
+        """Test an empty batch is rejected"""
+        response = client.post("/api/v1/combat/batch", json={"requests": []})
+        assert response.status_code == 422
+
+
+class TestAreaEffectEndpoint:
+    """Tests for area-effect saving throws"""
+
+    def test_area_effect(self, client):
+        """Test a fireball against catalog and custom targets"""
+        response = client.post(
+            "/api/v1/combat/area-effect",
+            json={
+                "dc": 100,
+                "ability": "dexterity",
+                "damage_dice": "8d6",
+                "damage_type": "fire",
+                "targets": [
+                    {"monster_id": 9},
+                    {"name": "Fighter", "save_modifier": 4, "resistances": ["fire"]},
+                ],
+            },
+        )
+        assert response.status_code == 200
+        data = response.json()
+        full = data["damage_roll"]["total"]
+        skeleton, fighter = data["results"]
+        assert skeleton["name"] == "Skeleton"
+        assert skeleton["save_modifier"] == 2
+        assert not skeleton["success"] and skeleton["damage"] == full
+        assert fighter["defenses"] == ["resistant"]
+        assert fighter["damage"] == full // 2
+        assert data["successes"] == 0
+        assert data["total_damage"] == full + full // 2
+
+    def test_area_effect_missing_monster(self, client):
+        """Test unknown monster ids are reported"""
+        response = client.post(
+            "/api/v1/combat/area-effect",
+            json={
+                "dc": 15,
+                "ability": "wisdom",
+                "damage_dice": "2d6",
+                "damage_type": "psychic",
+                "targets": [{"monster_id": 99999}],
+            },
+        )
+        assert response.status_code == 404
+        assert "99999" in response.json()["detail"]
+
+    def test_area_effect_target_needs_save(self, client):
+        """Test a target without a monster or save modifier is rejected"""
+        response = client.post(
+            "/api/v1/combat/area-effect",
+            json={
+                "dc": 15,
+                "ability": "wisdom",
+                "damage_dice": "2d6",
+                "damage_type": "psychic",
+                "targets": [{"name": "Nobody"}],
+            },
+        )
+        assert response.status_code == 422
+
+    def test_area_effect_save_modifier_out_of_range(self, client):
+        """Test save modifiers beyond any stat block are rejected"""
+        response = client.post(
+            "/api/v1/combat/area-effect",
+            json={
+                "dc": 15,
+                "ability": "dexterity",
+                "damage_dice": "2d6",
+                "damage_type": "fire",
+                "targets": [{"name": "Overflow", "save_modifier": 10**20}],
+            },
+        )
+        assert response.status_code == 422
+
+
+class TestSimulateEndpoint:
+    """Tests for Monte Carlo simulation endpoint"""
+
+    def test_simulate(self, client):
+        """Test simulating combat turns"""
+        response = client.post(
+            "/api/v1/combat/simulate",
+            json={
+                "attack_bonus": 5,
+                "armor_class": 15,
+                "damage_dice": "2d6+3",
+                "damage_type": "slashing",
+                "trials": 20000,
+                "seed": 1,
+            },
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["trials"] == 20000
+        assert 0 < data["crit_rate"] < data["hit_rate"] < 1
+        assert set(data["percentiles"]) == {"p5", "p25", "p50", "p75", "p95"}
+        assert sum(b["count"] for b in data["histogram"]) == 20000
+
+    def test_simulate_trials_limit(self, client):
+        """Test trial count is capped"""
+        response = client.post(
+            "/api/v1/combat/simulate",
+            json={
+                "attack_bonus": 5,
+                "armor_class": 15,
+                "damage_dice": "2d6+3",
+                "damage_type": "slashing",
+                "trials": 50_000_000,
+            },
+        )
+        assert response.status_code == 422
+
+    def test_simulate_bonus_out_of_range(self, client):
+        """Test attack bonuses and ACs too large for the roll arrays are rejected"""
+        for field in ("attack_bonus", "armor_class"):
+            response = client.post(
+                "/api/v1/combat/simulate",
+                json={
+                    "attack_bonus": 5,
+                    "armor_class": 15,
+                    "damage_dice": "2d6+3",
+                    "damage_type": "slashing",
+                    field: 10**20,
+                },
+            )
+            assert response.status_code == 422
+
+    def test_simulate_stream(self, client):
+        """Test streaming simulation estimates as Server-Sent Events"""
+        response = client.post(
+            "/api/v1/combat/simulate/stream",
+            json={
+                "attack_bonus": 5,
+                "armor_class": 15,
+                "damage_dice": "2d6+3",
+                "damage_type": "slashing",
+                "trials": 30000,
+                "chunk_trials": 10000,
+                "seed": 1,
+            },
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        messages = [m for m in response.text.split("\n\n") if m]
+        events = [m.splitlines()[0] for m in messages]
+        assert events == ["event: estimate"] * 3 + ["event: result"]
+        result = json.loads(messages[-1].splitlines()[1].removeprefix("data: "))
+        assert result["trials"] == 30000
+
+
+class TestProbabilityEndpoints:
+    """Tests for exact probability endpoints"""
+
+    def test_attack_roll_probability(self, client):
+        """Test exact attack probabilities"""
+        response = client.post(
+            "/api/v1/combat/probability/attack-roll",
+            json={"attack_bonus": 5, "armor_class": 15},
+        )
+        assert response.status_code == 200
+        assert abs(response.json()["hit_probability"] - 0.55) < 1e-9
+
+    def test_saving_throw_probability(self, client):
+        """Test exact saving throw probability"""
+        response = client.post(
+            "/api/v1/combat/probability/saving-throw",
+            json={"ability_modifier": 0, "dc": 11},
+        )
+        assert response.status_code == 200
+        assert abs(response.json()["success_probability"] - 0.5) < 1e-9
+
+    def test_probability_bonus_out_of_range(self, client):
+        """Test bonuses too large for the probability arrays are rejected"""
+        response = client.post(
+            "/api/v1/combat/probability/attack-roll",
+            json={"attack_bonus": 10**20, "armor_class": 15},
+        )
+        assert response.status_code == 422
+        for field in ("ability_modifier", "proficiency_bonus"):
+            response = client.post(
+                "/api/v1/combat/probability/saving-throw",
+                json={"ability_modifier": 0, "dc": 11, field: 10**20},
+            )
+            assert response.status_code == 422
+
+    def test_damage_roll_probability(self, client):
+        """Test exact damage distribution"""
+        response = client.post(
+            "/api/v1/combat/probability/damage-roll",
+            json={"damage_dice": "1d6", "damage_type": "fire"},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [p["value"] for p in data["pmf"]] == [1, 2, 3, 4, 5, 6]
+        assert abs(data["mean_damage"] - 3.5) < 1e-9
+
+    def test_damage_roll_probability_too_expensive(self, client):
+        """Test expressions too costly to evaluate exactly are rejected up front"""
+        response = client.post(
+            "/api/v1/combat/probability/damage-roll",
+            json={"damage_dice": "20d1000kh10", "damage_type": "fire"},
+        )
+        assert response.status_code == 422
+
+    def test_combat_probability(self, client):
+        """Test exact combat distribution"""
+        response = client.post(
+            "/api/v1/combat/probability/combat",
+            json={
+                "attack_bonus": 5,
+                "armor_class": 15,
+                "damage_dice": "2d6+3",
+                "damage_type": "slashing",
+            },
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert "attack" in data
+        assert data["damage"]["min_damage"] == 0
+        assert data["damage"]["max_damage"] == 27
+
+
+def test_dice_cache_stats_endpoint():
+    """Test the cache is warmed at startup and reports its hit ratio"""
+    with TestClient(app) as client:
+        response = client.get("/api/v1/combat/dice-cache")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["distributions"]["size"] > 0
+    assert 0.0 <= data["parsed"]["hit_ratio"] <= 1.0
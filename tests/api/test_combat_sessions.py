@@ -0,0 +1,146 @@
+"""Tests for combat session endpoints"""
+
+import pytest
+from starlette.websockets import WebSocketDisconnect
+
+PARTY = [
+    {"name": "Fighter", "hit_points": 44, "armor_class": 18, "initiative": 18},
+    {"monster_id": 9, "initiative": 10},
+]
+
+
+def _start(client) -> dict:
+    response = client.post("/api/v1/combat/sessions", json={"combatants": PARTY})
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_start_and_get_session(client):
+    """Test starting a session and reading it back"""
+    session = _start(client)
+    assert session["round"] == 1
+    assert session["turn"] == 0
+    skeleton = session["combatants"][1]
+    assert skeleton["name"] == "Skeleton"
+    assert skeleton["immunities"] == ["poison"]
+    assert skeleton["vulnerabilities"] == ["bludgeoning"]
+
+    response = client.get(f"/api/v1/combat/sessions/{session['id']}")
+    assert response.status_code == 200
+    assert response.json() == session
+
+
+def test_session_actions(client):
+    """Test damage, attacks, conditions and turns update the session"""
+    session_id = _start(client)["id"]
+    base = f"/api/v1/combat/sessions/{session_id}"
+
+    damage = client.post(
+        f"{base}/damage", json={"target": 1, "amount": 4, "damage_type": "bludgeoning"}
+    ).json()
+    assert damage["damage"]["applied"] == 8
+    assert damage["target"]["hit_points"] == 5
+
+    attack = client.post(
+        f"{base}/attack",
+        json={
+            "attacker": 1,
+            "target": 0,
+            "attack_bonus": 4,
+            "damage_dice": "1d6+2",
+            "damage_type": "piercing",
+        },
+    )
+    assert attack.status_code == 200
+    assert attack.json()["target"]["slot"] == 0
+
+    conditions = client.post(f"{base}/conditions", json={"target": 0, "add": ["prone"]})
+    assert conditions.json()["conditions"] == ["prone"]
+
+    assert client.post(f"{base}/next-turn").json()["turn"] == 1
+
+
+def test_session_errors(client):
+    """Test unknown sessions, slots and monsters return 404"""
+    assert client.get("/api/v1/combat/sessions/missing").status_code == 404
+    session_id = _start(client)["id"]
+    response = client.post(
+        f"/api/v1/combat/sessions/{session_id}/heal", json={"target": 5, "amount": 3}
+    )
+    assert response.status_code == 404
+    response = client.post("/api/v1/combat/sessions", json={"combatants": [{"monster_id": 9999}]})
+    assert response.status_code == 404
+    response = client.post("/api/v1/combat/sessions", json={"combatants": [{"name": "Nobody"}]})
+    assert response.status_code == 422
+
+
+def test_session_values_out_of_range(client):
+    """Test values too large for the session's columns are rejected, not overflowed"""
+    too_big = {"name": "Titan", "hit_points": 2**31, "armor_class": 15}
+    response = client.post("/api/v1/combat/sessions", json={"combatants": [too_big]})
+    assert response.status_code == 422
+    too_quick = {"name": "Titan", "hit_points": 10, "armor_class": 15, "initiative": 40_000}
+    response = client.post("/api/v1/combat/sessions", json={"combatants": [too_quick]})
+    assert response.status_code == 422
+
+    session_id = _start(client)["id"]
+    response = client.post(
+        f"/api/v1/combat/sessions/{session_id}/heal", json={"target": 0, "amount": 2**31}
+    )
+    assert response.status_code == 422
+
+
+def test_end_session(client):
+    """Test deleting a session"""
+    session_id = _start(client)["id"]
+    assert client.delete(f"/api/v1/combat/sessions/{session_id}").status_code == 204
+    assert client.delete(f"/api/v1/combat/sessions/{session_id}").status_code == 404
+
+
+def test_session_websocket(client):
+    """Test commands over the WebSocket are resolved and broadcast to every client"""
+    session_id = _start(client)["id"]
+    url = f"/api/v1/combat/sessions/{session_id}/ws"
+    with client.websocket_connect(url) as first, client.websocket_connect(url) as second:
+        assert first.receive_json()["state"]["id"] == session_id
+        assert second.receive_json()["state"]["id"] == session_id
+
+        first.send_json({"type": "damage", "target": 1, "amount": 2, "damage_type": "bludgeoning"})
+        for socket in (first, second):
+            update = socket.receive_json()
+            assert update["type"] == "update"
+            assert update["results"][0]["command"] == "damage"
+            assert update["results"][0]["result"]["damage"]["applied"] == 4
+            assert update["state"]["combatants"][1]["hit_points"] == 9
+
+        second.send_json(
+            {
+                "type": "saving-throw",
+                "target": 0,
+                "ability_modifier": 2,
+                "dc": 10,
+                "damage": 10,
+                "damage_type": "fire",
+            }
+        )
+        result = first.receive_json()["results"][0]["result"]
+        assert result["damage"]["applied"] in (5, 10)
+        second.receive_json()
+
+        first.send_json({"type": "heal", "target": 7, "amount": 1})
+        assert first.receive_json()["results"][0]["error"] == "Combatant slot not found in session"
+        first.send_json({"type": "fireball"})
+        assert first.receive_json()["results"][0]["error"]
+        first.send_bytes(b"\x00")
+        assert first.receive_json()["results"][0]["error"] == "Messages must be JSON objects"
+
+        client.post(f"/api/v1/combat/sessions/{session_id}/next-turn")
+        assert second.receive_json()["results"][0]["command"] == "next-turn"
+
+
+def test_session_websocket_unknown_session(client):
+    """Test connecting to a missing session closes with 4404"""
+    with client.websocket_connect("/api/v1/combat/sessions/missing/ws") as socket:
+        with pytest.raises(WebSocketDisconnect) as exc:
+            socket.receive_json()
+    assert exc.value.code == 4404
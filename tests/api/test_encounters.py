@@ -0,0 +1,70 @@
+"""Tests for encounter API endpoints"""
+
+
+def test_build_encounter(client):
+    """Test building an encounter for a party"""
+    response = client.post(
+        "/api/v1/encounters/build",
+        json={"party_levels": [3, 3, 4, 4], "difficulty": "hard", "suggestions": 2},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["party_size"] == 4
+    assert data["thresholds"]["hard"] == 1200
+    assert 1 <= len(data["encounters"]) <= 2
+    for encounter in data["encounters"]:
+        assert data["target_min_xp"] <= encounter["adjusted_xp"] <= data["target_max_xp"]
+
+
+def test_build_encounter_invalid_level(client):
+    """Test party levels are validated"""
+    response = client.post("/api/v1/encounters/build", json={"party_levels": [25]})
+    assert response.status_code == 422
+
+
+SIMULATION_PARTY = [
+    {
+        "name": "Fighter",
+        "hit_points": 44,
+        "armor_class": 18,
+        "attack_bonus": 7,
+        "damage_dice": "1d8+4",
+        "attacks": 2,
+    },
+    {
+        "name": "Cleric",
+        "hit_points": 38,
+        "armor_class": 18,
+        "attack_bonus": 6,
+        "damage_dice": "1d8+3",
+    },
+]
+
+
+def test_simulate_encounter(client):
+    """Test simulating a party against catalog monsters"""
+    response = client.post(
+        "/api/v1/encounters/simulate",
+        json={"party": SIMULATION_PARTY, "monster_ids": [15, 15], "trials": 2000, "seed": 3},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    total = (
+        data["party_win_probability"]
+        + data["monster_win_probability"]
+        + data["unresolved_probability"]
+    )
+    assert abs(total - 1.0) < 1e-9
+    assert data["party_win_probability"] > 0.9
+    assert [c["side"] for c in data["combatants"]] == ["party", "party", "monsters", "monsters"]
+    assert abs(sum(b["probability"] for b in data["party_hit_points_distribution"]) - 1.0) < 1e-9
+
+
+def test_simulate_encounter_unknown_monster(client):
+    """Test unknown monster ids return 404"""
+    response = client.post(
+        "/api/v1/encounters/simulate",
+        json={"party": SIMULATION_PARTY, "monster_ids": [15, 99999]},
+    )
+    assert response.status_code == 404
+    assert "99999" in response.json()["detail"]
@@ -93,3 +93,12 @@ def test_get_items_multiple_filters(client):
         assert item["type"] == "Weapon"
         assert item["magic"] is True
         assert item["cost"] >= 100
+
+
+def test_get_items_full_text_search(client):
+    """Test searching items by description and properties"""
+    response = client.get("/api/v1/items?q=healing")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] > 0
+    assert "Healing" in data["items"][0]["name"]
@@ -0,0 +1,93 @@
+"""Tests for background job endpoints"""
+
+import time
+
+
+def poll(client, job_id: str, timeout: float = 10.0) -> dict:
+    """Poll a job until it has finished"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        data = client.get(f"/api/v1/jobs/{job_id}").json()
+        if data["status"] not in ("queued", "running"):
+            return data
+        time.sleep(0.02)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+def test_submit_and_poll_combat_simulation(client):
+    """Test a combat simulation job runs to completion"""
+    response = client.post(
+        "/api/v1/jobs",
+        json={
+            "kind": "combat-simulation",
+            "request": {
+                "attack_bonus": 5,
+                "armor_class": 15,
+                "damage_dice": "2d6+3",
+                "damage_type": "slashing",
+                "trials": 5000,
+                "seed": 1,
+            },
+        },
+    )
+    assert response.status_code == 202
+    job = response.json()
+    assert job["kind"] == "combat-simulation"
+    assert job["status"] in ("queued", "running", "succeeded")
+
+    data = poll(client, job["id"])
+    assert data["status"] == "succeeded"
+    assert data["progress"] == 1.0
+    assert data["result"]["trials"] == 5000
+
+
+def test_submit_encounter_simulation_unknown_monster(client):
+    """Test encounter jobs validate monster ids up front"""
+    response = client.post(
+        "/api/v1/jobs",
+        json={
+            "kind": "encounter-simulation",
+            "request": {
+                "party": [
+                    {
+                        "name": "Fighter",
+                        "hit_points": 44,
+                        "armor_class": 18,
+                        "attack_bonus": 7,
+                        "damage_dice": "1d8+4",
+                    }
+                ],
+                "monster_ids": [9999],
+            },
+        },
+    )
+    assert response.status_code == 404
+
+
+def test_submit_combat_simulation_out_of_range(client):
+    """Test an attack bonus too large to simulate is rejected before queuing"""
+    response = client.post(
+        "/api/v1/jobs",
+        json={
+            "kind": "combat-simulation",
+            "request": {
+                "attack_bonus": 10**20,
+                "armor_class": 15,
+                "damage_dice": "2d6+3",
+                "damage_type": "slashing",
+            },
+        },
+    )
+    assert response.status_code == 422
+
+
+def test_submit_unknown_kind(client):
+    """Test the job kind is validated"""
+    response = client.post("/api/v1/jobs", json={"kind": "nap", "request": {}})
+    assert response.status_code == 422
+
+
+def test_job_not_found(client):
+    """Test polling or cancelling an unknown job"""
+    assert client.get("/api/v1/jobs/missing").status_code == 404
+    assert client.delete("/api/v1/jobs/missing").status_code == 404
@@ -93,3 +93,119 @@ def test_get_random_monster_with_filters(client):
     data = response.json()
     assert data["type"] == "Dragon"
     assert 5 <= data["challenge_rating"] <= 10
+
+
+def test_get_random_monsters_with_count(client):
+    """Test generating a list of random monsters"""
+    response = client.get("/api/v1/monsters/random?count=50&type=Undead&max_cr=3")
+    assert response.status_code == 200
+    data = response.json()
+    assert isinstance(data, list)
+    assert len(data) == 50
+    for monster in data:
+        assert monster["type"] == "Undead"
+        assert monster["challenge_rating"] <= 3
+
+
+def test_get_generated_monster_by_id(client):
+    """Test a generated monster can be fetched again by its id"""
+    generated = client.get("/api/v1/monsters/random?count=3").json()
+    assert len({monster["id"] for monster in generated}) == 3
+    for monster in generated:
+        response = client.get(f"/api/v1/monsters/{monster['id']}")
+        assert response.status_code == 200
+        assert response.json() == monster
+
+
+def test_get_random_monsters_count_capped(client):
+    """Test counts above the cap are rejected"""
+    response = client.get("/api/v1/monsters/random?count=501")
+    assert response.status_code == 422
+
+
+def test_get_monsters_full_text_search(client):
+    """Test searching monsters by ability text"""
+    response = client.get("/api/v1/monsters?q=breath")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] > 0
+    for monster in data["monsters"]:
+        ability_text = " ".join(
+            f"{action['name']} {action['description']}"
+            for field in ("special_abilities", "actions", "legendary_actions", "reactions")
+            for action in monster.get(field) or []
+        )
+        assert "breath" in ability_text.lower()
+
+
+def test_get_monsters_full_text_search_with_filters(client):
+    """Test full-text search combined with other filters"""
+    response = client.get("/api/v1/monsters?q=breath&type=Dragon")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] > 0
+    for monster in data["monsters"]:
+        assert monster["type"] == "Dragon"
+
+
+def test_get_similar_monsters(client):
+    """Test finding monsters similar to a catalog monster"""
+    response = client.get("/api/v1/monsters/4/similar?k=3&max_cr=3")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["monster_id"] == 4
+    assert len(data["similar"]) == 3
+    for entry in data["similar"]:
+        assert entry["monster"]["id"] != 4
+        assert entry["monster"]["challenge_rating"] <= 3
+        assert entry["distance"] >= 0
+
+
+def test_get_similar_monsters_not_found(client):
+    """Test similar search for a non-existent monster"""
+    response = client.get("/api/v1/monsters/99999/similar")
+    assert response.status_code == 404
+
+
+def test_get_monsters_include_metrics(client):
+    """Test listed and single monsters carry derived metrics"""
+    response = client.get("/api/v1/monsters?limit=100")
+    assert response.status_code == 200
+    for monster in response.json()["monsters"]:
+        assert monster["metrics"]["effective_hit_points"] >= monster["hit_points"]
+
+    response = client.get("/api/v1/monsters/1")
+    assert response.json()["metrics"]["save_dc"] == 21
+
+
+def test_get_monsters_sort_by_metric(client):
+    """Test sorting by a metric, descending"""
+    response = client.get("/api/v1/monsters?sort_by=expected_dpr&descending=true&limit=5")
+    assert response.status_code == 200
+    values = [monster["metrics"]["expected_dpr"] for monster in response.json()["monsters"]]
+    assert values == sorted(values, reverse=True)
+
+
+def test_get_monsters_filter_by_metric(client):
+    """Test metric range filters"""
+    response = client.get("/api/v1/monsters?min_defensive_cr=5&max_offensive_cr=6&limit=100")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] > 0
+    for monster in data["monsters"]:
+        assert monster["metrics"]["defensive_cr"] >= 5
+        assert monster["metrics"]["offensive_cr"] <= 6
+
+
+def test_get_monsters_sort_with_search(client):
+    """Test sort_by overrides relevance ranking for q"""
+    response = client.get("/api/v1/monsters?q=dragon&sort_by=hit_points")
+    assert response.status_code == 200
+    hit_points = [monster["hit_points"] for monster in response.json()["monsters"]]
+    assert hit_points and hit_points == sorted(hit_points)
+
+
+def test_get_monsters_invalid_sort(client):
+    """Test unknown sort fields are rejected"""
+    response = client.get("/api/v1/monsters?sort_by=speed")
+    assert response.status_code == 422
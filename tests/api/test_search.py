@@ -0,0 +1,65 @@
+"""Tests for search API endpoints"""
+
+
+def test_search_names(client):
+    """Test fuzzy name lookup across catalogs"""
+    response = client.get("/api/v1/search/names?q=Beholdr")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["query"] == "Beholdr"
+    assert data["max_distance"] == 2
+    assert data["matches"][0]["name"] == "Beholder"
+    assert data["matches"][0]["kind"] == "monster"
+    assert data["matches"][0]["distance"] == 1
+
+
+def test_search_names_filter_by_kinds(client):
+    """Test restricting name lookup to specific kinds"""
+    response = client.get("/api/v1/search/names?q=dragn&kinds=item")
+    assert response.status_code == 200
+    for match in response.json()["matches"]:
+        assert match["kind"] == "item"
+
+
+def test_search_names_invalid_kind(client):
+    """Test invalid kinds are rejected"""
+    response = client.get("/api/v1/search/names?q=dragon&kinds=spell")
+    assert response.status_code == 422
+
+
+def test_monsters_fuzzy_name_filter(client):
+    """Test fuzzy name filtering on the monsters list"""
+    exact = client.get("/api/v1/monsters?name=Owlbaer").json()
+    fuzzy = client.get("/api/v1/monsters?name=Owlbaer&fuzzy=true").json()
+
+    assert exact["total"] == 0
+    assert fuzzy["total"] >= 1
+    assert any(m["name"] == "Owlbear" for m in fuzzy["monsters"])
+
+
+def test_autocomplete(client):
+    """Test prefix autocomplete across kinds"""
+    response = client.get("/api/v1/autocomplete?prefix=adu&kinds=monster,item")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["prefix"] == "adu"
+    assert data["order"] == "cr"
+    assert data["suggestions"]
+    for suggestion in data["suggestions"]:
+        assert suggestion["kind"] in ("monster", "item")
+        assert any(word.startswith("adu") for word in suggestion["name"].lower().split())
+
+
+def test_autocomplete_name_order_and_limit(client):
+    """Test alphabetical ordering and limit"""
+    response = client.get("/api/v1/autocomplete?prefix=d&order=name&limit=5")
+    assert response.status_code == 200
+    names = [s["name"].lower() for s in response.json()["suggestions"]]
+    assert len(names) == 5
+    assert names == sorted(names)
+
+
+def test_autocomplete_requires_prefix(client):
+    """Test prefix is required"""
+    response = client.get("/api/v1/autocomplete")
+    assert response.status_code == 422
@@ -0,0 +1,83 @@
+"""Tests for vectorized area-effect saving throws"""
+
+from app.models import AreaEffectRequest
+from app.services.area_effect_service import monster_save_modifier, resolve_area_effect
+from app.services.encounter_simulation_service import find_monsters
+from app.utils import rng
+
+
+def _request(dc: int, damage_type: str, targets: list[dict], **kwargs) -> AreaEffectRequest:
+    return AreaEffectRequest(
+        dc=dc,
+        ability="constitution",
+        damage_dice="4d6+4",
+        damage_type=damage_type,
+        targets=targets,
+        **kwargs,
+    )
+
+
+def test_monster_save_modifier():
+    """Test proficient saves come from the stat block, others from the ability score"""
+    (lich,), _ = find_monsters([5])
+    assert monster_save_modifier(lich, "constitution") == lich["saving_throws"]["constitution"]
+    assert monster_save_modifier(lich, "strength") == 0
+
+
+def test_failed_saves_take_full_damage_through_defenses():
+    """Test immunity, vulnerability and resistance from the catalog record"""
+    monsters, _ = find_monsters([9, 9, 5])
+    request = _request(
+        100,
+        "poison",
+        [{"monster_id": 9}, {"monster_id": 9, "vulnerabilities": ["poison"]}, {"save_modifier": 0}],
+    )
+    result = resolve_area_effect(request, monsters[:2])
+    full = result["damage_roll"]["total"]
+    immune, also_immune, custom = result["results"]
+    assert immune["defenses"] == ["immune"] and immune["damage"] == 0
+    assert also_immune["damage"] == 0
+    assert custom["damage"] == full
+    assert result["total_damage"] == full
+
+    result = resolve_area_effect(_request(100, "cold", [{"monster_id": 5}]), monsters[2:])
+    lich = result["results"][0]
+    assert lich["defenses"] == ["resistant"]
+    assert lich["damage"] == result["damage_roll"]["total"] // 2
+
+
+def test_vulnerable_monster_takes_double():
+    """Test the skeleton's bludgeoning vulnerability doubles damage"""
+    monsters, _ = find_monsters([9])
+    result = resolve_area_effect(_request(100, "bludgeoning", [{"monster_id": 9}]), monsters)
+    assert result["results"][0]["damage"] == result["damage_roll"]["total"] * 2
+
+
+def test_successful_saves():
+    """Test half damage on a success, or none when half_on_success is off"""
+    targets = [{"save_modifier": 0}, {"save_modifier": 0, "resistances": ["fire"]}]
+    result = resolve_area_effect(_request(1, "fire", targets), [])
+    full = result["damage_roll"]["total"]
+    assert result["successes"] == 2
+    assert [r["damage"] for r in result["results"]] == [full // 2, full // 2 // 2]
+
+    result = resolve_area_effect(_request(1, "fire", targets, half_on_success=False), [])
+    assert result["total_damage"] == 0
+
+
+def test_advantage_keeps_the_better_roll():
+    """Test advantage and disadvantage pick from both d20s"""
+    rng.seed_rng(7)
+    targets = [
+        {"save_modifier": 3, "advantage": "advantage"},
+        {"save_modifier": 3, "advantage": "disadvantage"},
+        {"save_modifier": 3},
+    ] * 50
+    result = resolve_area_effect(_request(15, "cold", targets), [])
+    for target in result["results"]:
+        assert target["total"] == target["roll"] + 3
+        assert target["success"] == (target["total"] >= 15)
+    for adv, dis, normal in zip(*(result["results"][i::3] for i in range(3))):
+        assert adv["roll"] >= adv["second_roll"]
+        assert dis["roll"] <= dis["second_roll"]
+        assert normal["second_roll"] is None
@@ -0,0 +1,58 @@
+"""Tests for trie-backed autocomplete"""
+
+from app.models import AutocompleteOrder, EntityKind
+from app.services.autocomplete import RadixTrie, autocomplete
+from app.services.data_loader import load_monsters
+
+
+def _suggestion(name: str, entity_id: int) -> tuple:
+    return ((name, entity_id), EntityKind.MONSTER, entity_id, name)
+
+
+def test_radix_trie_splits_shared_prefixes():
+    """Test keys sharing a prefix are all reachable after edge splits"""
+    trie = RadixTrie(max_results=10)
+    for i, name in enumerate(["goblin", "gob", "golem", "ghoul"]):
+        trie.insert(name, _suggestion(name, i))
+    trie.finalize()
+
+    assert [s[3] for s in trie.complete("go")] == ["gob", "goblin", "golem"]
+    assert [s[3] for s in trie.complete("gob")] == ["gob", "goblin"]
+    assert [s[3] for s in trie.complete("g")] == ["ghoul", "gob", "goblin", "golem"]
+    assert trie.complete("gx") == ()
+
+
+def test_radix_trie_caps_precomputed_results():
+    """Test each node keeps at most max_results completions"""
+    trie = RadixTrie(max_results=2)
+    for i, name in enumerate(["aa", "ab", "ac"]):
+        trie.insert(name, _suggestion(name, i))
+    trie.finalize()
+
+    assert len(trie.complete("a")) == 2
+
+
+def test_autocomplete_matches_any_word():
+    """Test the prefix matches the start of later words in a name"""
+    names = [name for _, _, name in autocomplete("drag", {EntityKind.MONSTER}, limit=25)]
+    expected = {
+        monster["name"]
+        for monster in load_monsters()
+        if any(word.startswith("drag") for word in monster["name"].lower().split())
+    }
+    assert set(names) == expected
+
+
+def test_autocomplete_cr_order():
+    """Test CR order ranks stronger monsters first"""
+    monsters = {monster["id"]: monster for monster in load_monsters()}
+    results = autocomplete("d", {EntityKind.MONSTER}, AutocompleteOrder.CHALLENGE, limit=10)
+    ratings = [monsters[entity_id]["challenge_rating"] for _, entity_id, _ in results]
+    assert ratings == sorted(ratings, reverse=True)
+
+
+def test_autocomplete_deduplicates_multi_word_matches():
+    """Test a name matching the prefix on several words appears once"""
+    results = autocomplete("d", set(EntityKind), AutocompleteOrder.NAME, limit=25)
+    identities = [(kind, entity_id) for kind, entity_id, _ in results]
+    assert len(identities) == len(set(identities))
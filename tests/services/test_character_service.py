@@ -1,17 +1,18 @@
 """Tests for character service functions"""
 
 from app.services.character_service import (
-    generate_random_stats,
-    generate_random_name,
-    generate_random_description,
+    generate_random_names,
+    generate_random_descriptions,
     generate_random_character,
+    generate_random_characters,
+    roll_ability_scores,
 )
 from app.models import Race, Class, Alignment
 
 
 def test_generate_random_stats():
     """Test random stats generation"""
-    stats = generate_random_stats()
+    stats = generate_random_character().stats
 
     # Check all stats are present
     assert hasattr(stats, "strength")
@@ -30,17 +31,17 @@ def test_generate_random_stats():
     assert 3 <= stats.charisma <= 18
 
 
-def test_generate_random_name():
+def test_generate_random_names():
     """Test random name generation"""
-    name = generate_random_name(Race.HUMAN, Class.FIGHTER)
-    assert isinstance(name, str)
-    assert len(name) > 0
+    names = generate_random_names([Race.HUMAN, Race.ELF])
+    assert len(names) == 2
+    assert all(isinstance(name, str) and len(name) > 0 for name in names)
 
 
-def test_generate_random_description():
+def test_generate_random_descriptions():
     """Test random description generation"""
-    description = generate_random_description(
-        "Test Hero", Race.HUMAN, Class.FIGHTER, Alignment.LAWFUL_GOOD
+    [description] = generate_random_descriptions(
+        ["Test Hero"], [Race.HUMAN], [Class.FIGHTER], [Alignment.LAWFUL_GOOD]
     )
     assert isinstance(description, str)
     assert len(description) > 0
@@ -58,3 +59,22 @@ def test_generate_random_character():
     assert character.alignment in Alignment
     assert len(character.description) > 0
     assert character.stats is not None
+
+
+def test_roll_ability_scores_distribution():
+    """Test bulk 4d6-drop-lowest stays in range and averages about 12.24"""
+    scores = roll_ability_scores(20000)
+    assert scores.shape == (20000, 6)
+    assert scores.min() >= 3 and scores.max() <= 18
+    assert abs(scores.mean() - 12.24) < 0.05
+
+
+def test_generate_random_characters():
+    """Test bulk generation fills every field from the race, class and alignment"""
+    characters = generate_random_characters(300)
+
+    assert len(characters) == 300
+    assert len({character.race for character in characters}) > 1
+    for character in characters:
+        assert character.name in character.description
+    assert len({character.id for character in characters}) == 300
@@ -0,0 +1,51 @@
+"""Tests for the model-free combat kernel"""
+
+from unittest.mock import patch
+
+from app.models.combat import AdvantageType
+from app.services.combat_kernel import (
+    attack_roll,
+    damage_roll,
+    full_combat,
+    resolve_attack,
+    resolve_save,
+)
+
+
+def test_resolve_attack_natural_rolls():
+    """Test natural 20 always hits and crits, natural 1 always misses"""
+    assert resolve_attack(0, 30, AdvantageType.NORMAL, 20, None).critical_hit
+    assert resolve_attack(0, 30, AdvantageType.NORMAL, 20, None).hit
+    miss = resolve_attack(50, 10, AdvantageType.NORMAL, 1, None)
+    assert miss.critical_miss and not miss.hit
+
+
+def test_attack_roll_with_advantage_keeps_higher():
+    """Test advantage keeps the higher d20 and reports the other"""
+    with patch("app.utils.rng.randint", side_effect=[4, 16]):
+        outcome = attack_roll(3, 15, AdvantageType.ADVANTAGE)
+    assert (outcome.roll, outcome.second_roll, outcome.total) == (16, 4, 19)
+    assert outcome.hit
+
+
+def test_damage_roll_crit_doubles_dice_only():
+    """Test a critical hit doubles the dice but not the modifier"""
+    outcome = damage_roll("2d6+3", critical_hit=True)
+    assert len(outcome.rolls) == 4
+    assert outcome.total == sum(outcome.rolls) + 3
+
+
+def test_full_combat_skips_damage_on_miss():
+    """Test a miss rolls no damage"""
+    with patch("app.utils.rng.randint", return_value=1):
+        attack, damage = full_combat(10, 10, "1d8+2")
+    assert not attack.hit
+    assert damage is None
+
+
+def test_resolve_save():
+    """Test saving throw totals and success"""
+    outcome = resolve_save(2, 3, 15, AdvantageType.NORMAL, 10, None)
+    assert outcome.total == 15
+    assert outcome.success
+    assert not outcome.natural_20
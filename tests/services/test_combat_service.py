@@ -7,6 +7,7 @@ from app.services.combat_service import (
     calculate_damage_roll,
     calculate_saving_throw,
     calculate_full_combat,
+    resolve_combat_batch,
 )
 from app.models.combat import (
     AdvantageType,
@@ -14,6 +15,7 @@ from app.models.combat import (
     DamageRollRequest,
     SavingThrowRequest,
     CombatCalculatorRequest,
+    CombatBatchRequest,
     DamageType,
 )
 
@@ -29,14 +31,14 @@ class TestRollD20WithAdvantage:
 
     def test_advantage_returns_higher_value(self):
         """Test advantage returns the higher of two rolls"""
-        with patch("random.randint", side_effect=[5, 15]):
+        with patch("app.utils.rng.randint", side_effect=[5, 15]):
             roll, second_roll = roll_d20_with_advantage(AdvantageType.ADVANTAGE)
             assert roll == 15  # Higher value
             assert second_roll == 5  # Lower value
 
     def test_disadvantage_returns_lower_value(self):
         """Test disadvantage returns the lower of two rolls"""
-        with patch("random.randint", side_effect=[15, 5]):
+        with patch("app.utils.rng.randint", side_effect=[15, 5]):
             roll, second_roll = roll_d20_with_advantage(AdvantageType.DISADVANTAGE)
             assert roll == 5  # Lower value
             assert second_roll == 15  # Higher value
@@ -47,7 +49,7 @@ class TestCalculateAttackRoll:
 
     def test_basic_attack_hit(self):
         """Test basic attack that hits"""
-        with patch("random.randint", return_value=15):
+        with patch("app.utils.rng.randint", return_value=15):
             request = AttackRollRequest(
                 attack_bonus=5, armor_class=15, advantage=AdvantageType.NORMAL
             )
@@ -64,7 +66,7 @@ class TestCalculateAttackRoll:
 
     def test_basic_attack_miss(self):
         """Test basic attack that misses"""
-        with patch("random.randint", return_value=5):
+        with patch("app.utils.rng.randint", return_value=5):
             request = AttackRollRequest(
                 attack_bonus=2, armor_class=15, advantage=AdvantageType.NORMAL
             )
@@ -76,7 +78,7 @@ class TestCalculateAttackRoll:
 
     def test_critical_hit_natural_20(self):
         """Test natural 20 is always a critical hit"""
-        with patch("random.randint", return_value=20):
+        with patch("app.utils.rng.randint", return_value=20):
             request = AttackRollRequest(
                 attack_bonus=0,
                 armor_class=25,  # Even high AC doesn't matter
@@ -90,7 +92,7 @@ class TestCalculateAttackRoll:
 
     def test_critical_miss_natural_1(self):
         """Test natural 1 is always a critical miss"""
-        with patch("random.randint", return_value=1):
+        with patch("app.utils.rng.randint", return_value=1):
             request = AttackRollRequest(
                 attack_bonus=50,  # Even high bonus doesn't matter
                 armor_class=10,
@@ -104,7 +106,7 @@ class TestCalculateAttackRoll:
 
     def test_attack_with_advantage(self):
         """Test attack roll with advantage"""
-        with patch("random.randint", side_effect=[8, 15]):
+        with patch("app.utils.rng.randint", side_effect=[8, 15]):
             request = AttackRollRequest(
                 attack_bonus=3, armor_class=15, advantage=AdvantageType.ADVANTAGE
             )
@@ -118,7 +120,7 @@ class TestCalculateAttackRoll:
 
     def test_attack_with_disadvantage(self):
         """Test attack roll with disadvantage"""
-        with patch("random.randint", side_effect=[15, 8]):
+        with patch("app.utils.rng.randint", side_effect=[15, 8]):
             request = AttackRollRequest(
                 attack_bonus=3, armor_class=15, advantage=AdvantageType.DISADVANTAGE
             )
@@ -136,7 +138,7 @@ class TestCalculateDamageRoll:
 
     def test_basic_damage_roll(self):
         """Test basic damage roll without critical"""
-        with patch("random.randint", side_effect=[3, 5]):
+        with patch("app.utils.rng.randint", side_effect=[3, 5]):
             request = DamageRollRequest(
                 damage_dice="2d6+3", damage_type=DamageType.SLASHING, critical_hit=False
             )
@@ -150,7 +152,7 @@ class TestCalculateDamageRoll:
 
     def test_critical_hit_doubles_dice(self):
         """Test critical hit doubles the number of dice"""
-        with patch("random.randint", side_effect=[3, 5, 4, 6]):
+        with patch("app.utils.rng.randint", side_effect=[3, 5, 4, 6]):
             request = DamageRollRequest(
                 damage_dice="2d6+3", damage_type=DamageType.PIERCING, critical_hit=True
             )
@@ -164,7 +166,7 @@ class TestCalculateDamageRoll:
 
     def test_damage_with_negative_modifier(self):
         """Test damage roll with negative modifier"""
-        with patch("random.randint", return_value=4):
+        with patch("app.utils.rng.randint", return_value=4):
             request = DamageRollRequest(
                 damage_dice="1d8-2",
                 damage_type=DamageType.BLUDGEONING,
@@ -178,7 +180,7 @@ class TestCalculateDamageRoll:
 
     def test_damage_no_modifier(self):
         """Test damage roll without modifier"""
-        with patch("random.randint", side_effect=[2, 4, 3]):
+        with patch("app.utils.rng.randint", side_effect=[2, 4, 3]):
             request = DamageRollRequest(
                 damage_dice="3d6", damage_type=DamageType.FIRE, critical_hit=False
             )
@@ -199,7 +201,7 @@ class TestCalculateDamageRoll:
         ]
 
         for dmg_type in damage_types:
-            with patch("random.randint", return_value=4):
+            with patch("app.utils.rng.randint", return_value=4):
                 request = DamageRollRequest(
                     damage_dice="1d8", damage_type=dmg_type, critical_hit=False
                 )
@@ -212,7 +214,7 @@ class TestCalculateSavingThrow:
 
     def test_successful_save(self):
         """Test successful saving throw"""
-        with patch("random.randint", return_value=15):
+        with patch("app.utils.rng.randint", return_value=15):
             request = SavingThrowRequest(
                 ability_modifier=2,
                 proficiency_bonus=3,
@@ -232,7 +234,7 @@ class TestCalculateSavingThrow:
 
     def test_failed_save(self):
         """Test failed saving throw"""
-        with patch("random.randint", return_value=5):
+        with patch("app.utils.rng.randint", return_value=5):
             request = SavingThrowRequest(
                 ability_modifier=-1,
                 proficiency_bonus=0,
@@ -247,7 +249,7 @@ class TestCalculateSavingThrow:
 
     def test_natural_20_save(self):
         """Test natural 20 on saving throw"""
-        with patch("random.randint", return_value=20):
+        with patch("app.utils.rng.randint", return_value=20):
             request = SavingThrowRequest(
                 ability_modifier=0,
                 proficiency_bonus=0,
@@ -263,7 +265,7 @@ class TestCalculateSavingThrow:
 
     def test_natural_1_save(self):
         """Test natural 1 on saving throw"""
-        with patch("random.randint", return_value=1):
+        with patch("app.utils.rng.randint", return_value=1):
             request = SavingThrowRequest(
                 ability_modifier=0,
                 proficiency_bonus=0,
@@ -279,7 +281,7 @@ class TestCalculateSavingThrow:
 
     def test_save_with_advantage(self):
         """Test saving throw with advantage"""
-        with patch("random.randint", side_effect=[8, 15]):
+        with patch("app.utils.rng.randint", side_effect=[8, 15]):
             request = SavingThrowRequest(
                 ability_modifier=2,
                 proficiency_bonus=2,
@@ -299,7 +301,7 @@ class TestCalculateFullCombat:
 
     def test_successful_hit_with_damage(self):
         """Test complete combat where attack hits"""
-        with patch("random.randint", side_effect=[15, 4, 6]):
+        with patch("app.utils.rng.randint", side_effect=[15, 4, 6]):
             # 15 for attack roll, [4, 6] for damage (2d6)
             request = CombatCalculatorRequest(
                 attack_bonus=5,
@@ -322,7 +324,7 @@ class TestCalculateFullCombat:
 
     def test_missed_attack_no_damage(self):
         """Test combat where attack misses (no damage calculated)"""
-        with patch("random.randint", return_value=5):
+        with patch("app.utils.rng.randint", return_value=5):
             request = CombatCalculatorRequest(
                 attack_bonus=2,
                 armor_class=15,
@@ -341,7 +343,7 @@ class TestCalculateFullCombat:
 
     def test_critical_hit_doubles_damage_dice(self):
         """Test critical hit doubles damage dice in full combat"""
-        with patch("random.randint", side_effect=[20, 3, 5, 4, 6]):
+        with patch("app.utils.rng.randint", side_effect=[20, 3, 5, 4, 6]):
             # 20 for crit, [3, 5, 4, 6] for 4d6 (doubled)
             request = CombatCalculatorRequest(
                 attack_bonus=5,
@@ -363,7 +365,7 @@ class TestCalculateFullCombat:
 
     def test_critical_miss_no_damage(self):
         """Test critical miss (natural 1) results in no damage"""
-        with patch("random.randint", return_value=1):
+        with patch("app.utils.rng.randint", return_value=1):
             request = CombatCalculatorRequest(
                 attack_bonus=10,
                 armor_class=10,
@@ -379,7 +381,7 @@ class TestCalculateFullCombat:
 
     def test_combat_with_advantage(self):
         """Test full combat with advantage"""
-        with patch("random.randint", side_effect=[8, 18, 5, 3]):
+        with patch("app.utils.rng.randint", side_effect=[8, 18, 5, 3]):
             # [8, 18] for advantage, [5, 3] for 2d6 damage
             request = CombatCalculatorRequest(
                 attack_bonus=3,
@@ -395,3 +397,87 @@ class TestCalculateFullCombat:
             assert result.attack.hit is True
             assert result.damage is not None
             assert result.damage.total == 10  # 5 + 3 + 2
+
+
+class TestResolveCombatBatch:
+    """Tests for batch combat resolution"""
+
+    def test_results_follow_request_order(self):
+        """Test each entry gets a result of the matching type, in order"""
+        request = CombatBatchRequest(
+            requests=[
+                {"type": "saving-throw", "ability_modifier": 1, "dc": 12},
+                {"type": "attack-roll", "attack_bonus": 4, "armor_class": 14},
+                {"type": "damage-roll", "damage_dice": "2d6+3", "damage_type": "fire"},
+                {
+                    "type": "combat",
+                    "attack_bonus": 5,
+                    "armor_class": 10,
+                    "damage_dice": "1d8+2",
+                    "damage_type": "slashing",
+                },
+            ]
+        )
+        results = resolve_combat_batch(request.requests)
+
+        assert [result.type for result in results] == [
+            "saving-throw",
+            "attack-roll",
+            "damage-roll",
+            "combat",
+        ]
+
+    def test_rolls_are_in_range(self):
+        """Test bulk-generated dice respect die sizes and modifiers"""
+        request = CombatBatchRequest(
+            requests=[
+                {
+                    "type": "damage-roll",
+                    "damage_dice": "3d4+1",
+                    "damage_type": "cold",
+                    "critical_hit": True,
+                }
+            ]
+            * 200
+        )
+        for result in resolve_combat_batch(request.requests):
+            assert len(result.rolls) == 6
+            assert all(1 <= roll <= 4 for roll in result.rolls)
+            assert result.total == sum(result.rolls) + 1
+
+    def test_combat_entries_match_single_roll_rules(self):
+        """Test full-combat entries only roll damage on a hit"""
+        request = CombatBatchRequest(
+            requests=[
+                {
+                    "type": "combat",
+                    "attack_bonus": 3,
+                    "armor_class": 15,
+                    "damage_dice": "1d6",
+                    "damage_type": "piercing",
+                    "advantage": "advantage",
+                }
+            ]
+            * 200
+        )
+        for result in resolve_combat_batch(request.requests):
+            attack = result.attack
+            assert attack.roll >= attack.second_roll
+            assert (result.damage is not None) == attack.hit
+            if attack.critical_hit:
+                assert len(result.damage.rolls) == 2
+
+    def test_compound_expressions_mix_with_pooled_dice(self):
+        """Test full dice expressions resolve alongside plain ones"""
+        request = CombatBatchRequest(
+            requests=[
+                {"type": "damage-roll", "damage_dice": "4d6kh3+2", "damage_type": "fire"},
+                {"type": "damage-roll", "damage_dice": "1d6", "damage_type": "fire"},
+            ]
+            * 100
+        )
+        results = resolve_combat_batch(request.requests)
+        for kept, plain in zip(results[::2], results[1::2]):
+            assert len(kept.rolls) == 3
+            assert 5 <= kept.total <= 20
+            assert 1 <= plain.total <= 6
@@ -0,0 +1,152 @@
+"""Tests for stateful combat sessions"""
+
+from unittest.mock import patch
+
+from app.models import (
+    CombatSessionCreateRequest,
+    SessionAttackRequest,
+    SessionConditionsRequest,
+    SessionDamageRequest,
+    SessionHealRequest,
+    SessionSavingThrowRequest,
+)
+from app.models.combat import AdvantageType
+from app.services.combat_session_service import (
+    _attack_advantage,
+    apply_damage,
+    attack,
+    create_session,
+    delete_session,
+    get_session,
+    heal,
+    next_turn,
+    saving_throw,
+    update_conditions,
+)
+from app.services.encounter_simulation_service import find_monsters
+
+
+def _session(*specs):
+    request = CombatSessionCreateRequest(combatants=list(specs))
+    ids = [spec["monster_id"] for spec in specs if "monster_id" in spec]
+    monsters, _ = find_monsters(ids)
+    return create_session(request, monsters)
+
+
+def _damage(session, target: int, amount: int, damage_type: str) -> dict:
+    request = SessionDamageRequest(target=target, amount=amount, damage_type=damage_type)
+    return apply_damage(session, request)
+
+
+def test_create_orders_by_initiative():
+    """Test combatants are slotted by initiative, highest first"""
+    session = _session(
+        {"name": "Slow", "hit_points": 10, "armor_class": 12, "initiative": 5},
+        {"name": "Fast", "hit_points": 10, "armor_class": 12, "initiative": 20},
+        {"monster_id": 9, "initiative": 12},
+    )
+    assert session.names == ["Fast", "Skeleton", "Slow"]
+    assert list(session.initiative) == [20, 12, 5]
+    assert session.hit_points[1] == 13
+    assert get_session(session.id) is session
+
+
+def test_monster_defenses_apply():
+    """Test immunity, vulnerability and resistance from the stat block"""
+    session = _session({"monster_id": 9, "initiative": 10}, {"monster_id": 5, "initiative": 5})
+    skeleton, lich = 0, 1
+
+    poison = _damage(session, skeleton, 8, "poison")
+    assert poison["damage"] == {"rolled": 8, "applied": 0, "defenses": ["immune"]}
+
+    club = _damage(session, skeleton, 5, "bludgeoning")
+    assert club["damage"]["applied"] == 10
+    assert club["target"]["hit_points"] == 3
+
+    cold = _damage(session, lich, 15, "cold")
+    assert cold["damage"] == {"rolled": 15, "applied": 7, "defenses": ["resistant"]}
+    assert session.hit_points[lich] == 128
+
+
+def test_hit_points_clamp_and_heal():
+    """Test hit points stop at 0 and healing stops at the maximum"""
+    session = _session({"name": "Hero", "hit_points": 20, "armor_class": 15})
+    state = _damage(session, 0, 50, "fire")
+    assert state["target"]["hit_points"] == 0
+    assert state["target"]["defeated"]
+    assert heal(session, SessionHealRequest(target=0, amount=100))["hit_points"] == 20
+
+
+def test_attack_applies_damage_to_target():
+    """Test a natural 20 hits and its damage is applied through defenses"""
+    session = _session(
+        {"name": "Hero", "hit_points": 20, "armor_class": 15, "initiative": 15},
+        {"monster_id": 9, "initiative": 10},
+    )
+    with patch("app.utils.rng.randint", return_value=20):
+        result = attack(
+            session,
+            SessionAttackRequest(
+                attacker=0, target=1, attack_bonus=0, damage_dice="1d4", damage_type="bludgeoning"
+            ),
+        )
+    assert result["result"]["attack"]["critical_hit"]
+    assert result["damage"]["applied"] == 2 * result["result"]["damage"]["total"]
+    assert result["target"]["hit_points"] == max(0, 13 - result["damage"]["applied"])
+
+
+def test_conditions_grant_advantage():
+    """Test conditions on either side change the attack roll, and cancel out"""
+    session = _session(
+        {"name": "A", "hit_points": 10, "armor_class": 10, "initiative": 2},
+        {"name": "B", "hit_points": 10, "armor_class": 10, "initiative": 1},
+    )
+    request = SessionAttackRequest(
+        attacker=0, target=1, attack_bonus=0, damage_dice="1d6", damage_type="slashing"
+    )
+    assert _attack_advantage(session, request) == AdvantageType.NORMAL
+
+    add = SessionConditionsRequest(target=1, add=["prone", "grappled"])
+    state = update_conditions(session, add)
+    assert state["conditions"] == ["grappled", "prone"]
+    assert _attack_advantage(session, request) == AdvantageType.ADVANTAGE
+
+    update_conditions(session, SessionConditionsRequest(target=0, add=["poisoned"]))
+    assert _attack_advantage(session, request) == AdvantageType.NORMAL
+
+    update_conditions(session, SessionConditionsRequest(target=1, remove=["prone"]))
+    assert _attack_advantage(session, request) == AdvantageType.DISADVANTAGE
+
+
+def test_next_turn_skips_defeated_and_wraps_round():
+    """Test turn order skips combatants at 0 hit points"""
+    session = _session(
+        {"name": "A", "hit_points": 10, "armor_class": 10, "initiative": 3},
+        {"name": "B", "hit_points": 10, "armor_class": 10, "initiative": 2},
+        {"name": "C", "hit_points": 10, "armor_class": 10, "initiative": 1},
+    )
+    _damage(session, 1, 10, "fire")
+    assert next_turn(session)["turn"] == 2
+    state = next_turn(session)
+    assert (state["round"], state["turn"]) == (2, 0)
+
+
+def test_delete_session():
+    """Test ended sessions are no longer found"""
+    session = _session({"name": "A", "hit_points": 10, "armor_class": 10})
+    assert delete_session(session.id)
+    assert get_session(session.id) is None
+    assert not delete_session(session.id)
+
+
+def test_saving_throw_halves_damage_on_success():
+    """Test a successful save takes half damage and a failed one takes all of it"""
+    session = _session({"name": "Hero", "hit_points": 40, "armor_class": 15})
+    request = SessionSavingThrowRequest(
+        target=0, ability_modifier=0, dc=10, damage=15, damage_type="fire"
+    )
+    with patch("app.utils.rng.randint", return_value=15):
+        assert saving_throw(session, request)["damage"]["applied"] == 7
+    with patch("app.utils.rng.randint", return_value=2):
+        assert saving_throw(session, request)["damage"]["applied"] == 15
+    assert session.hit_points[0] == 18
@@ -0,0 +1,85 @@
+"""Tests for encounter building"""
+
+import pytest
+from pydantic import ValidationError
+
+from app.models import EncounterBuildRequest, EncounterDifficulty
+from app.services.encounter_service import (
+    build_encounters,
+    resolve_party_levels,
+    target_xp_range,
+    rate_difficulty,
+    _reachable_sums,
+)
+from app.services.data_loader import load_monsters
+
+
+def test_resolve_party_levels_expands_shared_level():
+    """Test a single level is shared across party_size characters"""
+    request = EncounterBuildRequest(party_levels=[5], party_size=4)
+    assert resolve_party_levels(request) == [5, 5, 5, 5]
+
+
+def test_party_size_mismatch_rejected():
+    """Test party_size must match multiple party_levels"""
+    with pytest.raises(ValidationError):
+        EncounterBuildRequest(party_levels=[1, 2, 3], party_size=4)
+
+
+def test_target_xp_range():
+    """Test difficulty windows run up to the next threshold"""
+    thresholds = (300, 600, 900, 1600)
+    assert target_xp_range(thresholds, EncounterDifficulty.MEDIUM) == (600, 899)
+    assert target_xp_range(thresholds, EncounterDifficulty.DEADLY) == (1600, 2300)
+
+
+def test_rate_difficulty():
+    """Test adjusted XP is rated by the highest threshold reached"""
+    thresholds = (300, 600, 900, 1600)
+    assert rate_difficulty(thresholds, 100) == EncounterDifficulty.EASY
+    assert rate_difficulty(thresholds, 900) == EncounterDifficulty.HARD
+
+
+def test_reachable_sums():
+    """Test bitset knapsack tracks sums for an exact monster count"""
+    reach = _reachable_sums([2, 5], max_count=2, max_sum=20)
+    two_monsters = {s for s in range(21) if (reach[2] >> s) & 1}
+    assert two_monsters == {4, 7, 10}
+
+
+def test_build_encounters_hits_target_difficulty():
+    """Test every suggested encounter lands in the requested window"""
+    request = EncounterBuildRequest(party_levels=[3, 3, 4, 4], difficulty="hard")
+    result = build_encounters(request)
+
+    assert result["encounters"]
+    for encounter in result["encounters"]:
+        assert result["target_min_xp"] <= encounter["adjusted_xp"] <= result["target_max_xp"]
+        assert encounter["difficulty"] == EncounterDifficulty.HARD
+        assert encounter["monster_count"] <= request.max_monsters
+        assert sum(m["count"] for m in encounter["monsters"]) == encounter["monster_count"]
+        assert (
+            sum(m["count"] * m["experience_points"] for m in encounter["monsters"])
+            == encounter["total_xp"]
+        )
+
+
+def test_build_encounters_applies_filters():
+    """Test monster filters restrict the candidates used"""
+    request = EncounterBuildRequest(
+        party_levels=[5], party_size=4, difficulty="medium", monster_type="Undead"
+    )
+    result = build_encounters(request)
+    undead = {m["id"] for m in load_monsters() if m["type"] == "Undead"}
+
+    assert result["candidates"] == len(undead)
+    for encounter in result["encounters"]:
+        assert all(m["id"] in undead for m in encounter["monsters"])
+
+
+def test_build_encounters_no_candidates():
+    """Test filters that match nothing yield no encounters"""
+    request = EncounterBuildRequest(party_levels=[1], min_cr=29)
+    result = build_encounters(request)
+    assert result["candidates"] == 0
+    assert result["encounters"] == []
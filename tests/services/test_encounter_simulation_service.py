@@ -0,0 +1,104 @@
+"""Tests for party-vs-monster encounter simulation"""
+
+import numpy as np
+
+from app.models import EncounterSimulationRequest
+from app.services.data_loader import load_monsters
+from app.services.encounter_simulation_service import (
+    MONSTERS,
+    PARTY,
+    Combatant,
+    find_monsters,
+    monster_combatant,
+    run_fights,
+    simulate_encounter,
+)
+from app.utils.dice_expression import compile_dice
+
+
+def _monster(name: str) -> dict:
+    return next(monster for monster in load_monsters() if monster["name"] == name)
+
+
+def _fighter(**overrides) -> Combatant:
+    fields = {
+        "name": "Fighter",
+        "side": PARTY,
+        "hit_points": 30,
+        "armor_class": 16,
+        "initiative_bonus": 0,
+        "save_bonuses": [0] * 6,
+        "attacks": 1,
+        "attack_bonus": 5,
+        "damage": compile_dice("1d8+3"),
+        "damage_type": "slashing",
+    }
+    fields.update(overrides)
+    return Combatant(**fields)
+
+
+def test_monster_combatant_reads_defenses_and_area_action():
+    """Test immunities, resistances and save-based actions are picked up"""
+    lich = monster_combatant(_monster("Lich"))
+    assert lich.defenses["poison"] == 0.0
+    assert lich.defenses["necrotic"] == 0.5
+    assert lich.area_damage is not None
+    assert lich.area_half_on_save is False
+
+    dragon = monster_combatant(_monster("Adult Red Dragon"))
+    assert dragon.area_dc == 21  # Parsed from the description
+    assert dragon.area_half_on_save is True
+
+
+def test_monster_combatant_multiattack():
+    """Test Multiattack sets the number of attacks per turn"""
+    assert monster_combatant(_monster("Owlbear")).attacks == 2
+
+
+def test_find_monsters_keeps_repeats():
+    """Test repeated ids give repeated combatants and unknown ids are reported"""
+    monsters, missing = find_monsters([2, 2, 424242])
+    assert [monster["id"] for monster in monsters] == [2, 2]
+    assert missing == [424242]
+
+
+def test_immune_monster_cannot_lose():
+    """Test damage immunity zeroes every hit"""
+    golem = Combatant(
+        name="Golem",
+        side=MONSTERS,
+        hit_points=10,
+        armor_class=5,
+        initiative_bonus=0,
+        save_bonuses=[0] * 6,
+        defenses={"slashing": 0.0},
+    )
+    hp, rounds, winner = run_fights([_fighter(), golem], 500, 5, np.random.default_rng(1))
+    assert (hp[:, 1] == 10).all()
+    assert (winner == -1).all()
+    assert (rounds == 5).all()
+
+
+def test_fights_end_when_a_side_falls():
+    """Test winners, rounds and remaining hit points are consistent"""
+    goblin = monster_combatant(_monster("Goblin"))
+    hp, rounds, winner = run_fights([_fighter(), goblin], 2000, 50, np.random.default_rng(2))
+    party_won = winner == PARTY
+    assert party_won.mean() > 0.8
+    assert (hp[party_won, 1] == 0).all()
+    assert (hp[~party_won & (winner == MONSTERS), 0] == 0).all()
+    assert (rounds >= 1).all()
+
+
+def test_simulate_encounter_is_reproducible():
+    """Test a seed fixes the whole result"""
+    request = EncounterSimulationRequest(
+        party=[
+            {"hit_points": 30, "armor_class": 16, "attack_bonus": 5, "damage_dice": "1d8+3"}
+        ],
+        monster_ids=[15],
+        trials=1000,
+        seed=9,
+    )
+    monsters, _ = find_monsters(request.monster_ids)
+    assert simulate_encounter(request, monsters) == simulate_encounter(request, monsters)
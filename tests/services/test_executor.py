@@ -0,0 +1,83 @@
+"""Tests for the simulation worker pool"""
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from app.models.combat import CombatSimulationRequest
+from app.services import executor as executor_module
+from app.services.executor import run_chunks
+from app.services.simulation_service import CHUNK_TRIALS, simulate_combat
+
+
+def _square(value: int) -> int:
+    return value * value
+
+
+def test_run_chunks_inline_preserves_order():
+    """Test chunks run in-process without an executor"""
+    assert run_chunks(_square, [(1,), (2,), (3,)]) == [1, 4, 9]
+
+
+def test_run_chunks_cancels_pending_chunks_on_error():
+    """Test chunks not yet started are cancelled when on_result raises"""
+    ran, gate = [], threading.Event()
+
+    def record(index: int) -> int:
+        ran.append(index)
+        if index:
+            gate.wait(timeout=5)
+        return index
+
+    def stop(done: int, total: int) -> None:
+        raise RuntimeError("client went away")
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # The held traceback keeps run_chunks' frame, and so the map iterator, alive
+        with pytest.raises(RuntimeError) as excinfo:
+            run_chunks(record, [(i,) for i in range(10)], executor, on_result=stop)
+        gate.set()
+    assert excinfo.traceback
+    assert set(ran) <= {0, 1}
+
+
+def test_get_executor_inline_on_lambda(monkeypatch):
+    """Test Lambda falls back to in-process execution"""
+    monkeypatch.setenv("AWS_LAMBDA_FUNCTION_NAME", "dnd-api")
+    executor_module.get_executor.cache_clear()
+    try:
+        assert executor_module.get_executor() is None
+    finally:
+        executor_module.get_executor.cache_clear()
+
+
+@pytest.fixture(scope="module")
+def pool():
+    """Small spawn-based pool shared by the parallel tests"""
+    with ProcessPoolExecutor(
+        max_workers=2, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        yield executor
+
+
+def test_parallel_simulation_matches_inline(pool):
+    """Test pooled chunks merge to exactly the in-process result"""
+    request = CombatSimulationRequest(
+        attack_bonus=5,
+        armor_class=15,
+        damage_dice="2d6+3",
+        damage_type="slashing",
+        trials=CHUNK_TRIALS * 2 + 17,
+        seed=21,
+    )
+    inline = simulate_combat(request)
+    with (
+        patch("app.services.simulation_service.get_executor", return_value=pool),
+        patch("app.services.simulation_service.settings.simulation_parallel_min_trials", 1),
+    ):
+        parallel = simulate_combat(request)
+    assert parallel == inline
+    assert parallel["trials"] == request.trials
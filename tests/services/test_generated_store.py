@@ -0,0 +1,71 @@
+"""Tests for generated entity ids and storage"""
+
+import threading
+
+from app.services.data_loader import load_characters, load_monsters
+from app.services.generated_store import (
+    NODE_BITS,
+    SEQUENCE_BITS,
+    IdAllocator,
+    allocate_ids,
+    get_generated_monsters,
+    remember_monsters,
+)
+from app.services.monster_service import generate_random_monsters
+
+
+def test_ids_are_monotonic_within_a_millisecond():
+    """Test a frozen clock still yields consecutive, increasing ids on the node"""
+    allocator = IdAllocator(clock=lambda: 1_800_000_000.0, node=5)
+    first = allocator.allocate(3)
+    second = allocator.allocate(2000)  # More than one millisecond's sequence
+    step = 1 << NODE_BITS
+    assert list(first) == [first.start, first.start + step, first.start + 2 * step]
+    assert second.start == first.stop
+    assert allocator.allocate().start == second.stop
+    assert all(i % step == 5 for i in [*first, *second])
+
+
+def test_ids_follow_the_clock_and_survive_it_stepping_back():
+    """Test ids jump ahead with time but never repeat when the clock goes backwards"""
+    now = [1_800_000_000.0]
+    allocator = IdAllocator(clock=lambda: now[0])
+    first = allocator.allocate()[0]
+    now[0] += 1.0
+    later = allocator.allocate()[0]
+    assert later - first == 1000 << SEQUENCE_BITS + NODE_BITS
+    now[0] -= 5.0
+    assert allocator.allocate()[0] == later + (1 << NODE_BITS)
+
+
+def test_ids_from_different_nodes_never_collide():
+    """Test two processes allocating in the same millisecond get disjoint ids"""
+    ids = set(IdAllocator(clock=lambda: 1_800_000_000.0, node=1).allocate(100))
+    assert ids.isdisjoint(IdAllocator(clock=lambda: 1_800_000_000.0, node=2).allocate(100))
+
+
+def test_ids_are_unique_across_threads_and_above_catalog():
+    """Test concurrent allocation never collides and stays JSON-safe"""
+    batches = []
+
+    def allocate():
+        batches.append(list(allocate_ids(1000)))
+
+    threads = [threading.Thread(target=allocate) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    ids = [i for batch in batches for i in batch]
+    assert len(set(ids)) == 8000
+    catalog_max = max(r["id"] for r in load_monsters() + load_characters())
+    assert min(ids) > catalog_max
+    assert max(ids) < 2**53
+
+
+def test_remembered_monsters_can_be_fetched():
+    """Test served monsters go into the store by id"""
+    monsters = remember_monsters(generate_random_monsters(5))
+    for monster in monsters:
+        assert get_generated_monsters().get(monster.id) is monster
@@ -0,0 +1,107 @@
+"""Tests for the background job manager"""
+
+import threading
+import time
+
+import pytest
+
+from app.models import JobKind, JobStatus
+from app.models.combat import CombatSimulationRequest
+from app.services import job_service
+from app.services.job_service import InMemoryJobStore, JobManager, JobQueueFull
+
+REQUEST = CombatSimulationRequest(
+    attack_bonus=5, armor_class=15, damage_dice="2d6+3", damage_type="slashing", trials=1000, seed=1
+)
+
+
+def wait_for(manager: JobManager, job_id: str, timeout: float = 10.0):
+    """Poll until the job has finished"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = manager.get(job_id)
+        if job.status not in (JobStatus.QUEUED, JobStatus.RUNNING):
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+@pytest.fixture
+def manager():
+    manager = JobManager(InMemoryJobStore(100, 60), workers=1, queue_size=2)
+    yield manager
+    manager.shutdown()
+
+
+@pytest.fixture
+def blocking_runner(monkeypatch):
+    """Runner that reports progress, then waits until released"""
+    started = threading.Event()
+    release = threading.Event()
+
+    def runner(request, progress):
+        progress(0.5)
+        started.set()
+        release.wait(5)
+        progress(0.75)
+        return {"done": True}
+
+    monkeypatch.setitem(job_service.JOB_RUNNERS, JobKind.COMBAT_SIMULATION, runner)
+    yield started, release
+    release.set()
+
+
+def test_submit_runs_to_success(manager):
+    """Test a submitted simulation finishes with its result"""
+    job = manager.submit(JobKind.COMBAT_SIMULATION, REQUEST)
+    assert job.status == JobStatus.QUEUED
+    finished = wait_for(manager, job.id)
+    assert finished.status == JobStatus.SUCCEEDED
+    assert finished.progress == 1.0
+    assert finished.result["trials"] == 1000
+    assert finished.started_at <= finished.finished_at
+
+
+def test_failed_job_records_error(manager, monkeypatch):
+    """Test a runner exception marks the job failed"""
+
+    def runner(request, progress):
+        raise ValueError("boom")
+
+    monkeypatch.setitem(job_service.JOB_RUNNERS, JobKind.COMBAT_SIMULATION, runner)
+    job = manager.submit(JobKind.COMBAT_SIMULATION, REQUEST)
+    finished = wait_for(manager, job.id)
+    assert finished.status == JobStatus.FAILED
+    assert finished.error == "boom"
+
+
+def test_progress_and_running_cancel(manager, blocking_runner):
+    """Test progress is visible and a running job stops at its next report"""
+    started, release = blocking_runner
+    job = manager.submit(JobKind.COMBAT_SIMULATION, REQUEST)
+    assert started.wait(5)
+    running = manager.get(job.id)
+    assert running.status == JobStatus.RUNNING
+    assert running.progress == 0.5
+
+    assert manager.cancel(job.id).cancel_requested
+    release.set()
+    finished = wait_for(manager, job.id)
+    assert finished.status == JobStatus.CANCELLED
+    assert finished.result is None
+
+
+def test_queue_full_and_queued_cancel(manager, blocking_runner):
+    """Test the bounded queue rejects overflow and queued jobs cancel at once"""
+    started, release = blocking_runner
+    manager.submit(JobKind.COMBAT_SIMULATION, REQUEST)
+    assert started.wait(5)
+    queued = [manager.submit(JobKind.COMBAT_SIMULATION, REQUEST) for _ in range(2)]
+    with pytest.raises(JobQueueFull):
+        manager.submit(JobKind.COMBAT_SIMULATION, REQUEST)
+
+    cancelled = manager.cancel(queued[0].id)
+    assert cancelled.status == JobStatus.CANCELLED
+    release.set()
+    assert wait_for(manager, queued[0].id).status == JobStatus.CANCELLED
+    assert wait_for(manager, queued[1].id).status == JobStatus.SUCCEEDED
@@ -0,0 +1,73 @@
+"""Tests for derived monster metrics"""
+
+from app.services.data_loader import load_monsters
+from app.services.monster_metrics import (
+    effective_hit_points,
+    get_monster_metrics,
+    hit_chance,
+    metric_range_predicates,
+    monster_metrics,
+    sort_monsters,
+)
+
+
+def _monster(name: str) -> dict:
+    return next(monster for monster in load_monsters() if monster["name"] == name)
+
+
+def test_hit_chance_clamps_natural_rolls():
+    """Test natural 1s always miss and natural 20s always hit"""
+    assert hit_chance(5, 15) == 0.55
+    assert hit_chance(30, 10) == 0.95
+    assert hit_chance(0, 30) == 0.05
+
+
+def test_effective_hit_points_for_weapon_resistance():
+    """Test weapon resistance doubles low-CR hit points; other defenses don't count"""
+    treant = _monster("Treant")  # CR 9, resists bludgeoning and piercing
+    assert effective_hit_points(treant) == round(treant["hit_points"] * 1.5)
+    skeleton = _monster("Skeleton")  # Poison immunity only
+    assert effective_hit_points(skeleton) == skeleton["hit_points"]
+    specter = _monster("Specter")
+    assert effective_hit_points(specter) == specter["hit_points"] * 2
+
+
+def test_area_action_raises_expected_dpr():
+    """Test a breath weapon counts in round one of the three-round average"""
+    metrics = monster_metrics(_monster("Young White Dragon"))
+    assert metrics["save_dc"] == 15
+    assert metrics["expected_dpr"] == 25.0  # (10d8 + 2 * 2d10+4) / 3
+    assert metrics["hit_chance_ac15"] == hit_chance(metrics["attack_bonus"], 15)
+
+
+def test_conditional_attacks_are_not_the_routine():
+    """Test an attack restricted to a disabled target does not set expected DPR"""
+    metrics = monster_metrics(_monster("Mind Flayer"))
+    assert metrics["expected_dpr"] == 15.0  # Tentacles 2d10+4, not Extract Brain 10d10
+    top = sort_monsters(load_monsters(), "expected_dpr", descending=True)[0]
+    assert top["name"] == "Ancient Green Dragon"
+
+
+def test_offensive_cr_adjusts_for_attack_bonus():
+    """Test a bonus above the table moves offensive CR up"""
+    metrics = monster_metrics(_monster("Orc"))  # 9.5 DPR is CR 1, +5 vs +3 moves one row
+    assert metrics["offensive_cr"] == 2
+    assert metrics["defensive_cr"] == 0.125
+    assert metrics["calculated_cr"] == 1
+
+
+def test_metrics_cover_catalog():
+    """Test every catalog monster has metrics"""
+    assert set(get_monster_metrics()) == {monster["id"] for monster in load_monsters()}
+
+
+def test_range_predicates_and_sort():
+    """Test filtering and ordering by a metric"""
+    metrics = get_monster_metrics()
+    (predicate,) = metric_range_predicates({"expected_dpr": (20, None)})
+    strong = [monster for monster in load_monsters() if predicate(monster)]
+    assert strong and all(metrics[m["id"]]["expected_dpr"] >= 20 for m in strong)
+
+    ordered = sort_monsters(strong, "expected_dpr", descending=True)
+    values = [metrics[m["id"]]["expected_dpr"] for m in ordered]
+    assert values == sorted(values, reverse=True)
@@ -1,11 +1,15 @@
 """Tests for monster service functions"""
 
+import numpy as np
+
 from app.services.monster_service import (
+    SPECIAL_ABILITY_TEMPLATES,
     generate_random_monster_name,
     generate_random_monster_stats,
     generate_special_abilities,
     generate_monster_actions,
     generate_random_monster,
+    generate_random_monsters,
 )
 from app.models import MonsterType, Size
 
@@ -53,6 +57,14 @@ def test_generate_special_abilities():
             assert hasattr(ability, "description")
 
 
+def test_generate_random_monster_stats_batch():
+    """Test an array of ratings gives a row of scores per rating"""
+    rows = generate_random_monster_stats(np.array([0.0, 10.0]))
+    assert rows.shape == (2, 6)
+    assert 9 <= rows[0].min() and rows[0].max() <= 11
+    assert 19 <= rows[1].min() and rows[1].max() <= 31
+
+
 def test_generate_monster_actions():
     """Test monster actions generation"""
     actions = generate_monster_actions(MonsterType.DRAGON, 10.0)
@@ -88,3 +100,38 @@ def test_generate_random_monster_with_filters():
     assert monster.type == MonsterType.DRAGON
     assert monster.size == Size.HUGE
     assert 5.0 <= monster.challenge_rating <= 10.0
+
+
+def test_generate_random_monsters_bulk():
+    """Test bulk generation respects filters and the per-CR formulas"""
+    monsters = generate_random_monsters(200, size=Size.LARGE, min_cr=2, max_cr=5)
+
+    assert len(monsters) == 200
+    for monster in monsters:
+        assert monster.size == Size.LARGE
+        assert 2 <= monster.challenge_rating <= 5
+        assert monster.armor_class == min(10 + int(monster.challenge_rating * 0.75), 25)
+        assert monster.hit_dice.split("d")[1].startswith("10+")
+        base = 10 + int(monster.challenge_rating * 1.5)
+        variation = int(monster.challenge_rating / 2) + 1
+        assert abs(monster.stats.strength - base) <= variation
+    assert len({monster.type for monster in monsters}) > 1
+
+
+def test_special_abilities_leave_templates_untouched():
+    """Test legendary resistance is added per call, not onto the shared template"""
+    first = generate_special_abilities(MonsterType.FIEND, 12)
+    assert [a.name for a in first] == ["Magic Resistance", "Legendary Resistance (3/Day)"]
+    assert len(SPECIAL_ABILITY_TEMPLATES[MonsterType.FIEND]) == 1
+    assert generate_special_abilities(MonsterType.FIEND, 12) is not first
+    assert generate_special_abilities(MonsterType.BEAST, 1) is None
+    assert generate_special_abilities(MonsterType.HUMANOID, 15) is None
+
+
+def test_generate_monster_actions_scale_with_cr():
+    """Test CR-dependent attack bonus and damage are filled in per call"""
+    (bite, breath) = generate_monster_actions(MonsterType.DRAGON, 6)
+    assert (bite.attack_bonus, bite.damage_dice) == (8, "6d10+6")
+    assert breath.attack_bonus is None and breath.damage_dice == "12d6"
+    (strike,) = generate_monster_actions(MonsterType.HUMANOID, 0.5)
+    assert strike.damage_dice == "1d8+0"
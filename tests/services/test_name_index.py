@@ -0,0 +1,53 @@
+"""Tests for the BK-tree fuzzy name index"""
+
+from app.models import EntityKind
+from app.services.name_index import (
+    BKTree,
+    levenshtein,
+    find_similar_names,
+    build_name_predicate,
+)
+
+
+def test_levenshtein():
+    """Test edit distance calculation"""
+    assert levenshtein("beholdr", "beholder") == 1
+    assert levenshtein("kitten", "sitting") == 3
+    assert levenshtein("", "abc") == 3
+    assert levenshtein("same", "same") == 0
+
+
+def test_bk_tree_matches_brute_force():
+    """Test BK-tree search returns the same terms as a linear scan"""
+    words = ["goblin", "hobgoblin", "gnoll", "ghoul", "ghast", "golem", "owlbear"]
+    tree = BKTree()
+    for i, word in enumerate(words):
+        tree.add(word, (EntityKind.MONSTER, i, word))
+
+    for query in ["goblni", "ghol", "owlber", "xyz"]:
+        for radius in range(3):
+            expected = {word for word in words if levenshtein(query, word) <= radius}
+            found = {term for _, term in tree.search(query, radius)}
+            assert found == expected
+
+
+def test_find_similar_names_tolerates_typos():
+    """Test misspelled names find the catalog entry"""
+    matches = find_similar_names("Beholdr")
+    assert matches
+    (kind, _, name), distance = matches[0]
+    assert kind == EntityKind.MONSTER
+    assert name == "Beholder"
+    assert distance == 1
+
+
+def test_find_similar_names_filters_kinds():
+    """Test kinds restricts the entity kinds returned"""
+    matches = find_similar_names("dragn", kinds={EntityKind.ITEM})
+    assert all(entry[0] == EntityKind.ITEM for entry, _ in matches)
+
+
+def test_fuzzy_name_predicate_includes_substring_matches():
+    """Test fuzzy mode still accepts plain substring matches"""
+    predicate = build_name_predicate(EntityKind.MONSTER, "drag", fuzzy=True)
+    assert predicate({"id": -1, "name": "Adult Red Dragon"})
@@ -0,0 +1,165 @@
+"""Tests for exact probability calculations"""
+
+import pytest
+
+from app.models.combat import (
+    AdvantageType,
+    AttackRollRequest,
+    CombatCalculatorRequest,
+    DamageRollRequest,
+    DamageType,
+    SavingThrowRequest,
+)
+from app.services.probability_service import (
+    attack_probabilities,
+    catalog_damage_notations,
+    combat_distribution,
+    d20_pmf,
+    damage_distribution,
+    damage_roll_distribution,
+    dice_cache_stats,
+    saving_throw_probabilities,
+    warm_dice_cache,
+)
+from app.utils.dice_expression import compile_dice
+
+
+@pytest.mark.parametrize("advantage", list(AdvantageType))
+def test_d20_pmf_sums_to_one(advantage):
+    """Test every d20 distribution is normalized"""
+    assert d20_pmf(advantage).sum() == pytest.approx(1.0)
+
+
+def test_attack_probabilities_normal():
+    """Test hit on 10+ with +5 vs AC 15"""
+    result = attack_probabilities(AttackRollRequest(attack_bonus=5, armor_class=15))
+    assert result["hit_probability"] == pytest.approx(0.55)
+    assert result["critical_hit_probability"] == pytest.approx(0.05)
+    assert result["critical_miss_probability"] == pytest.approx(0.05)
+    assert result["miss_probability"] == pytest.approx(0.45)
+
+
+def test_attack_probabilities_advantage():
+    """Test advantage: 1 - P(both dice miss)"""
+    request = AttackRollRequest(
+        attack_bonus=5, armor_class=15, advantage=AdvantageType.ADVANTAGE
+    )
+    result = attack_probabilities(request)
+    assert result["hit_probability"] == pytest.approx(1 - 0.45**2)
+    assert result["critical_hit_probability"] == pytest.approx(1 - 0.95**2)
+
+
+def test_attack_natural_rules():
+    """Test natural 20 always hits and natural 1 always misses"""
+    impossible = attack_probabilities(AttackRollRequest(attack_bonus=0, armor_class=30))
+    certain = attack_probabilities(AttackRollRequest(attack_bonus=50, armor_class=10))
+    assert impossible["hit_probability"] == pytest.approx(0.05)
+    assert certain["hit_probability"] == pytest.approx(0.95)
+
+
+def test_saving_throw_probabilities():
+    """Test save succeeds on 10+ with +5 vs DC 15, and disadvantage squares it"""
+    normal = saving_throw_probabilities(
+        SavingThrowRequest(ability_modifier=2, proficiency_bonus=3, dc=15)
+    )
+    disadvantage = saving_throw_probabilities(
+        SavingThrowRequest(
+            ability_modifier=2,
+            proficiency_bonus=3,
+            dc=15,
+            advantage=AdvantageType.DISADVANTAGE,
+        )
+    )
+    assert normal["success_probability"] == pytest.approx(0.55)
+    assert disadvantage["success_probability"] == pytest.approx(0.55**2)
+
+
+def test_damage_distribution_2d6():
+    """Test 2d6+3 has the triangular distribution shifted by 3"""
+    dist = damage_distribution("2d6+3")
+    assert dist.offset == 5
+    assert dist.pmf.size == 11
+    assert dist.pmf[5] == pytest.approx(6 / 36)  # 7 on the dice = 10 damage
+    assert dist.mean() == pytest.approx(10)
+
+
+def test_damage_distribution_crit_doubles_dice_only():
+    """Test crits double dice but not the modifier"""
+    dist = damage_distribution("1d8+5", critical_hit=True)
+    assert dist.offset == 7
+    assert dist.mean() == pytest.approx(14)
+
+
+def test_damage_roll_distribution_summary():
+    """Test summary bounds and cumulative probability"""
+    result = damage_roll_distribution(
+        DamageRollRequest(damage_dice="3d6", damage_type=DamageType.FIRE)
+    )
+    assert result["min_damage"] == 3
+    assert result["max_damage"] == 18
+    assert result["mean_damage"] == pytest.approx(10.5)
+    assert result["pmf"][-1]["cumulative"] == pytest.approx(1.0)
+
+
+def test_combat_distribution_mixes_outcomes():
+    """Test miss mass sits at 0 and expected damage matches the analytic value"""
+    result = combat_distribution(
+        CombatCalculatorRequest(
+            attack_bonus=5,
+            armor_class=15,
+            damage_dice="2d6+3",
+            damage_type=DamageType.SLASHING,
+        )
+    )
+    damage = result["damage"]
+    zero = next(point for point in damage["pmf"] if point["value"] == 0)
+
+    assert zero["probability"] == pytest.approx(0.45)
+    assert damage["mean_damage"] == pytest.approx(0.5 * 10 + 0.05 * 17)
+    assert sum(p["probability"] for p in damage["pmf"]) == pytest.approx(1.0)
+
+
+def test_damage_distribution_is_cached():
+    """Test repeated lookups return the same shared, read-only distribution"""
+    first = damage_distribution("7d6+1")
+    second = damage_distribution("7d6+1")
+    assert first is second
+    assert not first.pmf.flags.writeable
+
+
+def test_crit_variant_cached_separately():
+    """Test crit-doubled distributions are separate cache entries"""
+    normal = damage_distribution("5d4", False)
+    crit = damage_distribution("5d4", True)
+    assert crit.offset == 2 * normal.offset
+    assert crit is damage_distribution("5d4", True)
+
+
+def test_warm_dice_cache_covers_catalog():
+    """Test warming caches every catalog damage expression"""
+    notations = catalog_damage_notations()
+    assert "1d8" in notations  # item damage
+    assert warm_dice_cache() == len(notations)
+
+    before = dice_cache_stats()["distributions"]["hits"]
+    for notation in notations:
+        damage_distribution(notation, False)
+    assert dice_cache_stats()["distributions"]["hits"] == before + len(notations)
+
+
+def test_dice_cache_stats_ratio():
+    """Test hit ratio is derived from hits and misses"""
+    compile_dice("3d10+2")
+    compile_dice("3d10+2")
+    stats = dice_cache_stats()["parsed"]
+    assert stats["hits"] >= 1
+    assert stats["hit_ratio"] == pytest.approx(
+        stats["hits"] / (stats["hits"] + stats["misses"])
+    )
+
+
+def test_damage_distribution_full_expression():
+    """Test multi-term expressions are convolved term by term"""
+    dist = damage_distribution("1d20-1d4")
+    assert dist.offset == -3
+    assert dist.mean() == pytest.approx(10.5 - 2.5)
@@ -0,0 +1,94 @@
+"""Tests for the pre-generated random object pool"""
+
+import time
+
+from app.services.random_pool import RandomPool, get_random_pool, random_monsters
+
+
+def _counter():
+    """Factory handing out consecutive integers, counting calls"""
+    state = {"next": 0, "calls": 0}
+
+    def factory(count: int) -> list[int]:
+        state["calls"] += 1
+        start = state["next"]
+        state["next"] += count
+        return list(range(start, start + count))
+
+    return factory, state
+
+
+def _wait_for(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "pool did not refill in time"
+        time.sleep(0.01)
+
+
+def test_worker_stocks_registered_keys():
+    """Test the worker fills a new combination to size in one call"""
+    pool = RandomPool(size=20, low_water=5, max_keys=4)
+    factory, state = _counter()
+    pool.start()
+    try:
+        pool.register("numbers", factory)
+        _wait_for(lambda: pool.stocked("numbers") == 20)
+        assert state["calls"] == 1
+        assert pool.take("numbers", 3, factory) == [0, 1, 2]
+    finally:
+        pool.stop()
+
+
+def test_take_falls_back_and_refills_below_low_water():
+    """Test shortfalls are generated inline and low stock wakes the worker"""
+    pool = RandomPool(size=10, low_water=5, max_keys=4)
+    factory, _ = _counter()
+    pool.start()
+    try:
+        pool.register("numbers", factory)
+        _wait_for(lambda: pool.stocked("numbers") == 10)
+        taken = pool.take("numbers", 15, factory)
+        assert len(taken) == 15 and len(set(taken)) == 15
+        _wait_for(lambda: pool.stocked("numbers") == 10)
+    finally:
+        pool.stop()
+
+
+def test_failed_refill_keeps_worker_alive():
+    """Test a factory error is logged and the key retried on the next wake"""
+    pool = RandomPool(size=10, low_water=5, max_keys=4, retry_after=0.0)
+    factory, state = _counter()
+    failures = []
+
+    def flaky(count: int) -> list[int]:
+        if not failures:
+            failures.append(count)
+            raise RuntimeError("generation failed")
+        return factory(count)
+
+    pool.start()
+    try:
+        pool.register("numbers", flaky)
+        _wait_for(lambda: failures)
+        assert pool.take("numbers", 2, factory) == [0, 1]
+        _wait_for(lambda: pool.stocked("numbers") == 10)
+    finally:
+        pool.stop()
+
+
+def test_max_keys_limits_stocked_combinations():
+    """Test combinations beyond max_keys are generated on demand only"""
+    pool = RandomPool(size=10, low_water=5, max_keys=1)
+    factory, _ = _counter()
+    assert pool.register("first", factory)
+    assert not pool.register("second", factory)
+    assert pool.take("second", 2, factory) == [0, 1]
+    assert pool.stocked("second") == 0
+
+
+def test_pool_disabled_by_default():
+    """Test random generation is synchronous unless the pool is enabled"""
+    assert get_random_pool() is None
+    monsters = random_monsters(3, max_cr=1)
+    assert len(monsters) == 3
+    assert all(monster.challenge_rating <= 1 for monster in monsters)
@@ -0,0 +1,70 @@
+"""Tests for the BM25 full-text search index"""
+
+from app.services.search_index import (
+    BM25Index,
+    tokenize,
+    get_monster_search_index,
+    get_item_search_index,
+    search_records,
+)
+from app.services.data_loader import load_monsters
+
+
+def test_tokenize_drops_stop_words_and_punctuation():
+    """Test tokenizing lowercases text and removes stop words"""
+    assert tokenize("The dragon's Fire-Breath!") == ["dragon", "s", "fire", "breath"]
+
+
+def test_search_ranks_more_relevant_document_first():
+    """Test documents matching more query terms rank higher"""
+    index = BM25Index(
+        [
+            (1, "fire breath weapon"),
+            (2, "fire bolt"),
+            (3, "cold touch"),
+        ]
+    )
+    ranked, total = index.search("fire breath", k=10)
+
+    assert [doc_id for doc_id, _ in ranked] == [1, 2]
+    assert ranked[0][1] > ranked[1][1]
+    assert total == 2
+
+
+def test_search_respects_candidates():
+    """Test search only returns documents in the candidate set"""
+    index = BM25Index([(1, "fire breath"), (2, "fire bolt")])
+    ranked, total = index.search("fire", k=10, candidates={2})
+
+    assert [doc_id for doc_id, _ in ranked] == [2]
+    assert total == 1
+
+
+def test_search_top_k_matches_exhaustive_ranking():
+    """Test early termination returns the same top-k as a full ranking"""
+    index = get_monster_search_index()
+    query = "magic resistance breath weapon"
+
+    full, total = index.search(query, k=len(load_monsters()))
+    top, top_total = index.search(query, k=3)
+
+    assert top == full[:3]
+    assert top_total == total
+
+
+def test_search_unknown_terms_returns_nothing():
+    """Test a query with no indexed terms matches no documents"""
+    ranked, total = get_item_search_index().search("xyzzy", k=10)
+    assert ranked == []
+    assert total == 0
+
+
+def test_search_records_paginates_ranked_results():
+    """Test search_records slices the ranked list"""
+    monsters = load_monsters()
+    first_page, total = search_records(get_monster_search_index(), monsters, "breath", 0, 2)
+    second_page, _ = search_records(get_monster_search_index(), monsters, "breath", 2, 2)
+
+    assert total >= 4
+    assert len(first_page) == 2
+    assert not {m["id"] for m in first_page} & {m["id"] for m in second_page}
@@ -0,0 +1,24 @@
+"""Tests for combat session update fan-out"""
+
+import asyncio
+
+from app.services.session_channel import SessionChannels
+
+
+def test_slow_subscriber_coalesces_updates():
+    """Test pending results are batched, state is latest, and overflow is counted"""
+
+    async def scenario():
+        channels = SessionChannels()
+        subscriber = channels.subscribe("s1", max_pending=2)
+        for turn in range(4):
+            channels.publish("s1", {"turn": turn}, {"round": turn})
+        message = await subscriber.next_message()
+        assert message["results"] == [{"turn": 2}, {"turn": 3}]
+        assert message["state"] == {"round": 3}
+        assert message["dropped"] == 2
+
+        channels.unsubscribe("s1", subscriber)
+        assert not channels.has_subscribers("s1")
+
+    asyncio.run(scenario())
@@ -0,0 +1,58 @@
+"""Tests for similar-monster search"""
+
+import numpy as np
+
+from app.services.data_loader import load_monsters
+from app.services.similarity_service import (
+    find_similar_monsters,
+    get_monster_feature_index,
+)
+
+
+def test_feature_matrix_is_normalized():
+    """Test every feature column is centered"""
+    index = get_monster_feature_index()
+    assert index.features.shape[0] == len(load_monsters())
+    assert np.allclose(index.features.mean(axis=0), 0)
+
+
+def test_find_similar_monsters_excludes_reference():
+    """Test the reference monster is not returned as its own neighbour"""
+    similar = find_similar_monsters(4, k=5)
+    assert len(similar) == 5
+    assert all(monster["id"] != 4 for monster, _ in similar)
+
+
+def test_find_similar_monsters_sorted_by_distance():
+    """Test neighbours are ordered closest first"""
+    distances = [distance for _, distance in find_similar_monsters(1, k=10)]
+    assert distances == sorted(distances)
+
+
+def test_find_similar_monsters_matches_brute_force():
+    """Test partial selection returns the true k nearest"""
+    index = get_monster_feature_index()
+    row = index.rows[1]
+    distances = np.linalg.norm(index.features - index.features[row], axis=1)
+    expected = sorted(
+        (float(d), int(monster_id))
+        for d, monster_id in zip(distances, index.ids)
+        if monster_id != 1
+    )[:5]
+
+    similar = find_similar_monsters(1, k=5)
+    assert [round(d, 9) for _, d in similar] == [round(d, 9) for d, _ in expected]
+
+
+def test_find_similar_monsters_applies_filters_before_ranking():
+    """Test type and CR filters restrict candidates"""
+    similar = find_similar_monsters(4, k=10, monster_type="Beast", max_cr=2)
+    assert similar
+    for monster, _ in similar:
+        assert monster["type"] == "Beast"
+        assert monster["challenge_rating"] <= 2
+
+
+def test_find_similar_monsters_unknown_id():
+    """Test unknown monster ids return None"""
+    assert find_similar_monsters(99999) is None
@@ -0,0 +1,116 @@
+"""Tests for Monte Carlo combat simulation"""
+
+import numpy as np
+
+from app.models.combat import CombatSimulationRequest, CombatSimulationStreamRequest
+from app.services.probability_service import combat_distribution
+from app.services.simulation_service import (
+    DamageAccumulator,
+    simulate_combat,
+    simulate_combat_chunk,
+    stream_combat_simulation,
+)
+
+
+def _request(**overrides) -> CombatSimulationRequest:
+    fields = {
+        "attack_bonus": 5,
+        "armor_class": 15,
+        "damage_dice": "2d6+3",
+        "damage_type": "slashing",
+        "trials": 200000,
+        "seed": 7,
+    }
+    fields.update(overrides)
+    return CombatSimulationRequest(**fields)
+
+
+def test_simulation_matches_expected_rates():
+    """Test hit and crit rates converge to the d20 probabilities"""
+    result = simulate_combat(_request())
+
+    # Hit on 10+ (11/20), crit on 20 (1/20)
+    assert abs(result["hit_rate"] - 0.55) < 0.01
+    assert abs(result["crit_rate"] - 0.05) < 0.005
+    # Normal hits average 10, crits average 17
+    assert abs(result["mean_damage"] - (0.5 * 10 + 0.05 * 17)) < 0.1
+
+
+def test_simulation_is_reproducible_with_seed():
+    """Test the same seed gives identical results"""
+    assert simulate_combat(_request(trials=5000)) == simulate_combat(_request(trials=5000))
+
+
+def test_simulation_histogram_is_consistent():
+    """Test histogram counts, bounds and percentiles agree"""
+    result = simulate_combat(_request(trials=50000, advantage="advantage"))
+    histogram = result["histogram"]
+
+    assert sum(b["count"] for b in histogram) == result["trials"]
+    assert histogram[0]["damage"] == result["min_damage"] == 0
+    assert histogram[-1]["damage"] == result["max_damage"] <= 27
+    values = [result["percentiles"][f"p{p}"] for p in (5, 25, 50, 75, 95)]
+    assert values == sorted(values)
+
+
+def test_simulation_handles_negative_damage():
+    """Test damage below zero fits in the histogram"""
+    result = simulate_combat(
+        _request(damage_dice="1d4-3", armor_class=1, trials=10000)
+    )
+    assert result["min_damage"] == -2
+
+
+def test_accumulators_merge_exactly():
+    """Test merging chunk accumulators equals accumulating all trials at once"""
+    request = _request()
+    rng = np.random.default_rng(1)
+    first = simulate_combat_chunk(request, 1000, rng)
+    second = simulate_combat_chunk(request, 3000, rng)
+
+    merged = DamageAccumulator(offset=first.offset)
+    merged.merge(first)
+    merged.merge(second)
+
+    assert merged.trials == 4000
+    assert merged.hits == first.hits + second.hits
+    assert merged.histogram.sum() == 4000
+
+
+def test_simulation_agrees_with_exact_distribution():
+    """Test compound expressions simulate to the analytic mean"""
+    request = _request(damage_dice="4d6kh3+1d4-1")
+    exact = combat_distribution(request)["damage"]["mean_damage"]
+    assert abs(simulate_combat(request)["mean_damage"] - exact) < 0.1
+
+
+def test_stream_estimates_converge_to_result():
+    """Test streamed estimates accumulate into the final summary"""
+    request = CombatSimulationStreamRequest(**_request(trials=25000).model_dump(), chunk_trials=10000)
+    events = list(stream_combat_simulation(request))
+
+    names = [name for name, _ in events]
+    assert names == ["estimate", "estimate", "estimate", "result"]
+    estimates = [data for name, data in events if name == "estimate"]
+    assert [e["trials"] for e in estimates] == [10000, 20000, 25000]
+    assert estimates[-1]["ci_half_width"] < estimates[0]["ci_half_width"]
+    low, high = estimates[-1]["mean_damage_ci"]
+    assert low < estimates[-1]["mean_damage"] < high
+
+    result = events[-1][1]
+    assert not result["stopped_early"]
+    assert result["mean_damage"] == estimates[-1]["mean_damage"]
+    deltas = [b["count"] for e in estimates for b in e["histogram_delta"]]
+    assert sum(deltas) == result["trials"] == 25000
+
+
+def test_stream_stops_once_ci_is_tight():
+    """Test the stream ends early when the CI target is met"""
+    request = CombatSimulationStreamRequest(
+        **_request(trials=1_000_000).model_dump(), chunk_trials=10000, ci_half_width=0.5
+    )
+    events = list(stream_combat_simulation(request))
+    result = events[-1][1]
+    assert result["stopped_early"]
+    assert result["trials"] < 1_000_000
+    assert events[-2][1]["ci_half_width"] <= 0.5
@@ -0,0 +1,68 @@
+"""Tests for the TTL/LRU key-value store"""
+
+from app.services.ttl_store import TTLStore
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_after_ttl():
+    """Test entries disappear once their TTL has passed"""
+    clock = FakeClock()
+    store = TTLStore(max_entries=10, ttl_seconds=5, clock=clock)
+    store.put("a", 1)
+    clock.now = 4.9
+    assert store.get("a") == 1
+    clock.now = 5.0
+    assert store.get("a") is None
+    assert store.evictions == 1
+
+
+def test_sliding_expiry_refreshes_on_read():
+    """Test reads extend the TTL when sliding"""
+    clock = FakeClock()
+    store = TTLStore(max_entries=10, ttl_seconds=5, sliding=True, clock=clock)
+    store.put("a", 1)
+    clock.now = 4
+    assert store.get("a") == 1
+    clock.now = 8
+    assert store.get("a") == 1
+    clock.now = 13
+    assert store.get("a") is None
+
+
+def test_capacity_evicts_least_recent():
+    """Test the oldest entry is dropped beyond max_entries"""
+    store = TTLStore(max_entries=2, ttl_seconds=60, sliding=True)
+    store.put("a", 1)
+    store.put("b", 2)
+    store.get("a")
+    store.put("c", 3)
+    assert store.get("b") is None
+    assert store.get("a") == 1
+    assert store.get("c") == 3
+    assert len(store) == 2
+
+
+def test_pop_removes_entry():
+    """Test popping returns and removes an entry"""
+    store = TTLStore(max_entries=2, ttl_seconds=60)
+    store.put("a", 1)
+    assert store.pop("a") == 1
+    assert store.pop("a") is None
+    assert len(store) == 0
+
+
+def test_put_many_evicts_oldest_beyond_capacity():
+    """Test bulk inserts share one expiry and respect max_entries"""
+    store = TTLStore(3, 60)
+    store.put_many((key, key * 10) for key in range(5))
+    assert len(store) == 3
+    assert store.get(1) is None
+    assert store.get(4) == 40
+    assert store.evictions == 2
@@ -1,11 +1,15 @@
 """Tests for utility functions - calculations"""
 
+import numpy as np
+
 from app.utils.calculations import (
     calculate_modifier,
     calculate_proficiency_bonus,
     calculate_hp_from_cr,
     calculate_ac_from_cr,
     get_xp_by_cr,
+    calculate_party_thresholds,
+    calculate_encounter_multiplier,
 )
 from app.models import Size
 
@@ -40,6 +44,15 @@ def test_calculate_hp_from_cr():
     assert isinstance(dice, str)
 
 
+def test_calculate_hp_from_cr_batch():
+    """Test a batch of ratings gives one hit point total and notation each"""
+    sizes = [Size.SMALL, Size.LARGE, Size.GARGANTUAN]
+    hit_points, hit_dice = calculate_hp_from_cr(np.array([0.25, 5.0, 20.0]), sizes)
+    assert hit_points.shape == (3,)
+    assert (hit_points > 0).all()
+    assert ["d6" in hit_dice[0], "d10" in hit_dice[1], "d20" in hit_dice[2]] == [True] * 3
+
+
 def test_calculate_ac_from_cr():
     """Test AC calculation from CR"""
     ac = calculate_ac_from_cr(1.0)
@@ -48,6 +61,8 @@ def test_calculate_ac_from_cr():
     ac_high = calculate_ac_from_cr(20.0)
     assert ac_high >= ac  # Higher CR should have higher AC
 
+    assert calculate_ac_from_cr(np.array([1.0, 20.0])).tolist() == [ac, ac_high]
+
 
 def test_get_xp_by_cr():
     """Test XP lookup by CR"""
@@ -61,3 +76,20 @@ def test_get_xp_by_cr():
 def test_get_xp_by_cr_invalid():
     """Test XP lookup with invalid CR"""
     assert get_xp_by_cr(999) == 0  # Should return 0 for invalid CR
+
+
+def test_calculate_party_thresholds():
+    """Test party XP thresholds sum per-character thresholds"""
+    assert calculate_party_thresholds([3, 3, 3, 3]) == (300, 600, 900, 1600)
+    assert calculate_party_thresholds([1, 5]) == (275, 550, 825, 1200)
+
+
+def test_calculate_encounter_multiplier():
+    """Test group-size multipliers and party size adjustments"""
+    assert calculate_encounter_multiplier(1, 4) == 1.0
+    assert calculate_encounter_multiplier(2, 4) == 1.5
+    assert calculate_encounter_multiplier(6, 4) == 2.0
+    assert calculate_encounter_multiplier(15, 4) == 4.0
+    assert calculate_encounter_multiplier(1, 2) == 1.5  # Small party shifts up
+    assert calculate_encounter_multiplier(1, 6) == 0.5  # Large party shifts down
+    assert calculate_encounter_multiplier(15, 2) == 5.0
@@ -1,5 +1,7 @@
 """Tests for utility functions - dice rolling"""
 
+import pytest
+
 from app.utils.dice import (
     roll_dice,
     roll_ability_score,
@@ -55,3 +57,15 @@ def test_roll_from_notation():
     """Test rolling from notation string"""
     result = roll_from_notation("1d6+2")
     assert 3 <= result <= 8  # 1d6+2 range
+
+
+def test_parse_dice_notation_rejects_compound_expression():
+    """Test the simple parser refuses expressions it cannot represent"""
+    with pytest.raises(ValueError):
+        parse_dice_notation("2d6+1d4+3")
+
+
+def test_roll_from_notation_compound():
+    """Test rolling a multi-term expression"""
+    result = roll_from_notation("2d6+1d4+3")
+    assert 6 <= result <= 19
@@ -0,0 +1,117 @@
+"""Tests for utility functions - compiled dice expressions"""
+
+from itertools import product
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from app.utils.dice_expression import MAX_DICE, MAX_DISTRIBUTION_COST, compile_dice
+
+
+@pytest.mark.parametrize(
+    "notation, canonical",
+    [
+        ("2d6+3", "2d6+3"),
+        ("2d6 + 1d4 + 3", "2d6+1d4+3"),
+        ("4D6KH3", "4d6kh3"),
+        ("4d6dl1", "4d6kh3"),
+        ("2d20dh1", "2d20kl1"),
+        ("1d20-1d4", "1d20-1d4"),
+        ("2d6r2", "2d6r2"),
+        ("3d6!", "3d6!"),
+        ("1d8+2-1", "1d8+1"),
+        ("7", "7"),
+    ],
+)
+def test_compile_canonical_form(notation, canonical):
+    """Test parsing normalizes case, whitespace, drops and constants"""
+    assert str(compile_dice(notation)) == canonical
+
+
+@pytest.mark.parametrize(
+    "notation",
+    ["d6", "2d", "2d6+", "2d6++5", "abc", "0d6", "3d6kh4", "2d6dh2", "2d6r6", "1d1!", f"{MAX_DICE + 1}d6"],
+)
+def test_compile_rejects_invalid(notation):
+    """Test malformed or out-of-range expressions raise ValueError"""
+    with pytest.raises(ValueError):
+        compile_dice(notation)
+
+
+@pytest.mark.parametrize("notation", [f"{MAX_DICE // 2 + 1}d6", "100d1000kh50", "20d1000kh10", "10d1000!"])
+def test_compile_rejects_expensive(notation):
+    """Test expressions whose crit variant is too large to evaluate exactly are rejected"""
+    with pytest.raises(ValueError):
+        compile_dice(notation)
+
+
+def test_compile_budget_allows_common_expressions():
+    """Test ordinary damage and ability dice stay well within the budget"""
+    for notation in ["4d6kh3", "2d20kh1", "8d6!", f"{MAX_DICE // 2}d12+5", "10d10r1+1d4"]:
+        assert compile_dice(notation).doubled.distribution_cost() <= MAX_DISTRIBUTION_COST
+
+
+def test_compile_is_cached():
+    """Test the same notation compiles to the same shared evaluator"""
+    assert compile_dice("2d6+1d4+3") is compile_dice("2d6+1d4+3")
+
+
+def test_as_simple():
+    """Test only plain XdY±Z expressions reduce to a tuple"""
+    assert compile_dice("3d8-2").as_simple() == (3, 8, -2)
+    assert compile_dice("2d6+1d4").as_simple() is None
+    assert compile_dice("4d6kh3").as_simple() is None
+
+
+def test_doubled_keeps_constant():
+    """Test crit doubling applies to dice counts and keeps, not constants"""
+    assert str(compile_dice("4d6kh3+2").doubled) == "8d6kh6+2"
+
+
+def test_roll_keep_highest():
+    """Test keep-highest discards the lowest die"""
+    with patch("app.utils.rng.randint", side_effect=[2, 6, 1, 5]):
+        result = compile_dice("4d6kh3").roll()
+    assert result.rolls == [2, 6, 5]
+    assert result.total == 13
+
+
+def test_roll_reroll_and_subtract():
+    """Test rerolls replace low faces once and subtracted terms are negated"""
+    with patch("app.utils.rng.randint", side_effect=[1, 1, 3]):
+        result = compile_dice("1d8r1-1d4").roll()
+    assert result.rolls == [1, -3]
+    assert result.total == -2
+
+
+def test_roll_exploding():
+    """Test exploding dice add another roll on the max face"""
+    with patch("app.utils.rng.randint", side_effect=[6, 6, 2]):
+        result = compile_dice("1d6!+1").roll()
+    assert result.rolls == [14]
+    assert result.total == 15
+
+
+def test_keep_distribution_matches_brute_force():
+    """Test the keep-highest PMF against full enumeration of 4d6"""
+    offset, pmf = compile_dice("4d6kh3").distribution
+    counts = np.zeros(19)
+    for faces in product(range(1, 7), repeat=4):
+        counts[sum(faces) - min(faces)] += 1
+    expected = counts / 6**4
+    assert offset == 3
+    assert np.allclose(pmf, expected[3:])
+
+
+@pytest.mark.parametrize("notation", ["2d6r2", "3d6!", "1d20-1d4", "2d20kl1+3"])
+def test_distribution_matches_sampling(notation):
+    """Test the exact mean agrees with vectorized sampling"""
+    expression = compile_dice(notation)
+    offset, pmf = expression.distribution
+    exact = (np.arange(pmf.size) + offset) @ pmf
+    samples = expression.sample(np.random.default_rng(11), 200_000)
+
+    assert pmf.sum() == pytest.approx(1.0)
+    assert samples.mean() == pytest.approx(exact, abs=0.05)
+    assert expression.min_total <= samples.min() <= samples.max() <= expression.max_total
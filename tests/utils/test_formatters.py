@@ -1,6 +1,6 @@
 """Tests for utility functions - formatters"""
 
-from app.utils.formatters import format_modifier, pluralize, titlecase
+from app.utils.formatters import format_modifier, format_sse_event, pluralize, titlecase
 
 
 def test_format_modifier_positive():
@@ -52,3 +52,8 @@ def test_titlecase_first_word_capitalized():
     """Test that first word is always capitalized"""
     assert titlecase("the beginning") == "The Beginning"
     assert titlecase("a start") == "A Start"
+
+
+def test_format_sse_event():
+    """Test formatting a Server-Sent Events message"""
+    assert format_sse_event("estimate", {"trials": 10}) == 'event: estimate\ndata: {"trials":10}\n\n'
@@ -0,0 +1,84 @@
+"""Tests for utility functions - buffered per-thread RNG"""
+
+import threading
+
+import pytest
+
+from app.utils import rng
+from app.utils.rng import MIN_BUFFER, DiceRNG, get_rng, seed_rng, use_rng
+
+
+@pytest.fixture(autouse=True)
+def reseed():
+    """Leave the process with fresh entropy after each test"""
+    yield
+    seed_rng(None)
+
+
+def test_roll_stays_in_range():
+    """Test buffered dice cover every face and nothing else"""
+    source = DiceRNG(seed=1)
+    faces = {source.roll(6) for _ in range(MIN_BUFFER * 10)}
+    assert faces == {1, 2, 3, 4, 5, 6}
+
+
+def test_randint_is_inclusive():
+    """Test randint matches random.randint bounds, including negatives"""
+    source = DiceRNG(seed=2)
+    values = {source.randint(-2, 2) for _ in range(1000)}
+    assert values == {-2, -1, 0, 1, 2}
+
+
+def test_choice_and_random():
+    """Test sequence choice and float draws"""
+    source = DiceRNG(seed=3)
+    assert {source.choice("abc") for _ in range(200)} == {"a", "b", "c"}
+    assert all(0.0 <= source.random() < 1.0 for _ in range(200))
+
+
+def test_choices_draws_in_bulk():
+    """Test choices returns k elements of the sequence"""
+    seed_rng(4)
+    picks = rng.choices(["a", "b", "c"], 300)
+    assert len(picks) == 300
+    assert set(picks) == {"a", "b", "c"}
+    assert rng.choices(["a"], 0) == []
+
+
+def test_seed_rng_is_reproducible():
+    """Test reseeding replays the same rolls on a thread"""
+    seed_rng(42)
+    first = [rng.roll(20) for _ in range(100)]
+    seed_rng(42)
+    assert [rng.roll(20) for _ in range(100)] == first
+
+
+def test_threads_get_independent_generators():
+    """Test each thread draws from its own generator"""
+    sources = []
+
+    def capture():
+        sources.append(get_rng())
+
+    threads = [threading.Thread(target=capture) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(source) for source in sources}) == 4
+    streams = {tuple(source.generator.integers(0, 2**32, size=4)) for source in sources}
+    assert len(streams) == 4
+
+
+def test_use_rng_overrides_only_the_calling_thread():
+    """Test an installed generator serves this thread's draws until the context exits"""
+    fixed = DiceRNG(seed=5)
+    with use_rng(fixed):
+        assert get_rng() is fixed
+        seen = []
+        thread = threading.Thread(target=lambda: seen.append(get_rng()))
+        thread.start()
+        thread.join()
+        assert seen[0] is not fixed
+    assert get_rng() is not fixed
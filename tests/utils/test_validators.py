@@ -65,6 +65,8 @@ def test_validate_dice_notation_valid():
     assert validate_dice_notation("3d10+5") is True
     assert validate_dice_notation("1d20-2") is True
     assert validate_dice_notation("10d12+20") is True
+    assert validate_dice_notation("2d6+1d4+3") is True
+    assert validate_dice_notation("4d6kh3") is True
 
 
 def test_validate_dice_notation_invalid():